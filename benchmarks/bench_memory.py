@@ -0,0 +1,96 @@
+#mēra, cik atmiņas (tracemalloc) aizņem viens kešatmiņas ieraksts un WordData agrākajā un pašreizējā formā
+#palaišana no projekta saknes: python -m benchmarks.bench_memory [--cache-file etymology_cache.json] [--copies N]
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from src.data.etymology_cache import CachedEtymology
+from src.services.etymology_service import WordData
+
+#agrākās datu klases (ar __dict__, sarakstu katram ierakstam un ISO virkni) salīdzināšanai
+@dataclass
+class LegacyCachedEtymology:
+    word: str
+    text: str
+    origin_languages: list[str]
+    correct_answer: str
+    cached_at: str
+    expires_at: Optional[str] = None
+    revision_id: Optional[int] = None
+
+@dataclass
+class LegacyWordData:
+    word: str
+    correct_language: str
+    etymology_text: str
+    origin_languages: List[str]
+
+#nolasa kešatmiņas failu; copies > 1 pavairo ierakstus ar atšķirīgiem vārdiem stabilākam mērījumam
+def load_raw(cache_file: str, copies: int) -> str:
+    with open(cache_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    multiplied = {
+        f"{word}{copy or ''}": {**entry, "word": f"{word}{copy or ''}"}
+        for copy in range(copies)
+        for word, entry in data.items()
+    }
+    return json.dumps(multiplied, ensure_ascii=False)
+
+#izmēra atmiņu, ko aizņem build rezultāts (JSON parsēšanas starprezultāti jau ir atbrīvoti)
+def measure(build: Callable[[str], list], raw: str) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = build(raw)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(objects)
+
+def build_legacy_entries(raw: str) -> list:
+    return [LegacyCachedEtymology(**entry) for entry in json.loads(raw).values()]
+
+def build_entries(raw: str) -> list:
+    return [CachedEtymology(**entry) for entry in json.loads(raw).values()]
+
+def build_legacy_word_data(raw: str) -> list:
+    return [
+        LegacyWordData(entry["word"], "Latin", entry["text"], entry["origin_languages"])
+        for entry in json.loads(raw).values()
+    ]
+
+def build_word_data(raw: str) -> list:
+    return [
+        WordData(entry["word"], "Latin", entry["text"], entry["origin_languages"])
+        for entry in json.loads(raw).values()
+    ]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bytes per cached entry before and after the compact records")
+    parser.add_argument("--cache-file", default="etymology_cache.json")
+    parser.add_argument("--copies", type=int, default=1, help="cik reizes pavairot ierakstus")
+    args = parser.parse_args(argv)
+
+    raw = load_raw(args.cache_file, max(1, args.copies))
+
+    #valodu tabula ir kopīga visam procesam, tāpēc tā tiek aizpildīta pirms mērījuma
+    build_entries(raw)
+
+    rows = [
+        ("CachedEtymology", measure(build_legacy_entries, raw), measure(build_entries, raw)),
+        ("WordData", measure(build_legacy_word_data, raw), measure(build_word_data, raw)),
+    ]
+    print(f"entries: {len(json.loads(raw))}")
+    print(f"{'record':<20}{'before B/entry':>16}{'after B/entry':>16}{'saved':>10}")
+    for name, before, after in rows:
+        print(f"{name:<20}{before:>16.0f}{after:>16.0f}{1 - after / before:>10.0%}")
+
+    #ja jaunā forma nav mazāka, tas ir regress
+    return 0 if all(after < before for _, before, after in rows) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
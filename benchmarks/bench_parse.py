@@ -0,0 +1,83 @@
+#salīdzina straumējošo HTML parseri (html_extractor) ar BeautifulSoup versiju uz saglabātajām lapām
+#un pārbauda, vai wikiteksta ceļš (grupu pieprasījumi) un HTML ceļš vienai lapas versijai dod vienādus datus
+#palaišana no projekta saknes: python -m benchmarks.bench_parse [--repeat N]
+
+import argparse
+import pathlib
+import sys
+import time
+
+from src.data.scrape2 import parse_etymology_html, parse_etymology_html_bs4, parse_etymology_wikitext
+
+FIXTURES_DIR = pathlib.Path(__file__).resolve().parent / "fixtures" / "html"
+WIKITEXT_DIR = FIXTURES_DIR.parent / "wikitext"
+
+#lapas, kuru HTML un wikiteksts ir no vienas versijas (pārējie pāri ir no dažādām versijām, tāpēc atšķiras)
+SAME_REVISION_PAGES = ["chamber"]
+
+#cik svešvalodu sadaļu pievienot, lai iegūtu tik lielu lapu kā "set" vai "run"
+HUGE_PAGE_LANGUAGES = 300
+
+#ielādē visas HTML lapas no fixtures direktorijas
+def load_fixtures() -> dict:
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted(FIXTURES_DIR.glob("*.html"))}
+
+#izveido ļoti lielu lapu: angļu sadaļa, kam seko daudzas citu valodu sadaļas
+def build_huge_page(base_html: str, languages: int = HUGE_PAGE_LANGUAGES) -> str:
+    body, closing = base_html.rsplit("</div>", 1)
+    foreign = []
+    for i in range(languages):
+        foreign.append(
+            f'<hr>\n<div class="mw-heading mw-heading2"><h2 id="Language_{i}">Language {i}</h2></div>\n'
+            f'<div class="mw-heading mw-heading3"><h3 id="Etymology_{i + 2}">Etymology</h3></div>\n'
+            f'<p>From <span class="etyl"><a href="/wiki/L{i}" title="L{i}">Proto-Language {i}</a></span> '
+            f'<i class="Latn mention">*word{i}</i>.</p>\n'
+            f'<div class="mw-heading mw-heading3"><h3 id="Noun_{i + 2}">Noun</h3></div>\n'
+            + "".join(f'<ol><li>Sense {j} of <a href="/wiki/word{j}" title="word{j}">word {j}</a>.</li></ol>\n' for j in range(20))
+        )
+    return body + "".join(foreign) + "</div>" + closing
+
+#izmēra, cik lapu sekundē parseris apstrādā
+def measure(parse, word: str, html: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse(word, html)
+    elapsed = time.perf_counter() - started
+    return repeat / elapsed if elapsed else float("inf")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Etymology HTML parser benchmark")
+    parser.add_argument("--repeat", type=int, default=200, help="parsēšanas reizes katrai lapai")
+    args = parser.parse_args(argv)
+
+    pages = load_fixtures()
+    pages["huge"] = build_huge_page(pages["zoology"])
+
+    #vispirms pārbauda, vai abi parseri atgriež vienādus datus
+    mismatches = 0
+    for name, html in pages.items():
+        streamed = parse_etymology_html(name, html)
+        reference = parse_etymology_html_bs4(name, html)
+        if (streamed.status, streamed.data) != (reference.status, reference.data):
+            mismatches += 1
+            print(f"MISMATCH {name}:\n  stream: {streamed}\n  bs4:    {reference}")
+
+    #kešatmiņā saglabātie dati nedrīkst būt atkarīgi no tā, kurš ceļš vārdu ielādēja
+    for name in SAME_REVISION_PAGES:
+        from_html = parse_etymology_html(name, pages[name])
+        from_wikitext = parse_etymology_wikitext(name, (WIKITEXT_DIR / f"{name}.wikitext").read_text(encoding="utf-8"))
+        if (from_html.status, from_html.data) != (from_wikitext.status, from_wikitext.data):
+            mismatches += 1
+            print(f"MISMATCH {name} (html/wikitext):\n  html:     {from_html}\n  wikitext: {from_wikitext}")
+
+    print(f"{'page':<24}{'bytes':>10}{'bs4 pages/s':>14}{'stream pages/s':>16}{'speedup':>10}")
+    for name, html in pages.items():
+        repeat = max(1, args.repeat // 20) if name == "huge" else args.repeat
+        bs4_rate = measure(parse_etymology_html_bs4, name, html, repeat)
+        stream_rate = measure(parse_etymology_html, name, html, repeat)
+        print(f"{name:<24}{len(html.encode('utf-8')):>10}{bs4_rate:>14.1f}{stream_rate:>16.1f}{stream_rate / bs4_rate:>9.1f}x")
+
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#mēra laiku līdz pirmā loga parādīšanai un pārbauda, ka startā netiek ielādēti tīkla un HTML parsēšanas moduļi
+#(pārbaude notiek pēc tam, kad logs ir parādīts un vārdu krājums aizpildīts no pilnas kešatmiņas)
+#katrs mērījums ir atsevišķs process ar -X importtime, tāpēc tajā ir arī interpretatora starts un moduļu importēšana
+#palaišana no projekta saknes: python -m benchmarks.bench_startup [--runs N] [--budget-ms MS]
+#(bez displeja: QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_startup)
+#atgriež 1, ja mediāna pārsniedz budžetu vai startā tika ielādēts kāds no HEAVY_MODULES - to var izmantot kā regresijas testu
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from src.data.etymology_cache import EtymologyCache
+from src.services.word_pool import DEFAULT_POOL_SIZE
+
+#moduļi, kuriem jāielādējas tikai pie pirmās kešatmiņas kļūdas vai pirmās ekrāna atvēršanas
+HEAVY_MODULES = (
+    "requests",
+    "bs4",
+    "src.data.scrape2",
+    "src.widgets.game_widget.game_widget",
+    "src.widgets.end_widget.end_widget",
+    "src.widgets.theme_widget.widget_theme_dialog",
+)
+
+#noklusētais laiks līdz pirmajam logam milisekundēs
+DEFAULT_BUDGET_MS = 1500
+
+#cik ilgi (sekundēs) gaidīt, kamēr vārdu krājums tiek aizpildīts no kešatmiņas
+POOL_TIMEOUT = 30
+
+#palaiž to pašu, ko main.main(), līdz logs ir parādīts, sagaida vārdu krājumu un izdrukā rezultātu JSON formātā
+#(serviss izmanto pilnu kešatmiņu, tāpēc neviens vārds nedrīkst izraisīt tīkla moduļu ielādi)
+CHILD = """
+import json, sys, time
+import main
+from src.services import etymology_service
+from src.services.word_pool import DEFAULT_POOL_SIZE
+etymology_service._shared_service = etymology_service.EtymologyService(cache_file={cache_file!r})
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+main.apply_saved_theme()
+window = main.MainWindow()
+window.show()
+app.processEvents()
+shown = time.time()
+deadline = shown + {pool_timeout!r}
+while window.word_pool.ready_count() < DEFAULT_POOL_SIZE and time.time() < deadline:
+    app.processEvents()
+    time.sleep(0.01)
+pool = window.word_pool.ready_count()
+window.word_pool.cancel()
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"shown": shown, "heavy": heavy, "pool": pool}}))
+"""
+
+#izveido kešatmiņu, kurā ir visi vārdnīcas vārdi
+def write_warm_cache(cache_file: str, word_dict_file: str) -> None:
+    with open(word_dict_file, "r", encoding="utf-8") as f:
+        word_dict = json.load(f)
+    cache = EtymologyCache(cache_file)
+    with cache.batch():
+        for word, correct_answer in word_dict.items():
+            cache.put(word, f"From Latin {word}.", ["Latin"], correct_answer)
+    cache.close()
+
+#viens mērījums; atgriež (ms līdz logam, startā ielādētie smagie moduļi, krājuma izmērs, importtime rindas)
+def run_once(root: str, cache_file: str) -> Tuple[float, List[str], int, List[Tuple[int, int, str]]]:
+    env = {**os.environ, "PYTHONPATH": root}
+    launched = time.time()
+    child = CHILD.format(heavy=HEAVY_MODULES, cache_file=cache_file, pool_timeout=POOL_TIMEOUT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", child],
+        cwd=root, env=env, capture_output=True, text=True, check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return (report["shown"] - launched) * 1000, report["heavy"], report["pool"], parse_importtime(result.stderr)
+
+#nolasa -X importtime izvadi: (self µs, kumulatīvi µs, modulis)
+def parse_importtime(stderr: str) -> List[Tuple[int, int, str]]:
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time to first window and modules imported at startup")
+    parser.add_argument("--runs", type=int, default=5, help="mērījumu (procesu) skaits")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="pieļaujamā mediāna milisekundēs")
+    parser.add_argument("--top", type=int, default=10, help="cik lēnākos importus parādīt")
+    args = parser.parse_args(argv)
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings: List[float] = []
+    heavy: Dict[str, int] = {}
+    short_pools: List[int] = []
+    imports: List[Tuple[int, int, str]] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "etymology_cache.json")
+        write_warm_cache(cache_file, os.path.join(root, "src", "data", "data", "word_dict.json"))
+        for _ in range(max(1, args.runs)):
+            elapsed, loaded, pool, imports = run_once(root, cache_file)
+            timings.append(elapsed)
+            for name in loaded:
+                heavy[name] = heavy.get(name, 0) + 1
+            if pool < DEFAULT_POOL_SIZE:
+                short_pools.append(pool)
+
+    #lēnākie importi pēdējā mērījumā (pēc paša moduļa laika, bez apakšmoduļiem)
+    print(f"{'module':<48}{'self ms':>10}{'cumulative ms':>16}")
+    for self_us, cumulative_us, name in sorted(imports, reverse=True)[:args.top]:
+        print(f"{name:<48}{self_us / 1000:>10.1f}{cumulative_us / 1000:>16.1f}")
+
+    median = statistics.median(timings)
+    print()
+    print(f"time to first window: median {median:.0f} ms, min {min(timings):.0f} ms, max {max(timings):.0f} ms "
+          f"({len(timings)} runs, budget {args.budget_ms:.0f} ms)")
+    for name, count in heavy.items():
+        print(f"FAIL: {name} imported at startup ({count}/{len(timings)} runs)")
+    if short_pools:
+        print(f"FAIL: word pool not filled from the cache within {POOL_TIMEOUT} s ({short_pools} words)")
+    if median > args.budget_ms:
+        print(f"FAIL: median {median:.0f} ms exceeds the budget")
+    return 1 if heavy or short_pools or median > args.budget_ms else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#salīdzina ekrānu izveidi ar uic.loadUi (XML parsēšana katrā reizē) un ar iepriekš ģenerētajām UI klasēm
+#palaišana no projekta saknes: python -m benchmarks.bench_ui [--repeat N]
+#(bez displeja: QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_ui)
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+
+from PyQt6 import QtWidgets, uic
+from PyQt6.QtWidgets import QApplication
+
+from src.helpers import ui_loader
+
+#.ui faila saknes logrīka klase (QGroupBox, QMainWindow, QDialog)
+def root_widget_class(ui_path) -> type:
+    root = ElementTree.parse(ui_path).getroot().find("widget")
+    return getattr(QtWidgets, root.get("class"))
+
+#izmēra vidējo ekrāna izveides laiku milisekundēs
+def measure(build, widget_class: type, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        widget = widget_class()
+        build(widget)
+        widget.deleteLater()
+    QApplication.processEvents()
+    return (time.perf_counter() - started) / repeat * 1000
+
+#izmēra spēles ekrānu pārejas: katrs ekrāns tiek izveidots no jauna, kā MainWindow to dara navigācijas laikā
+def measure_transitions(repeat: int) -> float:
+    from src.widgets.start_widget.start_widget import StartWidget
+    from src.widgets.end_widget.end_widget import EndWidget
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        StartWidget().deleteLater()
+        EndWidget(3, 5).deleteLater()
+    QApplication.processEvents()
+    return (time.perf_counter() - started) / repeat * 1000
+
+#tās pašas pārejas ar pastāvīgiem ekrāniem, kas tiek tikai atiestatīti (reset)
+def measure_resets(repeat: int) -> float:
+    from src.widgets.start_widget.start_widget import StartWidget
+    from src.widgets.end_widget.end_widget import EndWidget
+
+    start_widget = StartWidget()
+    end_widget = EndWidget()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        start_widget.reset({"score": 3, "max_score": 5})
+        end_widget.reset(3, 5)
+    QApplication.processEvents()
+    return (time.perf_counter() - started) / repeat * 1000
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Runtime uic.loadUi vs generated UI classes")
+    parser.add_argument("--repeat", type=int, default=50, help="izveides reizes katram ekrānam")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    ui_loader.build_ui()
+    ui_files = sorted(ui_loader.WIDGETS_DIR.glob("*/*.ui"))
+
+    print(f"{'screen':<28}{'loadUi ms':>12}{'generated ms':>14}{'speedup':>10}")
+    for ui_path in ui_files:
+        widget_class = root_widget_class(ui_path)
+        runtime = measure(lambda widget: uic.loadUi(str(ui_path), widget), widget_class, args.repeat)
+        generated = measure(lambda widget: ui_loader.load_ui(widget, ui_path), widget_class, args.repeat)
+        print(f"{ui_path.name:<28}{runtime:>12.2f}{generated:>14.2f}{runtime / generated:>9.1f}x")
+
+    #pārejas ar ģenerētajām klasēm un ar piespiedu atkāpšanos uz loadUi
+    generated = measure_transitions(args.repeat)
+    reset = measure_resets(args.repeat)
+    for ui_path in ui_files:
+        ui_loader._ui_classes[ui_path.resolve()] = None
+    runtime = measure_transitions(args.repeat)
+    print(f"{'start + end transition':<28}{runtime:>12.2f}{generated:>14.2f}{runtime / generated:>9.1f}x")
+    print(f"{'start + end reset':<28}{'':>12}{reset:>14.2f}{generated / reset:>9.1f}x (vs generated)")
+
+    del app
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#pārbauda, vai EtymologyService.get_many_word_data tiešām izpilda pieprasījumus paralēli:
+#stub serveris katram pieprasījumam gaida L sekundes, un N grupu ielādei ar concurrency C jāaizņem ~L * ceil(N / C), nevis N * L
+#(viena grupa ir viens action=query pieprasījums ar līdz QUERY_BATCH_SIZE vārdiem; parsēšanas un kešatmiņas laiks,
+#kas izmērīts bez aiztures, tiek pieskaitīts gaidītajam laikam)
+#palaišana no projekta saknes: python -m benchmarks.check_async [--latency-ms 200] [--batches 16] [--concurrency 1,4,8]
+#atgriež 1, ja kāds mērījums ir ievērojami lēnāks par gaidīto
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.stub_server import StubWikiServer
+from src.data import scrape2
+from src.data.etymology_types import QUERY_BATCH_SIZE
+from src.services.etymology_service import EtymologyService
+
+#lapas, ar kurām stub serveris atbild vārdnīcas vārdiem
+DEFAULT_PAGES = ["corpus", "multiple_etymologies", "zoology"]
+
+#pieļaujamā novirze no gaidītā laika: daļa no L plus nemainīga rezerve sekundēs
+TOLERANCE_LATENCIES = 0.5
+TOLERANCE_SECONDS = 0.15
+
+#vārdnīca ar words_count izdomātiem vārdiem (stub serveris katram atgriež kādu no DEFAULT_PAGES)
+def write_word_dict(path: str, words_count: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({f"word{i}": "ABCDE"[i % 5] for i in range(words_count)}, f)
+
+#ielādē visus vārdus ar tukšu kešatmiņu; atgriež ilgumu sekundēs
+def measure(tmp_dir: str, word_dict_file: str, concurrency: int, name: str) -> float:
+    service = EtymologyService(word_dict_file, os.path.join(tmp_dir, f"cache_{name}.json"))
+    words = service.get_available_words()
+    scrape2.breaker.reset()
+    started = time.perf_counter()
+    results = asyncio.run(service.get_many_word_data(words, concurrency=concurrency))
+    elapsed = time.perf_counter() - started
+    service.cache.close()
+    loaded = sum(1 for data in results if data)
+    if loaded != len(words):
+        raise RuntimeError(f"only {loaded}/{len(words)} words loaded")
+    return elapsed
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check that get_many_word_data overlaps its requests")
+    parser.add_argument("--latency-ms", type=float, default=200, help="stub servera aizture katram pieprasījumam")
+    parser.add_argument("--batches", type=int, default=16, help="cik action=query grupu ielādēt")
+    parser.add_argument("--concurrency", default="1,4,8", help="pārbaudāmās concurrency vērtības")
+    args = parser.parse_args(argv)
+
+    latency = args.latency_ms / 1000
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            StubWikiServer(default_pages=DEFAULT_PAGES, latency=latency) as server:
+        word_dict_file = os.path.join(tmp_dir, "word_dict.json")
+        write_word_dict(word_dict_file, args.batches * QUERY_BATCH_SIZE)
+        api_url = scrape2.API_URL
+        scrape2.API_URL = server.url
+        try:
+            server.latency = 0
+            #pirmais mērījums ietver arī vienreizēju iesildīšanu (HTTP sesija u.c.), tāpēc tiek ņemts mazākais no diviem
+            processing = min(measure(tmp_dir, word_dict_file, args.batches, f"processing_{attempt}") for attempt in range(2))
+            server.latency = latency
+            print(f"{args.batches} batches x {QUERY_BATCH_SIZE} words, stub latency {args.latency_ms:.0f} ms, "
+                  f"processing without latency {processing * 1000:.0f} ms")
+            print(f"{'concurrency':<14}{'elapsed ms':>12}{'expected ms':>13}{'serial ms':>11}")
+            for concurrency in (int(value) for value in args.concurrency.split(",")):
+                elapsed = measure(tmp_dir, word_dict_file, concurrency, str(concurrency))
+                expected = latency * math.ceil(args.batches / concurrency) + processing
+                limit = expected + TOLERANCE_LATENCIES * latency + TOLERANCE_SECONDS
+                mark = ""
+                if elapsed > limit:
+                    failures += 1
+                    mark = "  TOO SLOW"
+                print(f"{concurrency:<14}{elapsed * 1000:>12.0f}{expected * 1000:>13.0f}"
+                      f"{latency * args.batches * 1000 + processing * 1000:>11.0f}{mark}")
+        finally:
+            scrape2.API_URL = api_url
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#kešatmiņas drošības pārbaudes bez tīkla: vai ieraksti pārdzīvo neveiksmīgu kompaktēšanu, restartu, copy un pickle
+#palaišana no projekta saknes: python -m benchmarks.check_cache
+#atgriež 1, ja kāda pārbaude neizdodas
+
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import traceback
+from typing import Callable, List
+
+from src.data.etymology_cache import COMPACTING_SUFFIX, CachedEtymology, EtymologyCache
+from src.data.mmap_cache import MmapEtymologyCache
+from src.services.etymology_service import WordData
+
+#cik ierakstu ierakstīt katrā pārbaudē
+ENTRIES = 25
+
+def _fill(cache: EtymologyCache, count: int = ENTRIES) -> None:
+    with cache.batch():
+        for i in range(count):
+            cache.put(f"word{i}", f"From Latin word{i}.", ["Latin"], "B")
+
+#neveiksmīga momentuzņēmuma rakstīšana nedrīkst izdzēst žurnālu; restartā ieraksti tiek atjaunoti no tā
+def check_failed_compaction(cache_class: Callable[[str], EtymologyCache], suffix: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache" + suffix)
+        cache = cache_class(cache_file)
+        _fill(cache)
+
+        #pagaidu faila vietā direktorija - momentuzņēmumu nevar ierakstīt
+        tmp_path = cache_file + ".tmp"
+        os.mkdir(tmp_path)
+        cache.compact()
+        cache.close()
+        assert os.path.exists(cache.journal_file + COMPACTING_SUFFIX), "journal deleted after failed snapshot write"
+
+        restarted = cache_class(cache_file)
+        restarted.flush()
+        assert restarted.size() == ENTRIES, f"expected {ENTRIES} entries after restart, got {restarted.size()}"
+
+        #kad rakstīšana atkal iespējama, kompaktēšana pabeidz darbu un žurnāls vairs nav vajadzīgs
+        os.rmdir(tmp_path)
+        restarted.compact()
+        restarted.close()
+        assert not os.path.exists(restarted.journal_file + COMPACTING_SUFFIX), "journal kept after successful compaction"
+        assert cache_class(cache_file).size() == ENTRIES, "entries lost after successful compaction"
+
+#pēc kompaktēšanas mmap kešatmiņa atmiņā patur tikai ierakstus, kas nav indeksa failā
+def check_mmap_releases_compacted() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = MmapEtymologyCache(os.path.join(tmp_dir, "cache.idx"))
+        _fill(cache)
+        cache.compact()
+        assert not cache.cache, f"{len(cache.cache)} compacted entries still held in memory"
+        assert cache.size() == ENTRIES, f"expected {ENTRIES} entries, got {cache.size()}"
+        assert cache.get("word7").text == "From Latin word7.", "compacted entry not readable from the index"
+
+        #jauni ieraksti pēc kompaktēšanas paliek atmiņā līdz nākamajai
+        cache.put("extra", "From French extra.", ["French"], "D")
+        assert list(cache.cache) == ["extra"], f"unexpected in-memory entries: {list(cache.cache)}"
+        cache.compact()
+        assert not cache.cache and cache.size() == ENTRIES + 1, "second compaction did not release entries"
+        cache.close()
+
+#ieraksti pēc copy un pickle ir vienādi ar oriģinālu, arī citā procesā ar citādiem valodu numuriem
+def check_records_copy_and_pickle() -> None:
+    records = [
+        CachedEtymology("corpus", "From Latin corpus.", ["Latin", "Old French"], "B",
+                        "2024-01-02T03:04:05.123456", "2024-02-02T03:04:05", 42),
+        WordData("corpus", "Latin", "From Latin corpus.", ["Latin", "Old French"]),
+    ]
+    for record in records:
+        for clone in (copy.copy(record), copy.deepcopy(record), pickle.loads(pickle.dumps(record))):
+            assert clone == record, f"{type(record).__name__} changed after copy/pickle: {clone!r}"
+
+    #jaunā procesā valodas vispirms tiek reģistrētas citā secībā, tāpēc numuri atšķiras
+    script = (
+        "import pickle, sys\n"
+        "from src.data.etymology_cache import intern_languages\n"
+        "intern_languages(['Greek', 'Norse', 'Old French', 'Latin'])\n"
+        "records = pickle.loads(sys.stdin.buffer.read())\n"
+        "print([record.origin_languages for record in records])\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], input=pickle.dumps(records), capture_output=True,
+                            check=True, env={**os.environ, "PYTHONPATH": os.getcwd()}).stdout.decode()
+    expected = str([record.origin_languages for record in records])
+    assert output.strip() == expected, f"languages changed in another process: {output.strip()} != {expected}"
+
+CHECKS = [
+    ("json: failed compaction keeps journal", lambda: check_failed_compaction(EtymologyCache, ".json")),
+    ("mmap: failed compaction keeps journal", lambda: check_failed_compaction(MmapEtymologyCache, ".idx")),
+    ("mmap: compacted entries leave memory", check_mmap_releases_compacted),
+    ("records: copy and pickle round-trip", check_records_copy_and_pickle),
+]
+
+def main(argv=None) -> int:
+    failures: List[str] = []
+    for name, check in CHECKS:
+        try:
+            check()
+        except Exception:
+            failures.append(name)
+            print(f"FAIL  {name}")
+            traceback.print_exc()
+        else:
+            print(f"ok    {name}")
+    print(f"\n{len(CHECKS) - len(failures)}/{len(CHECKS)} checks passed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#deterministisks slodzes tests vārdu ielādei bez tīkla: vispirms ieraksta atbildes (no fixtures vai dzīvā Wiktionary),
+#tad vairāki paralēli klienti ielādē vārdus no ierakstiem ar simulētu aizturi un kļūdu biežumu;
+#ar vienu un to pašu --seed aizture un kļūdas atkārtojas, tāpēc atkārtotu mēģinājumu un pārtraucēja uzvedību var salīdzināt
+#palaišana no projekta saknes:
+#  python -m benchmarks.load_test [--clients 8] [--words 200] [--latency-ms 50] [--error-rate 0.1] [--seed 1] [--via-http]
+#  python -m benchmarks.load_test --recordings DIR --record-live   (vienreiz ieraksta dzīvās atbildes, vajadzīgs tīkls)
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from benchmarks.stub_server import FixtureTransport
+from src.data import scrape2
+from src.data.stub_server import ApiServer
+from src.data.transport import HttpTransport, RecordingStore, RecordingTransport, ReplayTransport
+from src.helpers import metrics
+
+#lapas, ar kurām fixtures atbild vārdnīcas vārdiem
+DEFAULT_PAGES = ["corpus", "multiple_etymologies", "zoology"]
+
+#izvēlas count vārdus no vārdnīcas (ar seed - vienmēr tos pašus)
+def pick_words(count: int, seed: int) -> List[str]:
+    with open(scrape2.WORDS_FILE, "r", encoding="utf-8") as f:
+        words = sorted(json.load(f))
+    return random.Random(seed).sample(words, min(count, len(words)))
+
+#ieraksta atbildes visiem vārdiem ar tādiem pašiem grupu pieprasījumiem, kādus izmanto spēle
+def record(store: RecordingStore, words: List[str], live: bool) -> None:
+    inner = HttpTransport(scrape2.HEADERS, scrape2.HTTP_POOL_SIZE) if live else FixtureTransport(default_pages=DEFAULT_PAGES)
+    previous = scrape2.set_transport(RecordingTransport(inner, store))
+    try:
+        scrape2.get_etymology_info_batch(words)
+    finally:
+        scrape2.set_transport(previous)
+        inner.close()
+
+#sadala vārdus klientu pieprasījumos pa chunk vārdiem un izpilda tos paralēli
+def run_clients(words: List[str], clients: int, chunk: int) -> Counter:
+    chunks = [words[i:i + chunk] for i in range(0, len(words), chunk)]
+    statuses: Counter = Counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for results in pool.map(scrape2.get_etymology_info_batch, chunks):
+            statuses.update(response.status.name.lower() for response in results.values())
+    return statuses
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Deterministic offline load test for word fetching")
+    parser.add_argument("--recordings", help="ierakstu direktorija (noklusējums - pagaidu direktorija)")
+    parser.add_argument("--record-live", action="store_true", help="ierakstīt no Wiktionary, nevis no fixtures")
+    parser.add_argument("--words", type=int, default=200, help="cik vārdus ielādēt")
+    parser.add_argument("--clients", type=int, default=8, help="paralēlo klientu skaits")
+    parser.add_argument("--chunk", type=int, default=10, help="vārdi vienā klienta pieprasījumā")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--via-http", action="store_true", help="iet caur lokālo API serveri, nevis tieši caur transportu")
+    args = parser.parse_args(argv)
+
+    words = pick_words(args.words, args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = RecordingStore(args.recordings or tmp_dir)
+        started = time.perf_counter()
+        record(store, words, args.record_live)
+        print(f"Recorded {len(words)} words in {time.perf_counter() - started:.2f}s to {store.directory}")
+
+        replay = ReplayTransport(store, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                                 error_rate=args.error_rate, seed=args.seed)
+        server = ApiServer(replay).start() if args.via_http else None
+        api_url = scrape2.API_URL
+        previous = scrape2.set_transport(None if server else replay)
+        if server:
+            scrape2.API_URL = server.url
+        scrape2.breaker.reset()
+        metrics.registry.reset()
+        try:
+            started = time.perf_counter()
+            statuses = run_clients(words, args.clients, args.chunk)
+            elapsed = time.perf_counter() - started
+        finally:
+            scrape2.set_transport(previous)
+            scrape2.API_URL = api_url
+            if server:
+                server.stop()
+
+    snapshot = metrics.snapshot()
+    print(f"\n{len(words)} words, {args.clients} clients, latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, "
+          f"error rate {args.error_rate:.0%}, seed {args.seed}{' (via HTTP)' if args.via_http else ''}")
+    print(f"  elapsed            {elapsed:>10.2f} s")
+    print(f"  words/s            {len(words) / elapsed:>10.1f}")
+    for status, count in sorted(statuses.items()):
+        print(f"  words {status:<12} {count:>10}")
+    for name, count in snapshot["counters"].items():
+        if name.startswith("http."):
+            print(f"  {name:<18} {count:>10}")
+    for name in ("http.request", "fetch.batch"):
+        timing = snapshot["timings"].get(name)
+        if timing:
+            print(f"  {name:<18} p50 {timing['p50_ms']:.1f} ms, p95 {timing['p95_ms']:.1f} ms, max {timing['max_ms']:.1f} ms")
+    print(f"  breaker            {scrape2.breaker.state:>10}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
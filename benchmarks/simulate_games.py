@@ -0,0 +1,128 @@
+#bezgalvas spēļu simulators datu slāņa kapacitātes testiem: simulēti spēlētāji paralēli izspēlē daudz spēļu
+#ar GameSession un īsto EtymologyService un kešatmiņu; katrai spēlei vārdu krājums tiek sagatavots tāpat kā
+#WordPoolPrefetcher to dara (get_random_words + get_words_data_sync)
+#kešatmiņas kļūdas pēc noklusējuma apkalpo saglabātās lapas (benchmarks/fixtures), --live - īstais transports
+#(to var pārslēgt uz replay ar ROOTROULETTE_TRANSPORT)
+#palaišana no projekta saknes:
+#  python -m benchmarks.simulate_games [--games 1000] [--players 4] [--rounds 10] [--accuracy 0.6] [--cold] [--seed 1]
+
+import argparse
+import itertools
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from benchmarks.stub_server import FixtureTransport
+from src.data import scrape2
+from src.helpers import metrics
+from src.services.etymology_service import EtymologyService
+from src.services.game_session import GameSession
+
+#lapas, ar kurām fixtures atbild vārdnīcas vārdiem
+DEFAULT_PAGES = ["corpus", "multiple_etymologies", "zoology"]
+
+#procentile no sakārtota saraksta (tuvākā ranga metode)
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+#simulēts spēlētājs: ar varbūtību accuracy izvēlas pareizo valodu, citādi - kādu no nepareizajām opcijām
+class SimulatedPlayer:
+    def __init__(self, accuracy: float, rng: random.Random):
+        self.accuracy = accuracy
+        self.rng = rng
+
+    def choose(self, session: GameSession) -> str:
+        correct = session.current_word.correct_language
+        wrong = [language for language in session.options if language != correct]
+        if not wrong or self.rng.random() < self.accuracy:
+            return correct
+        return self.rng.choice(wrong)
+
+#izspēlē vienu spēli; atgriež (krājuma sagatavošanas laiks ms, punkti, nospēlētie raundi)
+def play_game(service: EtymologyService, player: SimulatedPlayer, rounds: int) -> Tuple[float, int, int]:
+    started = time.perf_counter()
+    pool = service.get_words_data_sync(service.get_random_words(rounds))
+    pool_ms = (time.perf_counter() - started) * 1000
+
+    session = GameSession(rounds, [data for data in pool if data], service=service)
+    session.finish_loading()
+    while session.next_round() is not None:
+        session.guess(player.choose(session))
+    result = session.result()
+    return pool_ms, result.score, result.total_rounds
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless game simulator for capacity-testing the data layer")
+    parser.add_argument("--games", type=int, default=1000, help="cik spēles izspēlēt")
+    parser.add_argument("--players", type=int, default=4, help="cik spēlētāju spēlē paralēli")
+    parser.add_argument("--rounds", type=int, default=10, help="raundi vienā spēlē")
+    parser.add_argument("--accuracy", type=float, default=0.6, help="pareizo atbilžu varbūtība")
+    parser.add_argument("--cache-file", default="etymology_cache.json", help="kešatmiņa, kuras kopiju izmantot")
+    parser.add_argument("--cold", action="store_true", help="sākt ar tukšu kešatmiņu")
+    parser.add_argument("--latency-ms", type=float, default=20, help="fixtures atbilžu aizture kešatmiņas kļūdām")
+    parser.add_argument("--live", action="store_true", help="kešatmiņas kļūdām izmantot īsto transportu")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    previous = None if args.live else scrape2.set_transport(
+        FixtureTransport(default_pages=DEFAULT_PAGES, latency=args.latency_ms / 1000))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        #simulācija strādā ar kešatmiņas kopiju, lai nemainītu spēles kešatmiņu
+        cache_file = os.path.join(tmp_dir, os.path.basename(args.cache_file))
+        if not args.cold and os.path.exists(args.cache_file):
+            shutil.copyfile(args.cache_file, cache_file)
+        service = EtymologyService(scrape2.WORDS_FILE, cache_file, seed=args.seed)
+        cached, total = service.get_cache_info()
+        print(f"{args.games} games x {args.rounds} rounds, {args.players} players, "
+              f"cache {cached}/{total} words{' (cold)' if args.cold else ''}")
+
+        #katram pavedienam savs spēlētājs ar atsevišķu nejaušības avotu
+        players = threading.local()
+        player_seeds = itertools.count(args.seed * 1000)
+        seeds_lock = threading.Lock()
+
+        def run(_: int) -> Tuple[float, int, int]:
+            if not hasattr(players, "player"):
+                with seeds_lock:
+                    players.player = SimulatedPlayer(args.accuracy, random.Random(next(player_seeds)))
+            return play_game(service, players.player, args.rounds)
+
+        metrics.registry.reset()
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=args.players) as pool:
+                games = list(pool.map(run, range(args.games)))
+        finally:
+            elapsed = time.perf_counter() - started
+            if not args.live:
+                scrape2.set_transport(previous)
+            service.cache.close()
+
+    counters = metrics.snapshot()["counters"]
+    hits, misses = counters.get("cache.hit", 0), counters.get("cache.miss", 0)
+    pool_times = sorted(pool_ms for pool_ms, _, _ in games)
+    played_rounds = sum(rounds for _, _, rounds in games)
+    scores = [score / rounds for _, score, rounds in games if rounds]
+
+    print(f"  elapsed            {elapsed:>10.2f} s")
+    print(f"  games/s            {len(games) / elapsed:>10.1f}")
+    print(f"  rounds/s           {played_rounds / elapsed:>10.1f}")
+    print(f"  pool build         p50 {percentile(pool_times, 0.50):.2f} ms, p95 {percentile(pool_times, 0.95):.2f} ms, "
+          f"p99 {percentile(pool_times, 0.99):.2f} ms, max {pool_times[-1] if pool_times else 0:.2f} ms")
+    print(f"  cache hit ratio    {hits / (hits + misses) if hits + misses else 0:>10.1%}  ({hits} hits, {misses} misses)")
+    print(f"  http requests      {sum(count for name, count in counters.items() if name.startswith('http.status.')):>10}")
+    print(f"  short games        {sum(1 for _, _, rounds in games if rounds < args.rounds):>10}")
+    print(f"  mean accuracy      {statistics.mean(scores) if scores else 0:>10.1%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
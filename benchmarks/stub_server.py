@@ -0,0 +1,96 @@
+#lokāls MediaWiki API aizstājējs etalonuzdevumiem: atbild uz tiem pašiem pieprasījumiem kā Wiktionary
+#(action=query prop=revisions|info un action=parse prop=text) ar saglabātajām lapām no fixtures
+#un pirms katras atbildes gaida latency sekundes, lai varētu mērīt ielādi ar kontrolētu tīkla aizturi
+#FixtureTransport var izmantot arī tieši (scrape2.set_transport) vai ierakstīšanai ar RecordingTransport
+
+import json
+import pathlib
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from src.data.stub_server import ApiServer
+from src.data.transport import Transport, TransportResponse
+
+FIXTURES_DIR = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+#ielādē saglabātās lapas: {nosaukums: saturs}
+def load_pages(kind: str = "wikitext") -> Dict[str, str]:
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted((FIXTURES_DIR / kind).glob(f"*.{kind}"))}
+
+class FixtureTransport(Transport):
+    """Atbild uz API pieprasījumiem ar saglabātajām lapām, negaidot tīklu (tikai latency).
+
+    Lapas, kuru nav wikitexts, tiek aizstātas ar kādu no default_pages (izvēle ir atkarīga tikai no virsraksta),
+    tāpēc jebkurš vārdnīcas vārds atgriež reālistisku lapu.
+    """
+
+    def __init__(self, wikitexts: Optional[Dict[str, str]] = None, html: Optional[Dict[str, str]] = None,
+                 default_pages: Optional[List[str]] = None, latency: float = 0.0):
+        self.wikitexts = wikitexts if wikitexts is not None else load_pages("wikitext")
+        self.html = html if html is not None else load_pages("html")
+        self.default_pages = default_pages or []
+        self.latency = latency
+
+    #atrod lapas saturu; virsrakstiem bez saglabātas lapas - kādu no default_pages
+    def page(self, title: str, pages: Dict[str, str]) -> Optional[str]:
+        if title in pages:
+            return pages[title]
+        if not self.default_pages:
+            return None
+        name = self.default_pages[zlib.crc32(title.encode("utf-8")) % len(self.default_pages)]
+        return pages.get(name)
+
+    #lapas versijas ID ir atkarīgs no satura, tāpēc nemainīgām lapām tas nemainās
+    @staticmethod
+    def revision_id(text: str) -> int:
+        return zlib.crc32(text.encode("utf-8"))
+
+    def respond(self, params: Dict[str, str]) -> dict:
+        action = params.get("action")
+        if action == "query":
+            pages = []
+            for title in params.get("titles", "").split("|"):
+                text = self.page(title, self.wikitexts)
+                if text is None:
+                    pages.append({"title": title, "missing": True})
+                elif params.get("prop") == "info":
+                    pages.append({"title": title, "lastrevid": self.revision_id(text)})
+                else:
+                    pages.append({"title": title, "revisions": [{
+                        "revid": self.revision_id(text),
+                        "slots": {"main": {"content": text}},
+                    }]})
+            return {"batchcomplete": True, "query": {"pages": pages}}
+
+        if action == "parse" and params.get("prop") == "text":
+            title = params.get("page", "")
+            text = self.page(title, self.html)
+            if text is None:
+                return {"error": {"code": "missingtitle", "info": "The page you specified doesn't exist."}}
+            return {"parse": {"title": title, "revid": self.revision_id(text), "text": {"*": text}}}
+
+        return {"error": {"code": "badvalue", "info": f"Unsupported request: {params}"}}
+
+    def get(self, url: str, params: dict, timeout: float) -> TransportResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        return TransportResponse(200, json.dumps(self.respond(params)).encode("utf-8"), url)
+
+class StubWikiServer(ApiServer):
+    """HTTP serveris fona pavedienā ar FixtureTransport; url ir jāiestata kā scrape2.API_URL (vai ROOTROULETTE_API_URL)."""
+
+    def __init__(self, wikitexts: Optional[Dict[str, str]] = None, html: Optional[Dict[str, str]] = None,
+                 default_pages: Optional[List[str]] = None, latency: float = 0.0):
+        super().__init__(FixtureTransport(wikitexts, html, default_pages, latency))
+
+    @property
+    def latency(self) -> float:
+        return self.transport.latency
+
+    @latency.setter
+    def latency(self, value: float) -> None:
+        self.transport.latency = value
+
+    def respond(self, params: Dict[str, str]) -> dict:
+        return self.transport.respond(params)
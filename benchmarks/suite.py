@@ -0,0 +1,275 @@
+#datu slāņa etalonuzdevumu komplekts, kas darbojas bez tīkla uz saglabātajām Wiktionary lapām (benchmarks/fixtures)
+#rezultāti tiek ierakstīti JSON failā, un --baseline salīdzina tos ar iepriekš saglabātu rezultātu failu
+#palaišana no projekta saknes:
+#  python -m benchmarks.suite [--output results.json] [--baseline baseline.json] [--quick] [--only parse,cache,...]
+#bāzes fails ir tās pašas komandas iepriekšējais --output uz tā paša datora (rezultāti starp datoriem nav salīdzināmi)
+#atgriež 1, ja salīdzinājumā kāds rezultāts ir pasliktinājies vairāk par --threshold
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.bench_parse import build_huge_page
+from benchmarks.stub_server import StubWikiServer, load_pages
+from src.data import scrape2
+from src.data.etymology_cache import open_etymology_cache
+from src.services import etymology_service
+from src.services.etymology_service import EtymologyService
+
+#kešatmiņas izmēri un spēles raundu skaiti, kas tiek mērīti
+CACHE_SIZES = [100, 10_000, 1_000_000]
+QUICK_CACHE_SIZES = [100, 10_000]
+ROUND_COUNTS = [5, 10, 15, 20]
+LOADER_LATENCIES_MS = [0, 50, 200]
+
+#lapas, kuras stub serveris atgriež vārdnīcas vārdiem (visām ir angļu etimoloģija)
+DEFAULT_PAGES = ["corpus", "multiple_etymologies", "zoology"]
+
+#cik citu valodu sadaļu pievienot "huge" wikitekstam
+HUGE_PAGE_LANGUAGES = 300
+
+#uzkrāj rezultātus: {nosaukums: {"value", "unit", "better"}}
+class Results:
+    def __init__(self):
+        self.results: Dict[str, dict] = {}
+
+    def add(self, name: str, value: float, unit: str, better: str) -> None:
+        self.results[name] = {"value": round(value, 3), "unit": unit, "better": better}
+        print(f"  {name:<44}{value:>14.2f} {unit}")
+
+#atkārto fn repeat reizes un atgriež vidējo laiku sekundēs (mediāna no rounds mērījumiem)
+def time_it(fn: Callable[[], object], repeat: int = 1, rounds: int = 3) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        timings.append((time.perf_counter() - started) / repeat)
+    return statistics.median(timings)
+
+#ļoti liela wikiteksta lapa: angļu sadaļa, kam seko daudzas citu valodu sadaļas
+def build_huge_wikitext(base: str, languages: int = HUGE_PAGE_LANGUAGES) -> str:
+    sections = [base]
+    for i in range(languages):
+        sections.append(
+            f"\n==Language {i}==\n===Etymology===\nFrom {{{{inh|x{i}|la|verbum{i}}}}}.\n\n===Noun===\n"
+            + "".join(f"# Sense {j} of [[word{j}]].\n" for j in range(20))
+        )
+    return "".join(sections)
+
+#parsēšanas ātrums (lapas sekundē) ceļiem, ko izmanto get_etymology_info (HTML) un grupu ielāde (wikiteksts)
+def bench_parse(results: Results, quick: bool) -> None:
+    print("parse")
+    repeat = 20 if quick else 200
+    html_pages = load_pages("html")
+    html_pages["huge"] = build_huge_page(html_pages["zoology"])
+    for name, html in html_pages.items():
+        pages_repeat = max(1, repeat // 20) if name == "huge" else repeat
+        seconds = time_it(lambda: scrape2.parse_etymology_html(name, html), pages_repeat)
+        results.add(f"parse.html.{name}", 1 / seconds, "pages/s", "higher")
+
+    wikitexts = load_pages("wikitext")
+    wikitexts["huge"] = build_huge_wikitext(wikitexts["zoology"])
+    for name, wikitext in wikitexts.items():
+        pages_repeat = max(1, repeat // 20) if name == "huge" else repeat
+        seconds = time_it(lambda: scrape2.parse_etymology_wikitext(name, wikitext), pages_repeat)
+        results.add(f"parse.wikitext.{name}", 1 / seconds, "pages/s", "higher")
+
+#kešatmiņas ierakstīšana, saglabāšana (kompaktēšana), ielāde un nolasīšana dažādiem izmēriem
+def bench_cache(results: Results, sizes: List[int], backends: List[str]) -> None:
+    print("cache")
+    rng = random.Random(0)
+    for backend in backends:
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                cache_file = os.path.join(tmp_dir, f"cache.{backend}")
+                cache = open_etymology_cache(cache_file)
+                #kompaktēšana tiek mērīta atsevišķi, tāpēc fona kompaktēšana ierakstīšanas laikā ir izslēgta
+                cache.compact_threshold = size + 1
+                words = [f"word{i}" for i in range(size)]
+
+                started = time.perf_counter()
+                for start in range(0, size, 10_000):
+                    with cache.batch():
+                        for word in words[start:start + 10_000]:
+                            cache.put(word, f"From Latin {word}, from Proto-Indo-European *{word}.",
+                                      ["Latin", "Proto-Indo-European"], "Latin")
+                results.add(f"cache.{backend}.{size}.put", size / (time.perf_counter() - started), "ops/s", "higher")
+
+                if hasattr(cache, "compact"):
+                    started = time.perf_counter()
+                    cache.compact()
+                    results.add(f"cache.{backend}.{size}.save", (time.perf_counter() - started) * 1000, "ms", "lower")
+                cache.close()
+
+                started = time.perf_counter()
+                cache = open_etymology_cache(cache_file)
+                results.add(f"cache.{backend}.{size}.load", (time.perf_counter() - started) * 1000, "ms", "lower")
+
+                lookups = [rng.choice(words) for _ in range(min(size * 10, 100_000))]
+                started = time.perf_counter()
+                for word in lookups:
+                    cache.get(word)
+                results.add(f"cache.{backend}.{size}.get", len(lookups) / (time.perf_counter() - started), "ops/s", "higher")
+                cache.close()
+
+#izveido servisu ar tukšu kešatmiņu pagaidu direktorijā
+def new_service(tmp_dir: str, name: str) -> EtymologyService:
+    return EtymologyService(cache_file=os.path.join(tmp_dir, f"{name}.json"))
+
+#spēles vārdu kopas sagatavošana (get_random_words + get_words_data_sync) ar tukšu, pilnu un daļēji pilnu kešatmiņu
+def bench_service(results: Results, server: StubWikiServer, rounds_list: List[int], repeat: int) -> None:
+    print(f"service (stub latency {server.latency * 1000:.0f} ms)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        #pilnās kešatmiņas saturs tiek iegūts vienreiz un kopēts katram mērījumam
+        warm_source = new_service(tmp_dir, "warm_source")
+        all_words = list(warm_source.word_dict)
+        warm_source.get_words_data_sync(all_words)
+        warm_source.cache.flush()
+
+        for state in ("cold", "warm", "mixed"):
+            for rounds in rounds_list:
+                timings = []
+                for attempt in range(repeat):
+                    service = new_service(tmp_dir, f"{state}_{rounds}_{attempt}")
+                    if state != "cold":
+                        cached = all_words if state == "warm" else all_words[::2]
+                        with service.cache.batch():
+                            for word in cached:
+                                entry = warm_source.cache.get(word)
+                                service.cache.put(word, entry.text, entry.origin_languages, entry.correct_answer)
+                    scrape2.breaker.reset()
+                    started = time.perf_counter()
+                    service.get_words_data_sync(service.get_random_words(rounds))
+                    timings.append(time.perf_counter() - started)
+                    service.cache.close()
+                results.add(f"service.pool.{state}.{rounds}", statistics.median(timings) * 1000, "ms", "lower")
+
+#WordLoaderWorker.run no sākuma līdz beigām ar tukšu kešatmiņu un stub serveri ar dažādu aizturi
+def bench_loader(results: Results, server: StubWikiServer, latencies_ms: List[int], rounds: int, repeat: int) -> None:
+    from src.widgets.game_widget.game_widget import WordLoaderWorker
+
+    print(f"loader ({rounds} rounds)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for latency_ms in latencies_ms:
+            server.latency = latency_ms / 1000
+            totals, first_words = [], []
+            for attempt in range(repeat):
+                #darbinieks izmanto koplietoto servisu, tāpēc tas tiek aizstāts ar servisu ar tukšu kešatmiņu
+                etymology_service._shared_service = new_service(tmp_dir, f"loader_{latency_ms}_{attempt}")
+                scrape2.breaker.reset()
+                worker = WordLoaderWorker(rounds)
+                first: List[float] = []
+                worker.word_loaded.connect(lambda data: first.append(time.perf_counter()))
+                started = time.perf_counter()
+                worker.run()
+                totals.append(time.perf_counter() - started)
+                first_words.append((first[0] if first else time.perf_counter()) - started)
+                etymology_service._shared_service.cache.close()
+            results.add(f"loader.{latency_ms}ms.total", statistics.median(totals) * 1000, "ms", "lower")
+            results.add(f"loader.{latency_ms}ms.first_word", statistics.median(first_words) * 1000, "ms", "lower")
+    etymology_service._shared_service = None
+
+#pašreizējā git versija, ja pieejama
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+#salīdzina ar bāzes rezultātiem; atgriež pasliktināto rezultātu skaitu
+#izmaiņas, kas mazākas par min_delta_ms (ms rezultātiem), netiek uzskatītas par pasliktināšanos - tas ir mērījumu troksnis
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], threshold: float, min_delta_ms: float = 0.0) -> int:
+    regressions = 0
+    print()
+    print(f"{'benchmark':<44}{'baseline':>14}{'current':>14}{'change':>10}")
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["value"], result["value"]
+        change = (after - before) / before if before else 0.0
+        worse = -change if result["better"] == "higher" else change
+        mark = ""
+        if result["unit"] == "ms" and abs(after - before) < min_delta_ms:
+            pass
+        elif worse > threshold:
+            regressions += 1
+            mark = "  REGRESSION"
+        elif -worse > threshold:
+            mark = "  improved"
+        print(f"{name:<44}{before:>14.2f}{after:>14.2f}{change:>+10.1%}{mark}")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline data layer benchmark suite")
+    parser.add_argument("--output", help="rezultātu JSON fails")
+    parser.add_argument("--baseline", help="iepriekšējo rezultātu JSON fails salīdzināšanai")
+    parser.add_argument("--threshold", type=float, default=0.10, help="pieļaujamā pasliktināšanās (0.10 = 10%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="mazākās ms izmaiņas, kas tiek ņemtas vērā")
+    parser.add_argument("--quick", action="store_true", help="mazāki izmēri un mazāk atkārtojumu")
+    parser.add_argument("--only", default="parse,cache,service,loader", help="kuras grupas palaist")
+    parser.add_argument("--cache-sizes", help="kešatmiņas izmēri, piem. 100,10000,1000000")
+    parser.add_argument("--cache-backends", default="json", help="kešatmiņas krātuves: json,idx,db")
+    parser.add_argument("--latency-ms", type=float, default=20, help="stub servera aizture servisa mērījumiem")
+    parser.add_argument("--repeat", type=int, default=None, help="atkārtojumi servisa un ielādes mērījumiem")
+    args = parser.parse_args(argv)
+
+    groups = set(args.only.split(","))
+    repeat = args.repeat or (3 if args.quick else 5)
+    if args.cache_sizes:
+        sizes = [int(size) for size in args.cache_sizes.split(",")]
+    else:
+        sizes = QUICK_CACHE_SIZES if args.quick else CACHE_SIZES
+
+    results = Results()
+    if "parse" in groups:
+        bench_parse(results, args.quick)
+    if "cache" in groups:
+        bench_cache(results, sizes, args.cache_backends.split(","))
+    if groups & {"service", "loader"}:
+        with StubWikiServer(default_pages=DEFAULT_PAGES, latency=args.latency_ms / 1000) as server:
+            api_url = scrape2.API_URL
+            scrape2.API_URL = server.url
+            try:
+                if "service" in groups:
+                    bench_service(results, server, ROUND_COUNTS, repeat)
+                if "loader" in groups:
+                    bench_loader(results, server, LOADER_LATENCIES_MS, 10, repeat)
+            finally:
+                scrape2.API_URL = api_url
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results.results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results.results, baseline, args.threshold, args.min_delta_ms)
+        print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
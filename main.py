@@ -1,13 +1,15 @@
 import json
 import logging
 import pathlib
+import os
 import sys
 import signal
 from datetime import datetime
 
 #lai izmantotu lietotāja definētos motīvus un paletes
-from src.widgets.theme_widget.widget_theme_dialog import apply_saved_theme
-from src.helpers.palette import apply_palette
+from src.helpers.palette import apply_palette, apply_saved_theme
+from src.helpers.logging_setup import configure_logging, stop_logging
+from src.helpers.metrics import dump_metrics
 
 #nodrošina, lai src modulis būtu pieejams / to varētu atrast
 BASE_DIR = pathlib.Path(__file__).resolve().parent #te atrodas src
@@ -18,27 +20,23 @@ from PyQt6.QtWidgets import QApplication
 from src.widgets.mainwindow_widget.mainwindow import MainWindow
 
 #iestata logging saglabāšanas vietu un formātu, sagatavo logus visai spēlei
+#rakstīšana failā un terminālī notiek fona pavedienā, lai GUI pavediens negaidītu uz diska I/O
 def setup_logging():
     logs_dir = SRC_DIR / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    return configure_logging(logs_dir)
 
+#sesijas beigās saglabā laika mērījumus un skaitītājus, lai varētu salīdzināt versijas un datorus
+#(ROOTROULETTE_METRICS_FILE ļauj norādīt citu faila vietu)
+def save_metrics():
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    log_file = logs_dir / f"session-{timestamp}.log"
-
-    #iestata, kā raksta logus un kur tos saglabā
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
-    logging.getLogger(__name__).info("Logging initialized. Log file: %s", log_file)
+    default_file = SRC_DIR / "logs" / f"metrics-{timestamp}.json"
+    metrics_file = dump_metrics(os.environ.get("ROOTROULETTE_METRICS_FILE", default_file))
+    if metrics_file:
+        logging.getLogger(__name__).info("Metrics written to %s", metrics_file)
 
 #palaiž spēli un ieslēdz logus
 def main():
-    setup_logging()
+    log_listener = setup_logging()
     logger = logging.getLogger()
 
     #lai palaistu Qt lietotni un pielietotu theme
@@ -52,7 +50,12 @@ def main():
 
     #ziņo, ka lietotne ir palaista un darbojas līdz logs tiek aizvērts
     logging.getLogger(__name__).info("RootRoulette app started")
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    save_metrics()
+
+    #ieraksta rindā palikušos logus pirms iziešanas
+    stop_logging(log_listener)
+    sys.exit(exit_code)
 
 #funkcija tiek izsaukta tikai tad, ja fails tiek palaists kā pats galvenais
 if __name__ == "__main__":
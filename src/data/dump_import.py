@@ -0,0 +1,241 @@
+#ielādē etimoloģijas no lokāla enwiktionary XML dump faila (.xml.bz2) bez tīkla piekļuves
+#dump tiek lasīts straumēti, lapu wikiteksts tiek parsēts procesu pūlā, rezultāti - ierakstīti kešatmiņā grupās
+#palaišana no projekta saknes: python -m src.data.dump_import enwiktionary-latest-pages-articles.xml.bz2 [--all-words]
+
+import argparse
+import bz2
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree.ElementTree import iterparse
+
+from src.data.etymology_cache import open_etymology_cache
+from src.data.wikitext import extract_english_etymology
+
+#cik lapu nosūtīt vienam procesam vienā uzdevumā un cik uzdevumu drīkst vienlaikus gaidīt rindā
+PAGES_PER_TASK = 200
+MAX_PENDING_TASKS_PER_WORKER = 4
+
+#cik ierakstu saglabāt kešatmiņā vienā transakcijā un cik bieži ziņot par progresu
+WRITE_BATCH_SIZE = 500
+PROGRESS_EVERY = 100000
+
+DEFAULT_WORDS_FILE = os.path.join("src", "data", "data", "word_dict.json")
+
+#straumēti nolasa dump failu un atgriež (kārtas numurs, virsraksts, wikiteksts, versijas ID) galvenās vārdtelpas lapām
+def iter_dump_pages(dump_file: str) -> Iterator[Tuple[int, str, str, Optional[int]]]:
+    """Atmiņas patēriņš nav atkarīgs no dump izmēra - apstrādātie XML elementi tiek uzreiz atbrīvoti."""
+    opener = bz2.open if dump_file.endswith(".bz2") else open
+    with opener(dump_file, "rb") as f:
+        page_number = 0
+        title = None
+        namespace = None
+        text = None
+        revision_id = None
+        root = None
+
+        #<id> ir gan lapai, gan versijai, gan tās autoram - vajadzīgs tikai versijas ID
+        in_revision = False
+        in_contributor = False
+
+        for event, element in iterparse(f, events=("start", "end")):
+            tag = element.tag.rsplit("}", 1)[-1]
+            if event == "start":
+                if root is None:
+                    root = element
+                elif tag == "revision":
+                    in_revision = True
+                elif tag == "contributor":
+                    in_contributor = True
+                continue
+
+            if tag == "title":
+                title = element.text
+            elif tag == "ns":
+                namespace = element.text
+            elif tag == "text":
+                text = element.text or ""
+            elif tag == "id" and in_revision and not in_contributor and revision_id is None:
+                revision_id = int(element.text)
+            elif tag == "contributor":
+                in_contributor = False
+            elif tag == "revision":
+                in_revision = False
+            elif tag == "page":
+                if namespace == "0" and title is not None and text is not None:
+                    yield page_number, title, text, revision_id
+                page_number += 1
+                title = namespace = text = revision_id = None
+                #atbrīvo jau apstrādātās lapas no koka
+                root.clear()
+
+#procesu pūla uzdevums: izvelk etimoloģiju no lapu grupas
+def _extract_pages(pages: List[Tuple[str, str, Optional[int]]]) -> List[Tuple[str, str, List[str], Optional[int]]]:
+    extracted = []
+    for title, wikitext, revision_id in pages:
+        result = extract_english_etymology(wikitext)
+        if result is None:
+            continue
+        text, origin_languages = result
+        if text:
+            extracted.append((title, text, origin_languages, revision_id))
+    return extracted
+
+#nolasa un saglabā progresu, lai pārtraukto importu varētu turpināt
+def load_checkpoint(checkpoint_file: str) -> int:
+    if not os.path.exists(checkpoint_file):
+        return 0
+    try:
+        with open(checkpoint_file, "r", encoding="utf-8") as f:
+            return int(json.load(f).get("pages_done", 0))
+    except (json.JSONDecodeError, ValueError, OSError) as e:
+        print(f"Warning: Could not read import checkpoint: {e}")
+        return 0
+
+def save_checkpoint(checkpoint_file: str, pages_done: int, dump_file: str) -> None:
+    tmp_file = checkpoint_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"dump_file": os.path.abspath(dump_file), "pages_done": pages_done}, f)
+    os.replace(tmp_file, checkpoint_file)
+
+#importē etimoloģijas no dump faila kešatmiņā; atgriež saglabāto ierakstu skaitu
+def import_dump(dump_file: str, cache_file: str = "etymology_cache.json",
+                word_dict: Optional[Dict[str, str]] = None, workers: Optional[int] = None,
+                checkpoint_file: Optional[str] = None) -> int:
+    """Importē angļu etimoloģijas no dump faila.
+
+    Ja word_dict ir dots, tiek importēti tikai tā vārdi (ar tā pareizajām atbildēm), citādi - visi vārdi ar tukšu atbildi.
+    Kontrolpunkts tiek saglabāts tikai pēc tam, kad visi iepriekšējie uzdevumi ir ierakstīti kešatmiņā,
+    un ik pēc PROGRESS_EVERY lapām, kad nepabeigtie uzdevumi ir sagaidīti.
+    """
+    checkpoint_file = checkpoint_file or cache_file + ".import-checkpoint"
+    workers = workers or os.cpu_count() or 1
+    cache = open_etymology_cache(cache_file)
+    wanted: Optional[Set[str]] = set(word_dict) if word_dict is not None else None
+
+    resume_from = load_checkpoint(checkpoint_file)
+    if resume_from:
+        print(f"Resuming after {resume_from} pages")
+
+    stored = 0
+    scanned = 0
+    started = time.perf_counter()
+
+    #uzdevumi var beigties jebkurā secībā, bet kontrolpunkts drīkst pārvietoties tikai līdz pirmajam nepabeigtajam
+    #pending: future -> (uzdevuma numurs, tā pēdējās lapas numurs)
+    pending: Dict[Future, Tuple[int, int]] = {}
+    finished_tasks: Dict[int, Tuple[int, List[Tuple[str, str, List[str], Optional[int]]]]] = {}
+    next_task_to_commit = 0
+    task_number = 0
+    write_buffer: List[Tuple[str, str, List[str], Optional[int]]] = []
+    max_pending = workers * MAX_PENDING_TASKS_PER_WORKER
+
+    def flush_writes() -> None:
+        nonlocal stored
+        if not write_buffer:
+            return
+        with cache.batch():
+            for title, text, origin_languages, revision_id in write_buffer:
+                correct_answer = word_dict.get(title, "") if word_dict is not None else ""
+                cache.put(word=title, text=text, origin_languages=origin_languages, correct_answer=correct_answer,
+                          revision_id=revision_id)
+        stored += len(write_buffer)
+        write_buffer.clear()
+
+    def collect(done_futures) -> None:
+        nonlocal next_task_to_commit
+        for future in done_futures:
+            number, last_page = pending.pop(future)
+            finished_tasks[number] = (last_page, future.result())
+
+        #ieraksta secīgi pabeigtos uzdevumus un pārvieto kontrolpunktu
+        committed_page = None
+        while next_task_to_commit in finished_tasks:
+            committed_page, results = finished_tasks.pop(next_task_to_commit)
+            write_buffer.extend(results)
+            next_task_to_commit += 1
+        if committed_page is not None and (len(write_buffer) >= WRITE_BATCH_SIZE or not pending):
+            flush_writes()
+            save_checkpoint(checkpoint_file, committed_page + 1, dump_file)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk: List[Tuple[str, str, Optional[int]]] = []
+        last_page_number = resume_from - 1
+
+        def submit_chunk() -> None:
+            nonlocal task_number
+            pending[executor.submit(_extract_pages, list(chunk))] = (task_number, last_page_number)
+            task_number += 1
+            chunk.clear()
+
+        for page_number, title, wikitext, revision_id in iter_dump_pages(dump_file):
+            if page_number < resume_from:
+                continue
+            scanned += 1
+            last_page_number = page_number
+            #kešatmiņas atslēgas ir mazajiem burtiem, tāpēc lapas ar lielajiem burtiem ("Turkey") netiek importētas,
+            #citādi tās pārrakstītu parasto vārdu ("turkey") atkarībā no secības dump failā
+            if title == title.lower() and (wanted is None or title in wanted):
+                chunk.append((title, wikitext, revision_id))
+                if len(chunk) >= PAGES_PER_TASK:
+                    submit_chunk()
+
+            #ierobežo rindā gaidošo uzdevumu skaitu, lai atmiņa nepieaugtu līdz ar dump izmēru
+            while len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            if scanned % PROGRESS_EVERY == 0:
+                #nepilnā grupa tiek nosūtīta un visi uzdevumi sagaidīti, lai kontrolpunkts ietvertu visas nolasītās lapas
+                #(vārdnīcas režīmā grupa var nepiepildīties līdz pat dump beigām)
+                if chunk:
+                    submit_chunk()
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                flush_writes()
+                save_checkpoint(checkpoint_file, page_number + 1, dump_file)
+                elapsed = time.perf_counter() - started
+                print(f"Scanned {scanned} pages, stored {stored} ({scanned / elapsed:.0f} pages/s)")
+
+        if chunk:
+            submit_chunk()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+        flush_writes()
+
+    cache.flush()
+
+    #imports pabeigts - nākamā palaišana sāks no jauna
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+
+    elapsed = time.perf_counter() - started
+    print(f"Done: scanned {scanned} pages, stored {stored} etymologies in {elapsed:.1f}s")
+    return stored
+
+#nolasa vārdnīcu, kuras vārdi jāimportē
+def _load_word_dict(words_file: str) -> Dict[str, str]:
+    with open(words_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import English etymologies from an enwiktionary XML dump")
+    parser.add_argument("dump_file", help="enwiktionary-*-pages-articles.xml.bz2")
+    parser.add_argument("--cache-file", default="etymology_cache.json")
+    parser.add_argument("--words-file", default=DEFAULT_WORDS_FILE)
+    parser.add_argument("--all-words", action="store_true", help="importēt visus angļu vārdus, ne tikai vārdnīcas vārdus")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    import_dump(
+        args.dump_file,
+        cache_file=args.cache_file,
+        word_dict=None if args.all_words else _load_word_dict(args.words_file),
+        workers=args.workers,
+    )
+    sys.exit(0)
@@ -1,86 +1,423 @@
 #saglabā un ielādē etimoloģijas kešatmiņu JSON formātā, lai nebūtu jāveic atkārtoti tīmekļa pieprasījumi
+#katrs jauns ieraksts tiek pievienots žurnālā (JSON lines), bet pilnais momentuzņēmums tiek pārrakstīts tikai kompaktēšanas laikā
 
 import json
 import os
-from typing import Dict, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
 
-@dataclass
+#kešatmiņas trāpījumu skaits un meklēšanas ilgums (skat. src/helpers/metrics.py)
+from src.helpers import metrics
+
+#žurnāla faila paplašinājums un ierakstu skaits, pēc kura žurnāls tiek sapludināts momentuzņēmumā
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_SUFFIX = ".compacting"
+COMPACT_THRESHOLD = 500
+
+#failu paplašinājumi, kuriem tiek izmantota SQLite krātuve (skat. open_etymology_cache)
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+MMAP_SUFFIXES = (".idx",)
+
+#reģistrē vienu kešatmiņas meklēšanu: ilgumu kopš started un trāpījumu vai kļūdu
+def record_lookup(started: float, entry: Optional["CachedEtymology"]) -> Optional["CachedEtymology"]:
+    metrics.observe("cache.get", (time.perf_counter() - started) * 1000)
+    metrics.increment("cache.hit" if entry is not None else "cache.miss")
+    return entry
+
+#izcelsmes valodu nosaukumi tiek glabāti vienreiz procesā, bet ierakstos - tikai to numuri
+_language_ids: Dict[str, int] = {}
+_language_names: List[str] = []
+_language_lock = threading.Lock()
+
+#pārveido valodu nosaukumus par mazu skaitļu kortežu
+def intern_languages(names: Iterable[str]) -> Tuple[int, ...]:
+    ids = []
+    for name in names:
+        language_id = _language_ids.get(name)
+        if language_id is None:
+            with _language_lock:
+                language_id = _language_ids.get(name)
+                if language_id is None:
+                    language_id = len(_language_names)
+                    _language_names.append(name)
+                    _language_ids[name] = language_id
+        ids.append(language_id)
+    return tuple(ids)
+
+#pārveido valodu numurus atpakaļ nosaukumos
+def language_names(ids: Tuple[int, ...]) -> List[str]:
+    return [_language_names[language_id] for language_id in ids]
+
+#laika zīmogi tiek glabāti kā mikrosekundes kopš 1970-01-01 (bez laika joslas, tāpat kā ISO virknes failā)
+_EPOCH = datetime(1970, 1, 1)
+
+def _micros(moment: datetime) -> int:
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+def _to_timestamp(value: Union[str, int, None]) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+    return _micros(datetime.fromisoformat(value))
+
+def _to_isoformat(timestamp: Optional[int]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return (_EPOCH + timedelta(microseconds=timestamp)).isoformat()
+
+#nemainīgs kešatmiņas ieraksts bez __dict__; atribūti ir tādi paši kā agrāk, bet valodas un laiki glabājas kompakti
 class CachedEtymology:
-    word: str
-    text: str
-    origin_languages: list[str]
-    correct_answer: str  # pareizās atbildes (A, B, C, D, E) no word_dict.json
-    cached_at: str  # ISO timestamp
+    __slots__ = ("word", "text", "_languages", "correct_answer", "_cached_at", "_expires_at", "revision_id")
+
+    def __init__(self, word: str, text: str, origin_languages: Iterable[str], correct_answer: str,
+                 cached_at: Union[str, int], expires_at: Union[str, int, None] = None,
+                 revision_id: Optional[int] = None):
+        set_slot = object.__setattr__
+        set_slot(self, "word", word)
+        set_slot(self, "text", text)
+        set_slot(self, "_languages", intern_languages(origin_languages))
+        set_slot(self, "correct_answer", correct_answer)  # pareizās atbildes (A, B, C, D, E) no word_dict.json
+        set_slot(self, "_cached_at", _to_timestamp(cached_at))
+        set_slot(self, "_expires_at", _to_timestamp(expires_at))  # None - ieraksts nenoveco
+        set_slot(self, "revision_id", revision_id)  # Wiktionary lapas versija, no kuras ieraksts iegūts
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"CachedEtymology is immutable, cannot set '{name}'")
+
+    #copy un pickle izmanto konstruktora argumentus: valodu numuri ir derīgi tikai šajā procesā
+    def __reduce__(self):
+        return (CachedEtymology, (self.word, self.text, self.origin_languages, self.correct_answer,
+                                  self.cached_at, self.expires_at, self.revision_id))
+
+    @property
+    def origin_languages(self) -> List[str]:
+        return language_names(self._languages)
+
+    #ISO laika zīmogs
+    @property
+    def cached_at(self) -> str:
+        return _to_isoformat(self._cached_at)
+
+    @property
+    def expires_at(self) -> Optional[str]:
+        return _to_isoformat(self._expires_at)
+
+    #pārbauda, vai ierakstam ir beidzies derīguma termiņš
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        if self._expires_at is None:
+            return False
+        return self._expires_at <= _micros(now or datetime.now())
+
+    #vārdnīca JSON failam un žurnālam (tāds pats formāts kā agrāk)
+    def to_dict(self) -> dict:
+        return {
+            "word": self.word,
+            "text": self.text,
+            "origin_languages": self.origin_languages,
+            "correct_answer": self.correct_answer,
+            "cached_at": self.cached_at,
+            "expires_at": self.expires_at,
+            "revision_id": self.revision_id,
+        }
+
+    def _key(self) -> tuple:
+        return (self.word, self.text, self._languages, self.correct_answer,
+                self._cached_at, self._expires_at, self.revision_id)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CachedEtymology):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"CachedEtymology({fields})"
+
+#aprēķina derīguma termiņu ttl sekundes no cached_at
+def expiry_time(cached_at: datetime, ttl: Optional[float]) -> Optional[str]:
+    return (cached_at + timedelta(seconds=ttl)).isoformat() if ttl is not None else None
 
 #pārvalda visu etimoloģijas kešatmiņu - ielādē, saglabā, piekļūst un atjaunina kešatmiņu
 class EtymologyCache:
 
-    #izveido kešatmiņu, ielādējot no JSON faila, ja tā pastāv
-    def __init__(self, cache_file: str = "etymology_cache.json"):
+    #izveido kešatmiņu, ielādējot momentuzņēmumu no JSON faila un atskaņojot žurnālu, ja tie pastāv
+    def __init__(self, cache_file: str = "etymology_cache.json", compact_threshold: int = COMPACT_THRESHOLD):
         self.cache_file = cache_file
+        self.journal_file = cache_file + JOURNAL_SUFFIX
+        self.compact_threshold = compact_threshold
         self.cache: Dict[str, CachedEtymology] = {}
+
+        #_lock aizsargā vārdnīcu un žurnāla failu, _compaction_lock neļauj vienlaikus rakstīt momentuzņēmumu
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._journal_records = 0
+
+        #katram pavedienam ir sava atvērtā transakcija (skat. batch())
+        self._local = threading.local()
         self._load_cache()
 
-    #ielādē kešatmiņu no JSON faila, ja tā pastāv   
+    #ielādē kešatmiņu no JSON faila, ja tā pastāv, un atskaņo žurnāla ierakstus
     def _load_cache(self) -> None:
-        """Ielādē kešatmiņu no JSON faila, ja tā pastāv."""
+        """Ielādē kešatmiņu no JSON faila, ja tā pastāv, un atskaņo žurnālu."""
+        self._load_snapshot()
+
+        #nepabeigtas kompaktēšanas žurnāls jāatskaņo pirms pašreizējā
+        self._journal_records = 0
+        for journal_file in (self.journal_file + COMPACTING_SUFFIX, self.journal_file):
+            self._journal_records += self._replay_journal(journal_file)
+
+        if self._journal_records >= self.compact_threshold:
+            self._schedule_compaction()
+
+    #ielādē momentuzņēmumu (bez žurnāla)
+    def _load_snapshot(self) -> None:
         if os.path.exists(self.cache_file):
             try:
                 with open(self.cache_file, "r", encoding="utf-8") as f:
                     cache_data = json.load(f)
                     self.cache = {
-                        word: CachedEtymology(**data) 
+                        word: CachedEtymology(**data)
                         for word, data in cache_data.items()
                     }
-            except (json.JSONDecodeError, TypeError, KeyError) as e:
+            except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
                 print(f"Warning: Could not load etymology cache: {e}")
                 self.cache = {}
-    
-    #saglabā pašreizējo kešatmiņu JSON failā
-    def _save_cache(self) -> None:
-        """Saglabā pašreizējo kešatmiņu JSON failā."""
+
+    #atskaņo vienu žurnāla failu virs ielādētā momentuzņēmuma; atgriež atskaņoto ierakstu skaitu
+    def _replay_journal(self, journal_file: str) -> int:
+        """Atskaņo žurnāla ierakstus; nepabeigta pēdējā rinda (avārijas gadījumā) tiek ignorēta."""
+        if not os.path.exists(journal_file):
+            return 0
+
+        replayed = 0
+        try:
+            with open(journal_file, "r", encoding="utf-8") as f:
+                lines = f.read().split("\n")
+        except OSError as e:
+            print(f"Warning: Could not read etymology cache journal: {e}")
+            return 0
+
+        for line_number, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                self._apply_record(record)
+                replayed += 1
+            except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+                #pēdējā rinda var būt pusē pārtraukta ierakstīšana - to droši izlaiž
+                if any(rest.strip() for rest in lines[line_number + 1:]):
+                    print(f"Warning: Skipping corrupt etymology journal record: {e}")
+        return replayed
+
+    #pielieto vienu žurnāla ierakstu atmiņā esošajai kešatmiņai
+    def _apply_record(self, record: dict) -> None:
+        if record["op"] == "put":
+            entry = CachedEtymology(**record["entry"])
+            self.cache[entry.word] = entry
+        else:
+            raise KeyError(record["op"])
+
+    #saglabā momentuzņēmumu JSON failā atomāri (caur pagaidu failu); atgriež False, ja neizdevās
+    def _save_cache(self, cache_data: Optional[Dict[str, dict]] = None) -> bool:
+        """Saglabā kešatmiņas momentuzņēmumu JSON failā; kļūdas gadījumā vecais momentuzņēmums paliek nemainīts."""
         try:
-            cache_data = {
-                word: asdict(etymology) 
-                for word, etymology in self.cache.items()
-            }
-            with open(self.cache_file, "w", encoding="utf-8") as f:
+            if cache_data is None:
+                with self._lock:
+                    cache_data = {
+                        word: etymology.to_dict()
+                        for word, etymology in self.cache.items()
+                    }
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
                 json.dump(cache_data, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cache_file)
+            return True
         except Exception as e:
             print(f"Warning: Could not save etymology cache: {e}")
-    
+            return False
+
+    #pievieno ierakstus žurnāla beigās ar vienu fsync
+    def _append_journal(self, records: List[dict]) -> None:
+        if not records:
+            return
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock:
+            try:
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"Warning: Could not write etymology cache journal: {e}")
+                return
+            self._journal_records += len(records)
+            if self._journal_records >= self.compact_threshold:
+                self._schedule_compaction()
+
+    #palaiž kompaktēšanu fona pavedienā, ja tā jau nenotiek
+    def _schedule_compaction(self) -> None:
+        with self._lock:
+            if self._compaction_thread is not None and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self.compact, name="EtymologyCacheCompaction", daemon=True
+            )
+            self._compaction_thread.start()
+
+    #sapludina žurnālu momentuzņēmumā
+    def compact(self) -> None:
+        """Pārraksta momentuzņēmumu un atbrīvojas no jau iekļautajiem žurnāla ierakstiem."""
+        with self._compaction_lock:
+            #zem slēdzenes nokopē stāvokli un pārsauc žurnālu, lai jaunie ieraksti nonāktu jaunā failā
+            with self._lock:
+                cache_data = {
+                    word: etymology.to_dict()
+                    for word, etymology in self.cache.items()
+                }
+                compacting_file = self.journal_file + COMPACTING_SUFFIX
+                if os.path.exists(self.journal_file):
+                    if os.path.exists(compacting_file):
+                        #iepriekšējā kompaktēšana tika pārtraukta - apvieno abus žurnālus
+                        with open(self.journal_file, "r", encoding="utf-8") as src, \
+                                open(compacting_file, "a", encoding="utf-8") as dst:
+                            dst.write(src.read())
+                            dst.flush()
+                            os.fsync(dst.fileno())
+                        os.remove(self.journal_file)
+                    else:
+                        os.replace(self.journal_file, compacting_file)
+                self._journal_records = 0
+
+            #atkārtota žurnāla atskaņošana virs jaunāka momentuzņēmuma ir droša, tāpēc to dzēš tikai tad,
+            #kad momentuzņēmums ir aizstāts; ja rakstīšana neizdevās, žurnāls tiek atskaņots nākamajā ielādē
+            #un apvienots ar nākamās kompaktēšanas žurnālu
+            with metrics.timer("cache.save"):
+                saved = self._save_cache(cache_data)
+            if saved and os.path.exists(compacting_file):
+                os.remove(compacting_file)
+
+    #gaida, kamēr beidzas fona kompaktēšana
+    def flush(self) -> None:
+        """Sagaida fona kompaktēšanas beigas."""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+
+    #saderībai ar citām krātuvēm - JSON kešatmiņai nav atvērtu resursu
+    def close(self) -> None:
+        """Sagaida fona kompaktēšanas beigas."""
+        self.flush()
+
+    #grupē vairākus ierakstus vienā transakcijā ar vienu fsync
+    @contextmanager
+    def batch(self) -> Iterator["EtymologyCache"]:
+        """Grupē put() izsaukumus; žurnālā tie tiek ierakstīti vienreiz, kļūdas gadījumā - atcelti."""
+        if getattr(self._local, "records", None) is not None:
+            #ligzdota transakcija pievienojas ārējai
+            yield self
+            return
+
+        self._local.records = []
+        self._local.undo = {}
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                for word, previous in self._local.undo.items():
+                    if previous is None:
+                        self.cache.pop(word, None)
+                    else:
+                        self.cache[word] = previous
+            raise
+        else:
+            self._append_journal(self._local.records)
+        finally:
+            self._local.records = None
+            self._local.undo = None
+
     #ja vārds ir kešatmiņā, atgriež kešatmiņā saglabāto etimoloģiju
     def get(self, word: str) -> Optional[CachedEtymology]:
         """Iegūst vārda etimoloģiju no kešatmiņas, ja tā pastāv."""
-        return self.cache.get(word.lower())
-    
+        started = time.perf_counter()
+        with self._lock:
+            entry = self.cache.get(word.lower())
+        return record_lookup(started, entry)
+
     #saglabā jaunus vārdus kešatmiņā ar pašreizējo laika zīmogu
-    def put(self, word: str, text: str, origin_languages: list[str], correct_answer: str) -> None:
-        """Saglabā etimoloģiju kešatmiņā ar pašreizējo laika zīmogu."""
+    def put(self, word: str, text: str, origin_languages: list[str], correct_answer: str,
+            ttl: Optional[float] = None, revision_id: Optional[int] = None) -> None:
+        """Saglabā etimoloģiju kešatmiņā ar pašreizējo laika zīmogu; ttl (sekundēs) ierobežo ieraksta derīgumu."""
+        now = datetime.now()
         cached_etymology = CachedEtymology(
             word=word.lower(),
             text=text,
             origin_languages=origin_languages,
             correct_answer=correct_answer,
-            cached_at=datetime.now().isoformat()
+            cached_at=now.isoformat(),
+            expires_at=expiry_time(now, ttl),
+            revision_id=revision_id
         )
-        self.cache[word.lower()] = cached_etymology
-        self._save_cache()
-    
+        record = {"op": "put", "entry": cached_etymology.to_dict()}
+
+        with self._lock:
+            records = getattr(self._local, "records", None)
+            if records is not None:
+                self._local.undo.setdefault(cached_etymology.word, self.cache.get(cached_etymology.word))
+            self.cache[cached_etymology.word] = cached_etymology
+
+        if records is not None:
+            records.append(record)
+        else:
+            self._append_journal([record])
+
     #pārbauda, vai vārds jau ir kešatmiņā
     def contains(self, word: str) -> bool:
         """Pārbauda, vai vārds jau ir kešatmiņā."""
-        return word.lower() in self.cache
-    
+        with self._lock:
+            return word.lower() in self.cache
+
     #notīra visu kešatmiņu
     def clear(self) -> None:
         """Notīra visu kešatmiņu."""
-        self.cache.clear()
-        self._save_cache()
-    
+        with self._compaction_lock, self._lock:
+            self.cache.clear()
+
+            #šī pavediena atvērtās transakcijas ieraksti vairs nav spēkā
+            if getattr(self._local, "records", None) is not None:
+                self._local.records.clear()
+                self._local.undo.clear()
+            #žurnāli tiek dzēsti tikai pēc tukšā momentuzņēmuma ierakstīšanas, citādi restartā tie atjaunotu ierakstus
+            if not self._save_cache({}):
+                return
+            for journal_file in (self.journal_file, self.journal_file + COMPACTING_SUFFIX):
+                if os.path.exists(journal_file):
+                    os.remove(journal_file)
+            self._journal_records = 0
+
     #iegūst kešatmiņā saglabāto ierakstu skaitu
     def size(self) -> int:
         """Iegūst kešatmiņā saglabāto ierakstu skaitu."""
-        return len(self.cache)
\ No newline at end of file
+        with self._lock:
+            return len(self.cache)
+
+#izvēlas kešatmiņas krātuvi pēc faila paplašinājuma: .db/.sqlite - SQLite, .idx - mmap indekss, citādi - JSON ar žurnālu
+def open_etymology_cache(
+    cache_file: str = "etymology_cache.json"
+) -> Union[EtymologyCache, "SqliteEtymologyCache", "MmapEtymologyCache"]:
+    """Atver etimoloģijas kešatmiņu ar krātuvi, kas atbilst faila paplašinājumam."""
+    if cache_file.lower().endswith(SQLITE_SUFFIXES):
+        from src.data.sqlite_cache import SqliteEtymologyCache
+        return SqliteEtymologyCache(cache_file)
+    if cache_file.lower().endswith(MMAP_SUFFIXES):
+        from src.data.mmap_cache import MmapEtymologyCache
+        return MmapEtymologyCache(cache_file)
+    return EtymologyCache(cache_file)
@@ -0,0 +1,43 @@
+#etimoloģijas pieprasījumu rezultātu tipi bez tīkla un HTML parsēšanas atkarībām
+#kešatmiņa un serviss tos var importēt, neielādējot requests un bs4 (tie tiek ielādēti tikai līdz ar scrape2)
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional
+
+#cik lapu satura MediaWiki API atgriež vienā action=query pieprasījumā
+QUERY_BATCH_SIZE = 50
+
+#atstarpes pirms aizverošām un pēc atverošām pieturzīmēm, kā arī teksta virziena zīmes (&lrm;, &rlm;)
+SPACE_BEFORE_CLOSING_RE = re.compile(r"[ \t]+([,.;:!?)\]”’])")
+SPACE_AFTER_OPENING_RE = re.compile(r"([(\[“‘])[ \t]+")
+DIRECTION_MARKS_RE = re.compile("[\u200e\u200f]")
+
+#vienots etimoloģijas teksta pieraksts, lai HTML (teksta mezgli savienoti ar atstarpēm) un wikiteksta ceļš
+#kešatmiņā saglabātu vienādu tekstu
+def normalize_etymology_text(text: str) -> str:
+    text = DIRECTION_MARKS_RE.sub("", text)
+    text = SPACE_BEFORE_CLOSING_RE.sub(r"\1", text)
+    text = SPACE_AFTER_OPENING_RE.sub(r"\1", text)
+    return "\n".join(re.sub(r"[ \t]+", " ", line).strip() for line in text.split("\n"))
+
+#lai definētu statusa kodus (funkcijas rezultātus) un atbildes struktūru
+class Status(Enum):
+    SUCCESS = "S"
+    ERROR = "E"
+    NOT_FOUND = "N"
+
+#strukturē datus, lai būtu vieglāk piekļūt etimoloģijas informācijai
+@dataclass
+class EtymologyData:
+    word: str
+    text: str
+    origin_languages: List[str]
+    revision_id: Optional[int] = None  # lapas versija, no kuras etimoloģija iegūta
+
+@dataclass
+class EtymologyResponse:
+    status: Status
+    message: str
+    data: Optional[EtymologyData] = None
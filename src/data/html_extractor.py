@@ -0,0 +1,195 @@
+#straumējošs etimoloģijas izvilkšanas rīks, kas balstīts uz standarta bibliotēkas html.parser.HTMLParser
+#neveido visu dokumenta koku: izlaiž saturu līdz angļu valodas virsrakstam un apstājas pie nākamā virsraksta
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import List, Optional
+
+#elementi bez noslēdzošā taga - tie neietekmē ligzdojuma dziļumu
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+#elementi, kuru saturs nav redzams teksts (piem., TemplateStyles <style> rindkopās) - tāpat kā BeautifulSoup get_text
+SKIP_TEXT_TAGS = {"style", "script", "noscript", "template"}
+
+#cik lielos gabalos HTML tiek padots parserim; pēc katra gabala pārbauda, vai var apstāties
+FEED_CHUNK_SIZE = 8192
+
+#izvilkšanas rezultāts; tā nozīme sakrīt ar BeautifulSoup versiju scrape2.py
+@dataclass
+class ExtractedEtymology:
+    found_english: bool = False
+    found_etymology: bool = False
+    paragraphs: List[str] = field(default_factory=list)
+    origin_languages: List[str] = field(default_factory=list)
+
+#parsera stāvokļi
+_SEEK_ENGLISH = "seek_english"
+_SEEK_ETYMOLOGY = "seek_etymology"
+_IN_CONTAINER = "in_container"
+_SIBLINGS = "siblings"
+_DONE = "done"
+
+class EtymologyHTMLExtractor(HTMLParser):
+    """Izvelk etimoloģijas rindkopas un `span.etyl a` valodas, neveidojot dokumenta koku.
+
+    section_only=True nozīmē, ka HTML jau ir tikai etimoloģijas sadaļa (pirmais h3/h4 ir tās virsraksts).
+    """
+
+    def __init__(self, section_only: bool = False):
+        super().__init__(convert_charrefs=True)
+        self.result = ExtractedEtymology(found_english=section_only)
+        self.section_only = section_only
+        self.state = _SEEK_ETYMOLOGY if section_only else _SEEK_ENGLISH
+        self.stack: List[str] = []
+
+        #virsraksta teksta uztveršana, lai pārbaudītu, vai tas sākas ar "Etymology"
+        self.heading_depth = 0
+        self.heading_text: List[str] = []
+
+        #etimoloģijas virsraksta vecākelementa dziļums un pašreizējā blakuselementa stāvoklis
+        self.container_depth = 0
+        self.sibling_tag: Optional[str] = None
+        self.paragraph_strings: List[str] = []
+        self.etyl_depth = 0
+        self.language_depth = 0
+        self.language_strings: List[str] = []
+
+        #dziļums, kurā atvērts SKIP_TEXT_TAGS elements; kamēr tas nav 0, teksts tiek ignorēts
+        self.skip_depth = 0
+
+        #secīgi teksta gabali tiek apvienoti vienā virknē (kā BeautifulSoup NavigableString)
+        self.pending_text: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self.state == _DONE
+
+    #pabeidz pašreizējo teksta virkni un pievieno to aktīvajiem uztvērējiem
+    def _flush_text(self) -> None:
+        if not self.pending_text:
+            return
+        text = "".join(self.pending_text).strip()
+        self.pending_text = []
+        if not text:
+            return
+        if self.heading_depth:
+            self.heading_text.append(text)
+        if self.state == _SIBLINGS and self.sibling_tag == "p":
+            self.paragraph_strings.append(text)
+            if self.language_depth:
+                self.language_strings.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        self._flush_text()
+        if tag in VOID_TAGS:
+            return
+
+        self.stack.append(tag)
+        depth = len(self.stack)
+        if tag in SKIP_TEXT_TAGS and not self.skip_depth:
+            self.skip_depth = depth
+
+        if self.state == _SEEK_ENGLISH:
+            if tag == "h2" and dict(attrs).get("id") == "English":
+                self.result.found_english = True
+                self.state = _SEEK_ETYMOLOGY
+
+        elif self.state == _SEEK_ETYMOLOGY:
+            if tag == "h2" and not self.section_only:
+                #sasniegta nākamās valodas sadaļa - angļu sadaļā etimoloģijas nav
+                self.state = _DONE
+            elif tag in ("h3", "h4") and not self.heading_depth:
+                self.heading_depth = depth
+                self.heading_text = []
+
+        elif self.state == _SIBLINGS:
+            if depth == self.container_depth:
+                self.sibling_tag = tag
+                self.paragraph_strings = []
+            elif self.sibling_tag in ("div", "h2", "h3", "h4") and tag in ("h2", "h3", "h4"):
+                #blakuselements satur nākamo virsrakstu - etimoloģijas sadaļa beigusies
+                self.state = _DONE
+            elif self.sibling_tag == "p":
+                classes = (dict(attrs).get("class") or "").split()
+                if tag == "span" and "etyl" in classes and not self.etyl_depth:
+                    self.etyl_depth = depth
+                elif tag == "a" and self.etyl_depth and not self.language_depth:
+                    self.language_depth = depth
+                    self.language_strings = []
+
+    def handle_startendtag(self, tag, attrs):
+        #<br/> u.tml. neatver jaunu līmeni
+        if self.done:
+            return
+        self._flush_text()
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        self._flush_text()
+        if tag not in self.stack:
+            return
+
+        #tāpat kā BeautifulSoup, aizver visus elementus līdz atbilstošajam atvērtajam tagam
+        while self.stack:
+            depth = len(self.stack)
+            closed = self.stack.pop()
+            if depth == self.skip_depth:
+                self.skip_depth = 0
+            self._close_element(closed, depth)
+            if closed == tag or self.done:
+                break
+
+    #apstrādā elementa aizvēršanu noteiktā dziļumā
+    def _close_element(self, tag: str, depth: int) -> None:
+        if self.state == _SEEK_ETYMOLOGY and depth == self.heading_depth:
+            text = "".join(self.heading_text)
+            self.heading_depth = 0
+            if text.startswith("Etymology") or self.section_only:
+                self.result.found_etymology = True
+                self.container_depth = depth - 1
+                self.state = _IN_CONTAINER
+
+        elif self.state == _IN_CONTAINER and depth == self.container_depth:
+            #virsraksta konteiners aizvērts - tālāk seko sadaļas saturs
+            self.state = _SIBLINGS
+            self.sibling_tag = None
+
+        elif self.state == _SIBLINGS:
+            if depth == self.language_depth:
+                name = "".join(self.language_strings)
+                if name not in self.result.origin_languages:
+                    self.result.origin_languages.append(name)
+                self.language_depth = 0
+            if depth == self.etyl_depth:
+                self.etyl_depth = 0
+            if depth == self.container_depth:
+                if self.sibling_tag == "p":
+                    self.result.paragraphs.append(" ".join(self.paragraph_strings))
+                self.sibling_tag = None
+            elif depth < self.container_depth:
+                #vecākelements aizvērts - vairāk blakuselementu nav
+                self.state = _DONE
+
+    def handle_data(self, data):
+        if self.done or self.skip_depth:
+            return
+        self.pending_text.append(data)
+
+#straumēti izvelk etimoloģiju no HTML, pārtraucot parsēšanu, tiklīdz sadaļa beigusies
+def extract_etymology(html: str, section_only: bool = False) -> ExtractedEtymology:
+    """Atgriež angļu valodas etimoloģijas rindkopas un izcelsmes valodas no Wiktionary HTML."""
+    parser = EtymologyHTMLExtractor(section_only=section_only)
+    for start in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + FEED_CHUNK_SIZE])
+        if parser.done:
+            break
+    else:
+        parser.close()
+        parser._flush_text()
+    return parser.result
@@ -0,0 +1,267 @@
+#etimoloģijas kešatmiņa kompaktā, ar mmap atvērtā failā - atvēršana nav atkarīga no ierakstu skaita,
+#un get() nolasa tikai vajadzīgo ierakstu (sakārtots atslēgu indekss + ieraksti ar garuma prefiksu, pēc izvēles saspiesti)
+#jaunie ieraksti tiek glabāti atmiņā un žurnālā tāpat kā EtymologyCache, un kompaktēšana tos ieraksta jaunā indeksa failā
+#
+#faila struktūra (visi skaitļi little-endian):
+#  galvene     HEADER: maģiskā virkne, ierakstu skaits, karodziņi, atslēgu bloka un indeksa sākums
+#  ieraksti    katram vārdam: u32 garums + JSON (bez "word"), ja FLAG_COMPRESSED - saspiests ar zlib
+#  atslēgas    visu vārdu UTF-8 baiti pēc kārtas
+#  indekss     INDEX_ENTRY katram vārdam, sakārtots pēc atslēgas baitiem: atslēgas nobīde, garums, ieraksta nobīde
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+from src.data.etymology_cache import COMPACT_THRESHOLD, CachedEtymology, EtymologyCache, record_lookup
+
+MAGIC = b"RRETYX01"
+HEADER = struct.Struct("<8sIIQQ")
+INDEX_ENTRY = struct.Struct("<QIQ")
+RECORD_LENGTH = struct.Struct("<I")
+FLAG_COMPRESSED = 1
+
+#atvērts indeksa fails; meklēšana un ierakstu nolasīšana notiek tieši mmap atmiņā
+class _IndexFile:
+    def __init__(self, index_file: str):
+        self._file = open(index_file, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise
+        magic, self.count, self.flags, self.keys_offset, self.index_offset = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{index_file} is not an etymology index file")
+
+    #atgriež i-tā indeksa elementa atslēgu un ieraksta nobīdi
+    def _entry(self, i: int) -> Tuple[bytes, int]:
+        key_offset, key_length, record_offset = INDEX_ENTRY.unpack_from(self._mm, self.index_offset + i * INDEX_ENTRY.size)
+        return self._mm[key_offset:key_offset + key_length], record_offset
+
+    #binārā meklēšana sakārtotajā indeksā; atgriež ieraksta nobīdi vai None
+    def find(self, key: bytes) -> Optional[int]:
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            middle_key, record_offset = self._entry(middle)
+            if middle_key == key:
+                return record_offset
+            if middle_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    #nolasa ieraksta baitus (vēl saspiestus, ja fails ir saspiests)
+    def raw_record(self, record_offset: int) -> bytes:
+        (length,) = RECORD_LENGTH.unpack_from(self._mm, record_offset)
+        start = record_offset + RECORD_LENGTH.size
+        return self._mm[start:start + length]
+
+    def decode(self, word: str, raw: bytes) -> CachedEtymology:
+        if self.flags & FLAG_COMPRESSED:
+            raw = zlib.decompress(raw)
+        return CachedEtymology(word=word, **json.loads(raw))
+
+    #visi (atslēga, ieraksta nobīde) pāri sakārtotā secībā
+    def items(self) -> Iterator[Tuple[bytes, int]]:
+        for i in range(self.count):
+            yield self._entry(i)
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+#kodē vienu ierakstu faila formātā
+def _encode_record(entry: CachedEtymology, compress: bool) -> bytes:
+    data = entry.to_dict()
+    del data["word"]
+    raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw) if compress else raw
+
+#ieraksta indeksa failu no (atslēga, ieraksta baiti) pāriem, kas jau sakārtoti pēc atslēgas
+def _write_index(index_file: str, records: Iterator[Tuple[bytes, bytes]], compress: bool) -> int:
+    keys = []
+    record_offsets = []
+    with open(index_file, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 0, 0, 0, 0))
+        for key, raw in records:
+            keys.append(key)
+            record_offsets.append(f.tell())
+            f.write(RECORD_LENGTH.pack(len(raw)))
+            f.write(raw)
+
+        keys_offset = f.tell()
+        key_offsets = []
+        for key in keys:
+            key_offsets.append(f.tell())
+            f.write(key)
+
+        index_offset = f.tell()
+        for key, key_offset, record_offset in zip(keys, key_offsets, record_offsets):
+            f.write(INDEX_ENTRY.pack(key_offset, len(key), record_offset))
+
+        flags = FLAG_COMPRESSED if compress else 0
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, len(keys), flags, keys_offset, index_offset))
+        f.flush()
+        os.fsync(f.fileno())
+    return len(keys)
+
+#EtymologyCache variants, kura momentuzņēmums ir mmap indekss, nevis JSON
+class MmapEtymologyCache(EtymologyCache):
+    """self.cache satur tikai jaunos (vēl nekompaktētos) ierakstus; pārējie tiek nolasīti no indeksa pēc pieprasījuma."""
+
+    def __init__(self, cache_file: str = "etymology_cache.idx", compact_threshold: int = COMPACT_THRESHOLD,
+                 compress: bool = True):
+        self.compress = compress
+        self._index: Optional[_IndexFile] = None
+        super().__init__(cache_file, compact_threshold)
+
+    #atver indeksa failu; pats indekss netiek nolasīts
+    def _load_snapshot(self) -> None:
+        if not os.path.exists(self.cache_file) or os.path.getsize(self.cache_file) == 0:
+            return
+        try:
+            self._index = _IndexFile(self.cache_file)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not open etymology index: {e}")
+            self._index = None
+
+    #meklē vārdu indeksa failā
+    def _get_indexed(self, word: str) -> Optional[CachedEtymology]:
+        if self._index is None:
+            return None
+        record_offset = self._index.find(word.encode("utf-8"))
+        if record_offset is None:
+            return None
+        return self._index.decode(word, self._index.raw_record(record_offset))
+
+    def get(self, word: str) -> Optional[CachedEtymology]:
+        """Iegūst vārda etimoloģiju no jaunajiem ierakstiem vai indeksa faila."""
+        started = time.perf_counter()
+        word = word.lower()
+        with self._lock:
+            entry = self.cache.get(word)
+            if entry is None:
+                entry = self._get_indexed(word)
+        return record_lookup(started, entry)
+
+    def contains(self, word: str) -> bool:
+        """Pārbauda, vai vārds jau ir kešatmiņā."""
+        word = word.lower()
+        with self._lock:
+            if word in self.cache:
+                return True
+            return self._index is not None and self._index.find(word.encode("utf-8")) is not None
+
+    def size(self) -> int:
+        """Iegūst kešatmiņā saglabāto ierakstu skaitu."""
+        with self._lock:
+            if self._index is None:
+                return len(self.cache)
+            new_words = sum(1 for word in self.cache if self._index.find(word.encode("utf-8")) is None)
+            return self._index.count + new_words
+
+    #apvieno indeksa ierakstus ar jaunajiem ierakstiem sakārtotā secībā
+    def _merged_records(self, index: Optional[_IndexFile], cache_data: Dict[str, dict]) -> Iterator[Tuple[bytes, bytes]]:
+        new_records = sorted(
+            (word.encode("utf-8"), _encode_record(CachedEtymology(**data), self.compress))
+            for word, data in cache_data.items()
+        )
+        old_records = iter(index.items()) if index is not None else iter(())
+        old = next(old_records, None)
+        for key, raw in new_records:
+            while old is not None and old[0] < key:
+                yield old[0], self._recode(index, old)
+                old = next(old_records, None)
+            if old is not None and old[0] == key:
+                old = next(old_records, None)
+            yield key, raw
+        while old is not None:
+            yield old[0], self._recode(index, old)
+            old = next(old_records, None)
+
+    #esošā ieraksta baiti jaunajam failam; pārkodē tikai tad, ja mainās saspiešanas iestatījums
+    def _recode(self, index: _IndexFile, item: Tuple[bytes, int]) -> bytes:
+        key, record_offset = item
+        raw = index.raw_record(record_offset)
+        if bool(index.flags & FLAG_COMPRESSED) == self.compress:
+            return raw
+        return _encode_record(index.decode(key.decode("utf-8"), raw), self.compress)
+
+    #kompaktēšana: jaunais indeksa fails = vecais indekss + jaunie ieraksti; atgriež False, ja neizdevās
+    def _save_cache(self, cache_data: Optional[Dict[str, dict]] = None) -> bool:
+        """Ieraksta jaunu indeksa failu, atver to vecā vietā un izņem iekļautos ierakstus no atmiņas."""
+        try:
+            with self._lock:
+                if cache_data is None:
+                    cache_data = {word: etymology.to_dict() for word, etymology in self.cache.items()}
+                index = self._index
+            #vecais fails paliek atvērts, līdz jaunais ir gatavs, tāpēc get() pa to laiku turpina strādāt
+            tmp_file = self.cache_file + ".tmp"
+            _write_index(tmp_file, self._merged_records(index, cache_data), self.compress)
+
+            #Windows neļauj aizstāt failu, kamēr tas ir atvērts ar mmap, tāpēc vecais tiek aizvērts pirms os.replace
+            with self._lock:
+                if index is not None:
+                    index.close()
+                self._index = None
+                try:
+                    os.replace(tmp_file, self.cache_file)
+                finally:
+                    #ja aizstāšana neizdevās, tiek atkal atvērts vecais fails
+                    self._load_snapshot()
+
+                #indeksā ierakstītie vārdi tagad tiek nolasīti no faila; paliek tikai rakstīšanas laikā mainītie
+                for word, data in (cache_data.items() if self._index is not None else ()):
+                    entry = self.cache.get(word)
+                    if entry is not None and entry.to_dict() == data:
+                        del self.cache[word]
+            return True
+        except Exception as e:
+            print(f"Warning: Could not save etymology index: {e}")
+            return False
+
+    def clear(self) -> None:
+        """Notīra visu kešatmiņu."""
+        with self._compaction_lock, self._lock:
+            index, self._index = self._index, None
+            if index is not None:
+                index.close()
+        super().clear()
+
+    def close(self) -> None:
+        """Sagaida fona kompaktēšanas beigas un aizver indeksa failu."""
+        super().close()
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
+#vienreizēja esošās JSON kešatmiņas pārveidošana indeksa failā
+def convert_json_cache(json_file: str, index_file: str, compress: bool = True) -> int:
+    """Pārveido etymology_cache.json (un tā žurnālu) mmap indeksa failā; atgriež ierakstu skaitu."""
+    source = EtymologyCache(json_file)
+    records = sorted(
+        (word.encode("utf-8"), _encode_record(entry, compress))
+        for word, entry in source.cache.items()
+    )
+    tmp_file = index_file + ".tmp"
+    converted = _write_index(tmp_file, iter(records), compress)
+    os.replace(tmp_file, index_file)
+    return converted
+
+#palaiž pārveidošanu no komandrindas: python -m src.data.mmap_cache [json_fails] [idx_fails] [--no-compress]
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    json_file = args[0] if args else "etymology_cache.json"
+    index_file = args[1] if len(args) > 1 else os.path.splitext(json_file)[0] + ".idx"
+    converted = convert_json_cache(json_file, index_file, compress="--no-compress" not in sys.argv)
+    print(f"Converted {converted} entries from {json_file} to {index_file}")
@@ -0,0 +1,128 @@
+#atkārtoti mēģinājumi ar nejaušu eksponenciālu aizturi un ķēdes pārtraucējs Wiktionary pieprasījumiem
+#pārejošas kļūdas (noildze, savienojuma kļūda, 429, 5xx) tiek mēģinātas vēlreiz, bet, ja Wiktionary nav sasniedzams,
+#pārtraucējs uz laiku aptur visus pieprasījumus, lai spēle negaidītu REQUEST_TIMEOUT sekundes katram vārdam
+
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+#cik reizes mēģināt pieprasījumu un aiztures robežas sekundēs
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 4.0
+
+#pēc cik secīgām neveiksmēm pārtraucējs atveras un pēc cik sekundēm tas ļauj vienu izmēģinājuma pieprasījumu
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30.0
+
+#HTTP statusa kodi, kurus ir jēga mēģināt vēlreiz
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+#izmet, ja pārtraucējs ir atvērts; tā kā tā ir RequestException, esošā kļūdu apstrāde to uzskata par tīkla kļūdu
+class CircuitOpenError(requests.RequestException):
+    pass
+
+#pārbauda, vai kļūda ir pārejoša
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+#aizture pirms nākamā mēģinājuma ("full jitter" - nejauša vērtība līdz eksponenciālajai robežai)
+def backoff_delay(attempt: int, base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY) -> float:
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+#ķēdes pārtraucējs: closed - pieprasījumi notiek, open - tiek uzreiz noraidīti, half-open - atļauts viens izmēģinājums
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    #pārbauda, vai pieprasījumu drīkst sūtīt; ja nē - izmet CircuitOpenError
+    def before_request(self) -> None:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                #noildze beigusies - viens pieprasījums pārbaudīs, vai serveris atkal atbild
+                self._state = self.HALF_OPEN
+                return
+            raise CircuitOpenError("Wiktionary is unreachable, requests are paused")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    #atbrīvo half-open izmēģinājumu, neatverot un neaizverot pārtraucēju (kļūda nebija saistīta ar serveri);
+    #nākamais pieprasījums atkal būs izmēģinājums
+    def release_probe(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    #atjauno sākotnējo stāvokli
+    def reset(self) -> None:
+        self.record_success()
+
+#izpilda request ar atkārtotiem mēģinājumiem pārejošu kļūdu gadījumā; katrs neveiksmīgs mēģinājums tiek paziņots pārtraucējam
+def call_with_retry(request: Callable[[], T], breaker: Optional[CircuitBreaker] = None,
+                    attempts: int = RETRY_ATTEMPTS, sleep: Callable[[float], None] = time.sleep) -> T:
+    """Izsauc request līdz attempts reizēm; nepārejošas kļūdas (piem., 404) tiek izmestas uzreiz."""
+    attempt = 0
+    while True:
+        if breaker:
+            breaker.before_request()
+        try:
+            result = request()
+        except requests.RequestException as e:
+            if not is_transient(e):
+                #serveris atbildēja (piem., 404), tātad tas ir sasniedzams
+                if breaker:
+                    breaker.record_success()
+                raise
+            if breaker:
+                breaker.record_failure()
+            attempt += 1
+            if attempt >= attempts:
+                raise
+            sleep(backoff_delay(attempt - 1))
+            continue
+        except Exception:
+            #kļūda nav tīkla kļūda (piem., parsēšanas), tāpēc netiek skaitīta, bet half-open izmēģinājums tiek atbrīvots,
+            #citādi pārtraucējs nekad vairs neaizvērtos
+            if breaker:
+                breaker.release_probe()
+            raise
+        if breaker:
+            breaker.record_success()
+        return result
@@ -0,0 +1,148 @@
+#pārbauda, vai kešotās etimoloģijas joprojām atbilst jaunākajai Wiktionary lapas versijai
+#vienā action=query prop=info pieprasījumā tiek iegūti līdz QUERY_BATCH_SIZE lapu jaunāko versiju ID (bez satura),
+#un no jauna tiek lejupielādētas tikai tās lapas, kuru versija ir mainījusies
+#palaišana no projekta saknes: python -m src.data.revalidate [--workers N] [--include-unknown]
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from src.data.scrape2 import QUERY_BATCH_SIZE, EtymologyResponse, Status, api_get, get_etymology_info_batch
+from src.services.etymology_service import DEFAULT_FETCH_WORKERS, EtymologyService
+
+#iegūst lapu jaunāko versiju ID; atgriež {virsraksts: versijas ID vai None, ja lapas nav}
+def query_revision_ids(titles: List[str]) -> Dict[str, Optional[int]]:
+    params = {
+        "action": "query",
+        "prop": "info",
+        "titles": "|".join(titles),
+        "format": "json",
+        "formatversion": "2"
+    }
+    revisions: Dict[str, Optional[int]] = {}
+    normalized: Dict[str, str] = {}
+
+    while True:
+        response_json = api_get(params)
+        query = response_json.get("query", {})
+        for item in query.get("normalized", []):
+            normalized[item["from"]] = item["to"]
+        for page in query.get("pages", []):
+            if page.get("missing") or page.get("invalid"):
+                revisions.setdefault(page["title"], None)
+            else:
+                revisions[page["title"]] = page.get("lastrevid")
+
+        if "continue" not in response_json:
+            break
+        params = {**params, **response_json["continue"]}
+
+    return {title: revisions.get(normalized.get(title, title)) for title in titles}
+
+#viena metadatu pieprasījuma izpilde; tīkla kļūdas gadījumā atgriež None
+def _query_batch(batch: List[str]) -> Optional[Dict[str, Optional[int]]]:
+    try:
+        return query_revision_ids(batch)
+    except requests.RequestException as e:
+        print(f"Warning: Could not check revisions: {e}")
+        return None
+
+#apkopo pārbaudes rezultātus
+class RevalidateStats:
+    def __init__(self, total: int):
+        self.total = total
+        self.checked = 0
+        self.unchanged = 0
+        self.changed = 0
+        self.unknown = 0
+        self.refreshed = 0
+        self.errors = 0
+        self.metadata_requests = 0
+        self.started = time.perf_counter()
+
+    def print_summary(self) -> None:
+        elapsed = time.perf_counter() - self.started
+        print()
+        print(f"Cached words: {self.total}")
+        print(f"Checked: {self.checked} in {self.metadata_requests} metadata requests ({elapsed:.1f}s)")
+        print(f"  unchanged: {self.unchanged}")
+        print(f"  changed: {self.changed} (refreshed {self.refreshed}, errors {self.errors})")
+        print(f"  without revision ID: {self.unknown}")
+
+#pārbauda kešatmiņas ierakstus un atjauno tos, kuru lapa ir mainījusies
+def revalidate_cache(service: EtymologyService, workers: int = DEFAULT_FETCH_WORKERS,
+                     batch_size: int = QUERY_BATCH_SIZE, include_unknown: bool = False) -> RevalidateStats:
+    """Salīdzina kešoto versijas ID ar jaunāko un no jauna iegūst tikai mainītās lapas.
+
+    Ieraksti bez versijas ID (saglabāti pirms tā ieviešanas) tiek atjaunoti tikai ar include_unknown.
+    """
+    cached_revisions: Dict[str, Optional[int]] = {}
+    for word in service.get_available_words():
+        cached = service.cache.get(word)
+        if cached is not None:
+            cached_revisions[word] = cached.revision_id
+    stats = RevalidateStats(len(cached_revisions))
+
+    to_refresh: List[str] = []
+    known = [word for word, revision_id in cached_revisions.items() if revision_id is not None]
+    unknown = [word for word, revision_id in cached_revisions.items() if revision_id is None]
+    stats.unknown = len(unknown)
+    if include_unknown:
+        to_refresh.extend(unknown)
+
+    batches = [known[start:start + batch_size] for start in range(0, len(known), batch_size)]
+    print(f"Checking {len(known)} of {len(cached_revisions)} cached words in {len(batches)} metadata requests")
+
+    #metadatu pieprasījumi ir mazi, tāpēc tos var sūtīt paralēli
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for batch, latest in zip(batches, executor.map(_query_batch, batches)):
+            stats.metadata_requests += 1
+            if latest is None:
+                stats.errors += len(batch)
+                continue
+            for word in batch:
+                stats.checked += 1
+                if latest[word] == cached_revisions[word]:
+                    stats.unchanged += 1
+                else:
+                    stats.changed += 1
+                    to_refresh.append(word)
+
+    #mainītās lapas tiek lejupielādētas tāpat kā kešatmiņas sasildīšanā - grupās pa batch_size
+    refresh_batches = [to_refresh[start:start + batch_size] for start in range(0, len(to_refresh), batch_size)]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for batch, responses in zip(refresh_batches, executor.map(get_etymology_info_batch, refresh_batches)):
+            with service.cache.batch():
+                for word in batch:
+                    response: EtymologyResponse = responses[word]
+                    if response.status == Status.ERROR:
+                        stats.errors += 1
+                        continue
+                    service.cache_response(word, response)
+                    stats.refreshed += 1
+            print(f"Refreshed {stats.refreshed}/{len(to_refresh)}")
+
+    service.cache.flush()
+    return stats
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-fetch cached etymologies whose Wiktionary page has changed")
+    parser.add_argument("--workers", type=int, default=DEFAULT_FETCH_WORKERS, help="paralēlo API pieprasījumu skaits")
+    parser.add_argument("--batch-size", type=int, default=QUERY_BATCH_SIZE, help="lapu skaits vienā API pieprasījumā")
+    parser.add_argument("--include-unknown", action="store_true", help="atjaunot arī ierakstus bez versijas ID")
+    parser.add_argument("--word-dict", default="src/data/data/word_dict.json")
+    parser.add_argument("--cache-file", default="etymology_cache.json")
+    args = parser.parse_args(argv)
+
+    service = EtymologyService(word_dict_file=args.word_dict, cache_file=args.cache_file)
+    stats = revalidate_cache(service, workers=args.workers, batch_size=args.batch_size,
+                             include_unknown=args.include_unknown)
+    stats.print_summary()
+    return 1 if stats.errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,24 @@
 #lai scrapotu etimoloģijas datus no Wiktionary vieglākai piekļuvei un izmantošanai spēlē
 import requests
 from bs4 import BeautifulSoup, Tag
-from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-#lai definētu statusa kodus
-from enum import Enum
+#lai izvilktu etimoloģiju no vairāku lapu wikiteksta vai straumējoši no HTML
+from src.data.wikitext import extract_english_etymology
+from src.data.html_extractor import ExtractedEtymology, extract_etymology
 
-#lai randomizētu jautājumus spēlē
-import random
+#lai pieprasījumus varētu ierakstīt, atskaņot no diska vai sūtīt uz lokālu serveri
+from src.data.transport import HttpTransport, Transport, transport_from_env
+
+#lai pārejošas tīkla kļūdas tiktu mēģinātas vēlreiz un nesasniedzams serveris neaizturētu spēli
+from src.data.resilience import CircuitBreaker, call_with_retry
+
+#tīkla pieprasījumu, parsēšanas un vārdu iegūšanas laika mērījumi (skat. src/helpers/metrics.py)
+from src.helpers import metrics
+
+#statusa kodi, atbildes struktūra un pieprasījuma grupas izmērs (atsevišķā modulī, kas neielādē requests un bs4)
+from src.data.etymology_types import (QUERY_BATCH_SIZE, EtymologyData, EtymologyResponse, Status,
+                                     normalize_etymology_text)
 
 #lai saglabātu un ielādētu punktus un vārdnīcu
 import json
@@ -16,8 +26,22 @@ import json
 #lai faili atrastos pareizajā vietā
 import os
 
+#lai koplietoto transportu varētu droši izveidot no vairākiem pavedieniem
+import threading
+
+#lai pieprasījumus varētu veikt, nebloķējot asyncio notikumu cilpu
+import asyncio
+from concurrent.futures import Executor
+
+#lai reģistrētu lejupielādēto baitu skaitu un parsēšanas laiku
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
 #Wiktionary API adrese un User-Agent, lai izvairītos no bloķēšanas
-API_URL = "https://en.wiktionary.org/w/api.php"
+#(ROOTROULETTE_API_URL ļauj norādīt lokālu testa serveri)
+API_URL = os.environ.get("ROOTROULETTE_API_URL", "https://en.wiktionary.org/w/api.php")
 HEADERS = {
     "User-Agent": "DF_LU_Bot/0.1 (https://example.com; contact@example.com)"
 }
@@ -29,109 +53,324 @@ os.makedirs(DATA_DIR, exist_ok=True)
 POINTS_FILE = os.path.join(DATA_DIR, "points.json")
 WORDS_FILE = os.path.join(DATA_DIR, "word_dict.json")
 
-#lai definētu statusa kodus (funkcijas rezultātus) un atbildes struktūru
-class Status(Enum):
-    SUCCESS = "S"
-    ERROR = "E"
-    NOT_FOUND = "N"
-
-#strukturē datus, lai būtu vieglāk piekļūt etimoloģijas informācijai
-@dataclass
-class EtymologyData:
-    word: str
-    text: str
-    origin_languages: List[str]
-
-@dataclass
-class EtymologyResponse:
-    status: Status
-    message: str
-    data: Optional[EtymologyData] = None
+#pieprasījuma noildze un savienojumu skaits koplietotās sesijas pūlā
+REQUEST_TIMEOUT = 10
+HTTP_POOL_SIZE = 16
 
-#funkcija, kas iegūst etimoloģijas informāciju no Wiktionary
-def get_etymology_info(word: str) -> EtymologyResponse:
-    try:
-        params = {
-            "action": "parse",
-            "page": word,
-            "prop": "text",
-            "format": "json"
-        }
-        r = requests.get(API_URL, params=params, headers=HEADERS, timeout=10)
+#"section" - lejupielādē tikai angļu etimoloģijas sadaļu (2 mazi pieprasījumi), "page" - visu lapas HTML
+FETCH_MODE = os.environ.get("ROOTROULETTE_FETCH_MODE", "section")
+
+#transports, caur kuru iet visi API pieprasījumi (skat. src/data/transport.py)
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+#viens pārtraucējs visiem Wiktionary pieprasījumiem šajā procesā
+breaker = CircuitBreaker()
+
+#atgriež pašreizējo transportu; pirmajā izsaukumā to izvēlas pēc ROOTROULETTE_TRANSPORT (noklusējums - HTTP)
+def get_transport() -> Transport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = transport_from_env(HttpTransport(HEADERS, HTTP_POOL_SIZE))
+    return _transport
+
+#aizstāj transportu (piem., ar ReplayTransport testos un slodzes testos); atgriež iepriekšējo
+def set_transport(transport: Optional[Transport]) -> Optional[Transport]:
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    return previous
+
+#izpilda vienu Wiktionary API pieprasījumu; atgriež JSON atbildi un tās izmēru baitos
+#pārejošas kļūdas tiek mēģinātas vēlreiz; ja serveris nav sasniedzams, izmet CircuitOpenError bez gaidīšanas
+def api_request(params: dict) -> Tuple[dict, int]:
+    def request() -> requests.Response:
+        started = time.perf_counter()
+        try:
+            r = get_transport().get(API_URL, params, REQUEST_TIMEOUT)
+        except requests.RequestException:
+            metrics.increment("http.status.error")
+            raise
+        finally:
+            metrics.observe("http.request", (time.perf_counter() - started) * 1000)
+        metrics.increment(f"http.status.{r.status_code}")
+        metrics.increment("http.bytes", len(r.content))
         r.raise_for_status()
-        
-        response_json = r.json()
-        
-        if "error" in response_json:
-            return EtymologyResponse(
-                status=Status.NOT_FOUND,
-                message=f"Page '{word}' not found on Wiktionary",
-                data=None
-            )
-        
-        #parsē HTML saturu; lai varētu meklēt etimoloģijas sadaļu un tekstu
-        html = response_json["parse"]["text"]["*"]
-        soup = BeautifulSoup(html, "html.parser")
-
-        #atrod angļu valodas sadaļu
-        english = soup.find("h2", id="English")
-        if not english:
-            return EtymologyResponse(
-                status=Status.NOT_FOUND,
-                message=f"No English entry found for '{word}'",
-                data=EtymologyData(word=word, text="", origin_languages=[])
-            )
-        
-        #atrod etimoloģijas apakšsadaļu
-        etymology_heading = None
-        for h in english.find_all_next(["h3", "h4"]):
-            if h.get_text(strip=True).startswith("Etymology"):
-                etymology_heading = h
-                break
-            if h.name == "h2":
+        return r
+
+    r = call_with_retry(request, breaker)
+    return r.json(), len(r.content)
+
+#izpilda vienu Wiktionary API pieprasījumu un atgriež JSON atbildi
+def api_get(params: dict) -> dict:
+    return api_request(params)[0]
+
+#Wiktionary API parametri visas lapas HTML iegūšanai
+def _parse_params(word: str) -> dict:
+    return {
+        "action": "parse",
+        "page": word,
+        "prop": "text",
+        "format": "json"
+    }
+
+#API parametri lapas sadaļu saraksta iegūšanai (bez satura)
+def _sections_params(word: str) -> dict:
+    return {
+        "action": "parse",
+        "page": word,
+        "prop": "sections",
+        "format": "json"
+    }
+
+#API parametri vienas sadaļas HTML iegūšanai
+def _section_text_params(word: str, section_index: str) -> dict:
+    return {
+        "action": "parse",
+        "page": word,
+        "section": section_index,
+        "prop": "text",
+        "format": "json"
+    }
+
+#apkopo etimoloģijas tekstu un izcelsmes valodas no elementiem pēc etimoloģijas virsraksta
+def _collect_etymology(word: str, etymology_heading: Tag) -> EtymologyResponse:
+    #lai iegūtu etimoloģijas tekstu un izcelsmes valodas
+    heading_container = etymology_heading.parent
+    etymology_paragraphs = []
+    origin_languages = []
+
+    #pārlasa visus elementus etimoloģijas sadaļā līdz nākamajai sadaļai (nākamajam virsrakstam)
+    for el in heading_container.next_siblings:
+
+        #pārtrauc, ja sasniedz nākamo virsrakstu
+        if isinstance(el, Tag) and el.name in ("div", "h2", "h3", "h4"):
+            if el.find(["h2", "h3", "h4"]):
                 break
-        
-        if not etymology_heading:
-            return EtymologyResponse(
-                status=Status.NOT_FOUND,
-                message=f"No etymology section found for '{word}'",
-                data=EtymologyData(word=word, text="", origin_languages=[])
-            )
-        
-        #lai iegūtu etimoloģijas tekstu un izcelsmes valodas
-        heading_container = etymology_heading.parent
-        etymology_paragraphs = []
-        origin_languages = []
-        
-        #pārlasa visus elementus etimoloģijas sadaļā līdz nākamajai sadaļai (nākamajam virsrakstam)
-        for el in heading_container.next_siblings:
-
-            #pārtrauc, ja sasniedz nākamo virsrakstu
-            if isinstance(el, Tag) and el.name in ("div", "h2", "h3", "h4"):
-                if el.find(["h2", "h3", "h4"]):
-                    break
-
-            #apkopo etimoloģijas tekstu un izcelsmes valodas, meklējot rindkopas un sakārto datus
-            if isinstance(el, Tag) and el.name == "p":
-                etymology_paragraphs.append(el.get_text(" ", strip=True))
-
-                #meklē izcelsmes valodas etimoloģijas tekstā
-                for span in el.select("span.etyl a"):
-                    name = span.get_text(strip=True)
-                    if name not in origin_languages:
-                        origin_languages.append(name)
-        
-        #apvieno rindkopas vienā tekstā
-        etymology_text = "\n".join(etymology_paragraphs)
-        
-        #ja etimoloģijas teksts ir tukšs, atgriež paziņojumu
-        if not etymology_text:
-            return EtymologyResponse(
-                status=Status.NOT_FOUND,
-                message=f"Etymology section exists but contains no text for '{word}'",
-                data=EtymologyData(word=word, text="", origin_languages=origin_languages)
-            )
-        
+
+        #apkopo etimoloģijas tekstu un izcelsmes valodas, meklējot rindkopas un sakārto datus
+        if isinstance(el, Tag) and el.name == "p":
+            etymology_paragraphs.append(el.get_text(" ", strip=True))
+
+            #meklē izcelsmes valodas etimoloģijas tekstā
+            for span in el.select("span.etyl a"):
+                name = span.get_text(strip=True)
+                if name not in origin_languages:
+                    origin_languages.append(name)
+
+    #apvieno rindkopas vienā tekstā
+    etymology_text = normalize_etymology_text("\n".join(etymology_paragraphs))
+
+    #ja etimoloģijas teksts ir tukšs, atgriež paziņojumu
+    if not etymology_text:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"Etymology section exists but contains no text for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=origin_languages)
+        )
+
+    return EtymologyResponse(
+        status=Status.SUCCESS,
+        message=f"Etymology found for '{word}'",
+        data=EtymologyData(word=word, text=etymology_text, origin_languages=origin_languages)
+    )
+
+#BeautifulSoup versija, kas veido visu dokumenta koku; saglabāta salīdzināšanai ar straumējošo parseri (benchmarks/)
+def parse_etymology_html_bs4(word: str, html: str) -> EtymologyResponse:
+    #parsē HTML saturu; lai varētu meklēt etimoloģijas sadaļu un tekstu
+    soup = BeautifulSoup(html, "html.parser")
+
+    #atrod angļu valodas sadaļu
+    english = soup.find("h2", id="English")
+    if not english:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No English entry found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=[])
+        )
+
+    #atrod etimoloģijas apakšsadaļu
+    etymology_heading = None
+    for h in english.find_all_next(["h2", "h3", "h4"]):
+        if h.get_text(strip=True).startswith("Etymology"):
+            etymology_heading = h
+            break
+        if h.name == "h2":
+            break
+
+    if not etymology_heading:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No etymology section found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=[])
+        )
+
+    return _collect_etymology(word, etymology_heading)
+
+#pārveido straumējošā parsera rezultātu par EtymologyResponse
+def _response_from_extracted(word: str, extracted: ExtractedEtymology) -> EtymologyResponse:
+    if not extracted.found_english:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No English entry found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=[])
+        )
+
+    if not extracted.found_etymology:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No etymology section found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=[])
+        )
+
+    #apvieno rindkopas vienā tekstā
+    etymology_text = normalize_etymology_text("\n".join(extracted.paragraphs))
+
+    #ja etimoloģijas teksts ir tukšs, atgriež paziņojumu
+    if not etymology_text:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"Etymology section exists but contains no text for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=extracted.origin_languages)
+        )
+
+    return EtymologyResponse(
+        status=Status.SUCCESS,
+        message=f"Etymology found for '{word}'",
+        data=EtymologyData(word=word, text=etymology_text, origin_languages=extracted.origin_languages)
+    )
+
+#atrod angļu valodas etimoloģijas sadaļu lapas HTML un izvelk tekstu un izcelsmes valodas
+#(straumējoši - parsēšana beidzas, tiklīdz etimoloģijas sadaļa ir nolasīta)
+def parse_etymology_html(word: str, html: str) -> EtymologyResponse:
+    return _response_from_extracted(word, extract_etymology(html))
+
+#parsē tikai etimoloģijas sadaļas HTML (section režīmā tas sākas ar etimoloģijas virsrakstu)
+def parse_etymology_section_html(word: str, html: str) -> EtymologyResponse:
+    return _response_from_extracted(word, extract_etymology(html, section_only=True))
+
+#no lapas sadaļu saraksta atrod angļu valodas etimoloģijas sadaļas indeksu
+def _find_etymology_section(word: str, sections: List[dict]) -> Tuple[Optional[str], Optional[EtymologyResponse]]:
+    english_number = None
+    for section in sections:
+        if section.get("level") == "2" and section.get("line") == "English":
+            english_number = section.get("number")
+            break
+    if english_number is None:
+        return None, EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No English entry found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=[])
+        )
+
+    #etimoloģijas sadaļai jāatrodas angļu valodas sadaļā (numurs sākas ar angļu sadaļas numuru)
+    for section in sections:
+        if (
+            section.get("number", "").startswith(english_number + ".")
+            and section.get("level") in ("3", "4")
+            and section.get("line", "").startswith("Etymology")
+        ):
+            return section.get("index"), None
+
+    return None, EtymologyResponse(
+        status=Status.NOT_FOUND,
+        message=f"No etymology section found for '{word}'",
+        data=EtymologyData(word=word, text="", origin_languages=[])
+    )
+
+#pievieno atbildei lapas versijas ID, ja atbildē ir dati
+def _with_revision(response: EtymologyResponse, revision_id: Optional[int]) -> EtymologyResponse:
+    if response.data is not None:
+        response.data.revision_id = revision_id
+    return response
+
+#lejupielādē parsējamo HTML: visu lapu (page) vai tikai etimoloģijas sadaļu (section)
+#atgriež (html, versijas ID, None) vai (None, None, atbilde), ja jau pirms parsēšanas zināms, ka etimoloģijas nav
+def _fetch_etymology_html(word: str, mode: str) -> Tuple[Optional[str], Optional[int], Optional[EtymologyResponse]]:
+    not_found = EtymologyResponse(
+        status=Status.NOT_FOUND,
+        message=f"Page '{word}' not found on Wiktionary",
+        data=None
+    )
+
+    if mode == "section":
+        sections_json, sections_bytes = api_request(_sections_params(word))
+        if "error" in sections_json:
+            return None, None, not_found
+        section_index, early_response = _find_etymology_section(word, sections_json["parse"]["sections"])
+        if early_response:
+            logger.info("Fetched '%s' sections: %d bytes, no etymology section", word, sections_bytes)
+            return None, None, _with_revision(early_response, sections_json["parse"].get("revid"))
+
+        response_json, text_bytes = api_request(_section_text_params(word, section_index))
+        logger.info(
+            "Fetched '%s' (section mode): %d bytes (%d sections + %d section text)",
+            word, sections_bytes + text_bytes, sections_bytes, text_bytes
+        )
+    else:
+        response_json, text_bytes = api_request(_parse_params(word))
+        logger.info("Fetched '%s' (page mode): %d bytes", word, text_bytes)
+
+    if "error" in response_json:
+        return None, None, not_found
+    return response_json["parse"]["text"]["*"], response_json["parse"].get("revid"), None
+
+#parsē lejupielādēto HTML un reģistrē parsēšanas laiku
+def _parse_fetched_html(word: str, html: str, mode: str) -> EtymologyResponse:
+    started = time.perf_counter()
+    if mode == "section":
+        response = parse_etymology_section_html(word, html)
+    else:
+        response = parse_etymology_html(word, html)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    metrics.observe("parse.html", elapsed_ms)
+    logger.info("Parsed '%s' (%s mode) in %.1f ms", word, mode, elapsed_ms)
+    return response
+
+#funkcija, kas iegūst etimoloģijas informāciju no Wiktionary
+#mode: "section" - tikai angļu etimoloģijas sadaļa (noklusējums), "page" - visa lapa
+def get_etymology_info(word: str, mode: Optional[str] = None) -> EtymologyResponse:
+    started = time.perf_counter()
+    response = _get_etymology_info(word, mode or FETCH_MODE)
+    metrics.observe("fetch.word", (time.perf_counter() - started) * 1000)
+    metrics.increment(f"fetch.status.{response.status.name.lower()}")
+    return response
+
+#get_etymology_info bez mērījumiem
+def _get_etymology_info(word: str, mode: str) -> EtymologyResponse:
+    try:
+        html, revision_id, early_response = _fetch_etymology_html(word, mode)
+        if early_response:
+            return early_response
+        return _with_revision(_parse_fetched_html(word, html, mode), revision_id)
+
+    except requests.RequestException as e:
+        return EtymologyResponse(
+            status=Status.ERROR,
+            message=f"Network error: {str(e)}",
+            data=None
+        )
+    except Exception as e:
+        return EtymologyResponse(
+            status=Status.ERROR,
+            message=f"Unexpected error: {str(e)}",
+            data=None
+        )
+
+#asinhronā versija: tīkla pieprasījums un HTML parsēšana notiek ārpus notikumu cilpas, tāpēc tā netiek bloķēta
+async def get_etymology_info_async(word: str, executor: Optional[Executor] = None,
+                                   mode: Optional[str] = None) -> EtymologyResponse:
+    mode = mode or FETCH_MODE
+    loop = asyncio.get_running_loop()
+    try:
+        html, revision_id, early_response = await loop.run_in_executor(executor, _fetch_etymology_html, word, mode)
+        if early_response:
+            return early_response
+        response = await loop.run_in_executor(executor, _parse_fetched_html, word, html, mode)
+        return _with_revision(response, revision_id)
+
     except requests.RequestException as e:
         return EtymologyResponse(
             status=Status.ERROR,
@@ -144,6 +383,118 @@ def get_etymology_info(word: str) -> EtymologyResponse:
             message=f"Unexpected error: {str(e)}",
             data=None
         )
+
+#pārveido vienas lapas wikitekstu par EtymologyResponse (tāda pati nozīme kā parse_etymology_html)
+def parse_etymology_wikitext(word: str, wikitext: str, revision_id: Optional[int] = None) -> EtymologyResponse:
+    extracted = extract_english_etymology(wikitext)
+    if extracted is None:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No English entry found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=[], revision_id=revision_id)
+        )
+
+    etymology_text, origin_languages = extracted
+    if not etymology_text:
+        return EtymologyResponse(
+            status=Status.NOT_FOUND,
+            message=f"No etymology section found for '{word}'",
+            data=EtymologyData(word=word, text="", origin_languages=origin_languages, revision_id=revision_id)
+        )
+
+    return EtymologyResponse(
+        status=Status.SUCCESS,
+        message=f"Etymology found for '{word}'",
+        data=EtymologyData(word=word, text=etymology_text, origin_languages=origin_languages, revision_id=revision_id)
+    )
+
+#iegūst vienas API grupas (līdz QUERY_BATCH_SIZE vārdiem) lapu wikitekstu
+#atgriež {virsraksts: (wikiteksts, versijas ID) vai None, ja lapas nav}
+def _query_wikitext(titles: List[str]) -> Dict[str, Optional[Tuple[str, int]]]:
+    params = {
+        "action": "query",
+        "prop": "revisions",
+        "rvprop": "content|ids",
+        "rvslots": "main",
+        "titles": "|".join(titles),
+        "format": "json",
+        "formatversion": "2"
+    }
+    pages: Dict[str, Optional[Tuple[str, int]]] = {}
+    normalized: Dict[str, str] = {}
+
+    #ja atbilde ir pārāk liela, API daļu lapu atgriež bez satura un norāda "continue"
+    while True:
+        response_json = api_get(params)
+        query = response_json.get("query", {})
+        for item in query.get("normalized", []):
+            normalized[item["from"]] = item["to"]
+        for page in query.get("pages", []):
+            if page.get("missing") or page.get("invalid"):
+                pages.setdefault(page["title"], None)
+            elif page.get("revisions"):
+                revision = page["revisions"][0]
+                pages[page["title"]] = (revision["slots"]["main"]["content"], revision.get("revid"))
+
+        if "continue" not in response_json:
+            break
+        params = {**params, **response_json["continue"]}
+
+    return {title: pages.get(normalized.get(title, title)) for title in titles}
+
+#iegūst daudzu vārdu etimoloģiju ar dažiem action=query pieprasījumiem, nevis vienu pieprasījumu katram vārdam
+def get_etymology_info_batch(words: List[str], batch_size: int = QUERY_BATCH_SIZE) -> Dict[str, EtymologyResponse]:
+    """Atgriež {vārds: EtymologyResponse}; tīkla kļūda ietekmē tikai tās grupas vārdus, kurā tā notika."""
+    started = time.perf_counter()
+    results: Dict[str, EtymologyResponse] = {}
+    unique_words = list(dict.fromkeys(words))
+
+    for start in range(0, len(unique_words), batch_size):
+        batch = unique_words[start:start + batch_size]
+        try:
+            wikitexts = _query_wikitext(batch)
+        except requests.RequestException as e:
+            for word in batch:
+                results[word] = EtymologyResponse(
+                    status=Status.ERROR,
+                    message=f"Network error: {str(e)}",
+                    data=None
+                )
+            continue
+        except Exception as e:
+            for word in batch:
+                results[word] = EtymologyResponse(
+                    status=Status.ERROR,
+                    message=f"Unexpected error: {str(e)}",
+                    data=None
+                )
+            continue
+
+        for word in batch:
+            page = wikitexts.get(word)
+            if page is None:
+                results[word] = EtymologyResponse(
+                    status=Status.NOT_FOUND,
+                    message=f"Page '{word}' not found on Wiktionary",
+                    data=None
+                )
+                continue
+            try:
+                wikitext, revision_id = page
+                with metrics.timer("parse.wikitext"):
+                    results[word] = parse_etymology_wikitext(word, wikitext, revision_id)
+            except Exception as e:
+                results[word] = EtymologyResponse(
+                    status=Status.ERROR,
+                    message=f"Unexpected error: {str(e)}",
+                    data=None
+                )
+
+    metrics.observe("fetch.batch", (time.perf_counter() - started) * 1000)
+    for response in results.values():
+        metrics.increment(f"fetch.status.{response.status.name.lower()}")
+    return results
+
 #JSON faili, lai saglabātu un ielādētu punktus un vārdnīcu
 if __name__ == "__main__":
 
@@ -170,31 +521,46 @@ if __name__ == "__main__":
     with open(WORDS_FILE, "r", encoding="utf-8") as f:
         word_dict = json.load(f)
 
+    #spēles loģika ir tā pati, ko izmanto grafiskā saskarne (src/services/game_session.py)
+    from src.services.etymology_service import EtymologyService
+    from src.services.game_session import GameSession
+
+    service = EtymologyService(WORDS_FILE)
+    max_questions = len(word_dict)
+
     #spēles cikls un jautājumi
     new_game = input("Do you want to start a new game? Y/N   ").upper()
     if new_game == "Y":
         points_data["points"] = 0
         save_points()
-    question_count = int(input("How many questions do you want to ask? The maximum is 64 questions.   "))
-    if question_count > 0 and question_count <= 64:
-        for i in range(int(question_count)):
-            word = random.choice(list(word_dict.keys()))
-            correct_answer = word_dict[word]
-            answer = input(f"\nQuestion {i+1}\nGuess the etymology of this word:  {word}\nOptions: \n   A) Greek\n   B) Latin\n   C) Old English\n   D) French\n   E) Norse \nYour answer:   ").upper()
-            result = get_etymology_info(word)
-            if answer == correct_answer:
-                print(f"Correct! The answer is {correct_answer}.\n")
-                print(f"Etymology of '{word}':\n{result.data.text}\nOrigin languages: {', '.join(result.data.origin_languages)}\n")
+    question_count = int(input(f"How many questions do you want to ask? The maximum is {max_questions} questions.   "))
+    if question_count > 0 and question_count <= max_questions:
+        session = GameSession(question_count, service=service)
+        print("Loading words...")
+        for data in service.get_words_data_sync(service.get_random_words(question_count)):
+            if data:
+                session.add_word(data)
+        session.finish_loading()
+
+        letters = "ABCD"
+        while (word_data := session.next_round()) is not None:
+            options = "".join(f"\n   {letter}) {language}" for letter, language in zip(letters, session.options))
+            answer = input(f"\nQuestion {session.current_round}\nGuess the etymology of this word:  {word_data.word}\nOptions: {options} \nYour answer:   ").upper()
+            chosen = session.options[letters.index(answer)] if len(answer) == 1 and answer in letters[:len(session.options)] else ""
+            if session.guess(chosen):
+                print(f"Correct! The answer is {word_data.correct_language}.\n")
                 points_data["points"] += 1
                 save_points()
-                print(f"Your total points: {points_data['points']}\n")
             else:
-                print(f"Wrong! The correct answer is {correct_answer}.\n")
-                print(f"Etymology of '{word}':\n{result.data.text}\nOrigin languages: {', '.join(result.data.origin_languages)}\n")
-                print(f"Your total points: {points_data['points']}\n")
+                print(f"Wrong! The correct answer is {word_data.correct_language}.\n")
+            print(f"Etymology of '{word_data.word}':\n{word_data.etymology_text}\nOrigin languages: {', '.join(word_data.origin_languages)}\n")
+            print(f"Your total points: {points_data['points']}\n")
+
+        result = session.result()
+        print(f"Game over! You scored {result.score} out of {result.total_rounds}.")
     elif question_count == 0:
         print("No questions asked.")
-    elif question_count == 65:
-        print("You can ask a maximum of 64 questions.")
+    elif question_count > max_questions:
+        print(f"You can ask a maximum of {max_questions} questions.")
     else:
-        print("Invalid number of questions.")
\ No newline at end of file
+        print("Invalid number of questions.")
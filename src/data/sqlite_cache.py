@@ -0,0 +1,187 @@
+#etimoloģijas kešatmiņa SQLite datubāzē - ielāde nav atkarīga no kešatmiņas izmēra, jo katrs vaicājums ir punktveida
+#tai ir tāda pati saskarne kā EtymologyCache (get, put, contains, size, clear, batch)
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from src.data.etymology_cache import CachedEtymology, expiry_time, record_lookup
+
+#SQL vaicājumi ir konstantes, lai sqlite3 tos sagatavotu vienreiz un atkārtoti izmantotu no kešatmiņas
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS etymology (
+    word TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    origin_languages TEXT NOT NULL,
+    correct_answer TEXT NOT NULL,
+    cached_at TEXT NOT NULL,
+    expires_at TEXT,
+    revision_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_etymology_correct_answer ON etymology (correct_answer);
+CREATE INDEX IF NOT EXISTS idx_etymology_cached_at ON etymology (cached_at);
+"""
+SELECT_ONE = (
+    "SELECT word, text, origin_languages, correct_answer, cached_at, expires_at, revision_id "
+    "FROM etymology WHERE word = ?"
+)
+SELECT_EXISTS = "SELECT 1 FROM etymology WHERE word = ?"
+SELECT_COUNT = "SELECT COUNT(*) FROM etymology"
+UPSERT = (
+    "INSERT OR REPLACE INTO etymology "
+    "(word, text, origin_languages, correct_answer, cached_at, expires_at, revision_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+DELETE_ALL = "DELETE FROM etymology"
+
+#kolonnas, kas pievienotas vēlāk - vecākām datubāzēm tās tiek pievienotas atverot
+TABLE_COLUMNS = "PRAGMA table_info(etymology)"
+ADDED_COLUMNS = {
+    "expires_at": "ALTER TABLE etymology ADD COLUMN expires_at TEXT",
+    "revision_id": "ALTER TABLE etymology ADD COLUMN revision_id INTEGER",
+}
+
+#pārvalda etimoloģijas kešatmiņu SQLite datubāzē
+class SqliteEtymologyCache:
+
+    #atver (vai izveido) datubāzi WAL režīmā
+    def __init__(self, cache_file: str = "etymology_cache.db"):
+        self.cache_file = cache_file
+
+        #viens savienojums tiek koplietots starp pavedieniem, tāpēc piekļuvi tam aizsargā slēdzene
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(cache_file, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute(TABLE_COLUMNS)}
+        for column, statement in ADDED_COLUMNS.items():
+            if column not in columns:
+                self._conn.execute(statement)
+        self._in_batch = False
+
+    #pārveido datubāzes rindu par CachedEtymology
+    @staticmethod
+    def _row_to_entry(row: tuple) -> CachedEtymology:
+        word, text, origin_languages, correct_answer, cached_at, expires_at, revision_id = row
+        return CachedEtymology(
+            word=word,
+            text=text,
+            origin_languages=json.loads(origin_languages),
+            correct_answer=correct_answer,
+            cached_at=cached_at,
+            expires_at=expires_at,
+            revision_id=revision_id
+        )
+
+    #ja vārds ir kešatmiņā, atgriež kešatmiņā saglabāto etimoloģiju
+    def get(self, word: str) -> Optional[CachedEtymology]:
+        """Iegūst vārda etimoloģiju no kešatmiņas, ja tā pastāv."""
+        started = time.perf_counter()
+        with self._lock:
+            row = self._conn.execute(SELECT_ONE, (word.lower(),)).fetchone()
+        return record_lookup(started, self._row_to_entry(row) if row else None)
+
+    #saglabā jaunus vārdus kešatmiņā ar pašreizējo laika zīmogu
+    def put(self, word: str, text: str, origin_languages: list[str], correct_answer: str,
+            ttl: Optional[float] = None, revision_id: Optional[int] = None) -> None:
+        """Saglabā etimoloģiju kešatmiņā ar pašreizējo laika zīmogu; ttl (sekundēs) ierobežo ieraksta derīgumu."""
+        now = datetime.now()
+        row = (
+            word.lower(),
+            text,
+            json.dumps(origin_languages, ensure_ascii=False),
+            correct_answer,
+            now.isoformat(),
+            expiry_time(now, ttl),
+            revision_id
+        )
+        with self._lock:
+            self._conn.execute(UPSERT, row)
+
+    #grupē vairākus ierakstus vienā transakcijā
+    @contextmanager
+    def batch(self) -> Iterator["SqliteEtymologyCache"]:
+        """Grupē put() izsaukumus vienā transakcijā; kļūdas gadījumā tā tiek atcelta."""
+        with self._lock:
+            if self._in_batch:
+                yield self
+                return
+
+            self._conn.execute("BEGIN")
+            self._in_batch = True
+            try:
+                yield self
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+            finally:
+                self._in_batch = False
+
+    #pārbauda, vai vārds jau ir kešatmiņā
+    def contains(self, word: str) -> bool:
+        """Pārbauda, vai vārds jau ir kešatmiņā."""
+        with self._lock:
+            return self._conn.execute(SELECT_EXISTS, (word.lower(),)).fetchone() is not None
+
+    #notīra visu kešatmiņu
+    def clear(self) -> None:
+        """Notīra visu kešatmiņu."""
+        with self._lock:
+            self._conn.execute(DELETE_ALL)
+
+    #iegūst kešatmiņā saglabāto ierakstu skaitu
+    def size(self) -> int:
+        """Iegūst kešatmiņā saglabāto ierakstu skaitu."""
+        with self._lock:
+            return self._conn.execute(SELECT_COUNT).fetchone()[0]
+
+    #SQLite pati nodrošina noturību, tāpēc nav ko gaidīt
+    def flush(self) -> None:
+        """Saderībai ar EtymologyCache; SQLite dati jau ir ierakstīti."""
+
+    #aizver datubāzes savienojumu
+    def close(self) -> None:
+        """Aizver datubāzes savienojumu."""
+        with self._lock:
+            self._conn.close()
+
+#vienreizēja esošās JSON kešatmiņas pārnešana uz SQLite datubāzi
+def migrate_json_cache(json_file: str, db_file: str) -> int:
+    """Pārnes etymology_cache.json (un tā žurnāla) ierakstus uz SQLite; atgriež pārnesto ierakstu skaitu."""
+    from src.data.etymology_cache import EtymologyCache
+
+    #JSON kešatmiņa pati atskaņo žurnālu, tāpēc pārnestais stāvoklis sakrīt ar to, ko redz spēle
+    source = EtymologyCache(json_file)
+    target = SqliteEtymologyCache(db_file)
+    rows = [
+        (
+            entry.word,
+            entry.text,
+            json.dumps(entry.origin_languages, ensure_ascii=False),
+            entry.correct_answer,
+            entry.cached_at,
+            entry.expires_at,
+            entry.revision_id
+        )
+        for entry in source.cache.values()
+    ]
+    with target._lock, target.batch():
+        target._conn.executemany(UPSERT, rows)
+    target.close()
+    return len(rows)
+
+#palaiž migrāciju no komandrindas: python -m src.data.sqlite_cache [json_fails] [db_fails]
+if __name__ == "__main__":
+    json_file = sys.argv[1] if len(sys.argv) > 1 else "etymology_cache.json"
+    db_file = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(json_file)[0] + ".db"
+    migrated = migrate_json_cache(json_file, db_file)
+    print(f"Migrated {migrated} entries from {json_file} to {db_file}")
@@ -0,0 +1,118 @@
+#mazs lokāls MediaWiki API aizstājējs: atbild uz HTTP GET pieprasījumiem ar dotā transporta atbildēm
+#(parasti ReplayTransport ar ierakstītajām atbildēm, simulētu aizturi un kļūdām), lai spēli un rīkus
+#varētu darbināt un slodzes testēt bez tīkla
+#palaišana no projekta saknes:
+#  python -m src.data.stub_server [--recordings DIR] [--port 8765] [--latency-ms 50] [--jitter-ms 0] [--error-rate 0.1] [--seed N]
+#un spēle: ROOTROULETTE_API_URL=http://127.0.0.1:8765/w/api.php python main.py
+
+import argparse
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from src.data.transport import DEFAULT_RECORDINGS_DIR, RecordingStore, ReplayTransport, Transport
+
+#noklusētā adrese
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+#cik savienojumu var gaidīt pieņemšanu; ThreadingHTTPServer noklusējums (5) paralēlu klientu savienojumus
+#liek atkārtot pēc ~1 s, kas sabojā aiztures mērījumus
+REQUEST_QUEUE_SIZE = 128
+
+#pavedienu serveris ar lielāku savienojumu rindu
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = REQUEST_QUEUE_SIZE
+
+#HTTP serveris fona pavedienā; katrs pieprasījums tiek apstrādāts atsevišķā pavedienā, tāpēc aizture netiek summēta
+class ApiServer:
+    def __init__(self, transport: Transport, host: str = DEFAULT_HOST, port: int = 0):
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/w/api.php"
+
+    def start(self) -> "ApiServer":
+        api_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with api_server._lock:
+                    api_server.requests += 1
+                query = parse_qs(urlparse(self.path).query)
+                params = {key: values[-1] for key, values in query.items()}
+                try:
+                    response = api_server.transport.get(api_server.url, params, timeout=60)
+                    status, body = response.status_code, response.content
+                except requests.RequestException as e:
+                    status, body = 504, f'{{"error": {{"code": "transport", "info": "{type(e).__name__}"}}}}'.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _Server((self.host, self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ApiServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "ApiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Local stand-in for the Wiktionary API serving recorded responses")
+    parser.add_argument("--recordings", default=DEFAULT_RECORDINGS_DIR, help="ierakstu direktorija")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-ms", type=float, default=0, help="aizture katrai atbildei")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="papildu nejauša aizture līdz šim lielumam")
+    parser.add_argument("--error-rate", type=float, default=0, help="503 atbilžu īpatsvars (0..1)")
+    parser.add_argument("--seed", type=int, default=None, help="nejaušības sēkla atkārtojamiem testiem")
+    args = parser.parse_args(argv)
+
+    transport = ReplayTransport(
+        RecordingStore(args.recordings),
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    server = ApiServer(transport, args.host, args.port).start()
+    print(f"Serving {args.recordings} at {server.url} (Ctrl+C to stop)")
+    print(f"ROOTROULETTE_API_URL={server.url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#maināms transports Wiktionary API pieprasījumiem (scrape2.api_request izmanto tikai Transport.get)
+#  http   - īsti HTTP pieprasījumi ar koplietotu sesiju (noklusējums)
+#  record - īsti pieprasījumi, kuru atbildes tiek saglabātas diskā (RecordingStore)
+#  replay - saglabātās atbildes bez tīkla, ar simulētu aizturi un kļūdu biežumu
+#izvēle no vides: ROOTROULETTE_TRANSPORT=http|record|replay, ROOTROULETTE_RECORDINGS=<direktorija>,
+#ROOTROULETTE_REPLAY_LATENCY_MS, ROOTROULETTE_REPLAY_JITTER_MS, ROOTROULETTE_REPLAY_ERROR_RATE, ROOTROULETTE_REPLAY_SEED
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+#noklusētā ierakstu direktorija
+DEFAULT_RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "recordings")
+
+#HTTP statuss, ar kuru replay simulē servera kļūdu (pārejoša, tātad tiek mēģināts vēlreiz)
+SIMULATED_ERROR_STATUS = 503
+
+#minimāla atbilde ar tādu pašu saskarni kā requests.Response, ko izmanto api_request un call_with_retry
+class TransportResponse:
+    __slots__ = ("status_code", "content", "url")
+
+    def __init__(self, status_code: int, content: bytes, url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+#transporta saskarne: viens GET pieprasījums uz API ar dotajiem parametriem
+class Transport:
+    def get(self, url: str, params: dict, timeout: float):
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+#īsti HTTP pieprasījumi; viena sesija ar savienojumu pūlu, ko atkārtoti izmanto paralēlie pieprasījumi
+class HttpTransport(Transport):
+    def __init__(self, headers: Optional[dict] = None, pool_size: int = 16):
+        self.headers = headers or {}
+        self.pool_size = pool_size
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.headers.update(self.headers)
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def get(self, url: str, params: dict, timeout: float) -> requests.Response:
+        return self.session.get(url, params=params, timeout=timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+#saglabātās API atbildes diskā - viens JSON fails katram ierakstam
+#action=query atbildes tiek saglabātas arī pa lapām, lai replay varētu atbildēt uz jebkuru ierakstīto lapu kombināciju
+class RecordingStore:
+    def __init__(self, directory: str = DEFAULT_RECORDINGS_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    #pieprasījuma atslēga nav atkarīga no parametru secības
+    @staticmethod
+    def request_key(params: dict) -> str:
+        return json.dumps(sorted((str(key), str(value)) for key, value in params.items()), ensure_ascii=False)
+
+    @staticmethod
+    def page_key(prop: str, title: str) -> str:
+        return json.dumps(["query-page", prop, title], ensure_ascii=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest()[:24] + ".json")
+
+    def save(self, key: str, record: dict) -> None:
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, **record}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return record if record.get("key") == key else None
+
+    #saglabā vienu atbildi; veiksmīgām action=query atbildēm - arī katru lapu atsevišķi
+    def record(self, params: dict, status_code: int, content: bytes) -> None:
+        body = content.decode("utf-8", errors="replace")
+        self.save(self.request_key(params), {"params": params, "status": status_code, "body": body})
+        if params.get("action") != "query" or status_code != 200:
+            return
+        try:
+            query = json.loads(body).get("query", {})
+        except json.JSONDecodeError:
+            return
+        prop = params.get("prop", "")
+        normalized_from = {item["to"]: item["from"] for item in query.get("normalized", [])}
+        for page in query.get("pages", []):
+            self.save(self.page_key(prop, page["title"]), {"page": page})
+            if page["title"] in normalized_from:
+                self.save(self.page_key(prop, normalized_from[page["title"]]), {"page": page})
+
+    #atbilde no ierakstiem: precīzs pieprasījums vai action=query, kas salikts no saglabātajām lapām
+    def replay(self, params: dict) -> Optional[TransportResponse]:
+        record = self.load(self.request_key(params))
+        if record is not None:
+            return TransportResponse(record["status"], record["body"].encode("utf-8"))
+        if params.get("action") != "query" or "titles" not in params:
+            return None
+
+        pages: List[dict] = []
+        normalized: List[Dict[str, str]] = []
+        for title in str(params["titles"]).split("|"):
+            page_record = self.load(self.page_key(params.get("prop", ""), title))
+            if page_record is None:
+                pages.append({"title": title, "missing": True})
+                continue
+            page = page_record["page"]
+            if page["title"] != title:
+                normalized.append({"from": title, "to": page["title"]})
+            pages.append(page)
+        query: dict = {"pages": pages}
+        if normalized:
+            query["normalized"] = normalized
+        return TransportResponse(200, json.dumps({"batchcomplete": True, "query": query}).encode("utf-8"))
+
+#izmanto cita transporta atbildes un saglabā tās diskā
+class RecordingTransport(Transport):
+    def __init__(self, inner: Transport, store: RecordingStore):
+        self.inner = inner
+        self.store = store
+
+    def get(self, url: str, params: dict, timeout: float):
+        response = self.inner.get(url, params, timeout)
+        try:
+            self.store.record(params, response.status_code, response.content)
+        except OSError as e:
+            print(f"Warning: Could not save API recording: {e}")
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+#atbild no ierakstiem bez tīkla; aizture un kļūdas ir nejaušas, bet ar seed - atkārtojamas
+#nejaušība ir atkarīga no pieprasījuma un tā kārtas numura, nevis no pavedienu secības, tāpēc arī paralēli klienti
+#ar to pašu seed saņem tās pašas kļūdas tiem pašiem pieprasījumiem
+class ReplayTransport(Transport):
+    def __init__(self, store: RecordingStore, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None, sleep=time.sleep):
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.sleep = sleep
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self._attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict, timeout: float) -> TransportResponse:
+        key = self.store.request_key(params)
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+        rng = random.Random(f"{self.seed}:{attempt}:{key}")
+        delay = self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        failed = self.error_rate > 0 and rng.random() < self.error_rate
+        if delay:
+            self.sleep(min(delay, timeout))
+            if delay > timeout:
+                raise requests.Timeout(f"Simulated timeout after {timeout}s")
+        if failed:
+            return TransportResponse(SIMULATED_ERROR_STATUS, b'{"error": {"code": "simulated"}}', url)
+
+        response = self.store.replay(params)
+        if response is None:
+            return TransportResponse(404, json.dumps({"error": {"code": "norecording", "info": str(params)}}).encode("utf-8"), url)
+        response.url = url
+        return response
+
+#izveido transportu pēc vides mainīgajiem; http ir jau izveidotais HttpTransport
+def transport_from_env(http: Transport) -> Transport:
+    mode = os.environ.get("ROOTROULETTE_TRANSPORT", "http")
+    if mode == "http":
+        return http
+    store = RecordingStore(os.environ.get("ROOTROULETTE_RECORDINGS", DEFAULT_RECORDINGS_DIR))
+    if mode == "record":
+        return RecordingTransport(http, store)
+    if mode == "replay":
+        seed = os.environ.get("ROOTROULETTE_REPLAY_SEED")
+        return ReplayTransport(
+            store,
+            latency=float(os.environ.get("ROOTROULETTE_REPLAY_LATENCY_MS", "0")) / 1000,
+            jitter=float(os.environ.get("ROOTROULETTE_REPLAY_JITTER_MS", "0")) / 1000,
+            error_rate=float(os.environ.get("ROOTROULETTE_REPLAY_ERROR_RATE", "0")),
+            seed=int(seed) if seed else None,
+        )
+    print(f"Warning: Unknown ROOTROULETTE_TRANSPORT '{mode}', using http")
+    return http
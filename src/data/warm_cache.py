@@ -0,0 +1,128 @@
+#iepriekš aizpilda etimoloģijas kešatmiņu visiem word_dict.json vārdiem, lai spēles laikā nebūtu jāiet tīklā
+#palaišana no projekta saknes: python -m src.data.warm_cache [--workers N] [--batch-size N]
+#progress tiek saglabāts kešatmiņā pēc katras grupas, tāpēc pārtrauktu palaišanu var vienkārši atkārtot -
+#jau kešotie vārdi tiek izlaisti, bet vārdi ar tīkla kļūdām tiek mēģināti vēlreiz
+
+import argparse
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+
+from src.data.scrape2 import QUERY_BATCH_SIZE, EtymologyResponse, Status, get_etymology_info_batch
+from src.services.etymology_service import DEFAULT_FETCH_WORKERS, EtymologyService
+
+#apkopo statistiku un izdrukā progresu
+class WarmStats:
+    def __init__(self, total: int):
+        self.total = total
+        self.hits = 0
+        self.fetched = 0
+        self.statuses: Counter = Counter()
+        self.failure_reasons: Counter = Counter()
+        self.started = time.perf_counter()
+
+    #vārdi sekundē, skaitot tikai no tīkla iegūtos vārdus
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.fetched / elapsed if elapsed else 0.0
+
+    def record(self, word: str, response: EtymologyResponse) -> None:
+        self.fetched += 1
+        self.statuses[response.status.name] += 1
+        if response.status != Status.SUCCESS:
+            #kļūdas iemesls bez konkrētā vārda, lai vienādus iemeslus varētu saskaitīt
+            self.failure_reasons[f"{response.status.name}: {response.message.replace(repr(word), '<word>')}"] += 1
+
+    def progress_line(self) -> str:
+        done = self.hits + self.fetched
+        return (
+            f"[{done}/{self.total}] hits={self.hits} fetched={self.fetched} "
+            f"ok={self.statuses['SUCCESS']} not_found={self.statuses['NOT_FOUND']} "
+            f"errors={self.statuses['ERROR']} {self.rate():.1f} words/s"
+        )
+
+    def print_summary(self) -> None:
+        elapsed = time.perf_counter() - self.started
+        print()
+        print(f"Words in dictionary: {self.total}")
+        print(f"Already cached (hits): {self.hits}")
+        print(f"Fetched (misses): {self.fetched} in {elapsed:.1f}s ({self.rate():.1f} words/s)")
+        for status, count in sorted(self.statuses.items()):
+            print(f"  {status}: {count}")
+        if self.failure_reasons:
+            print("Failure reasons:")
+            for reason, count in self.failure_reasons.most_common():
+                print(f"  {count:>5}  {reason}")
+
+#vārds jāpieprasa, ja tā nav kešatmiņā vai tā ieraksta derīguma termiņš ir beidzies
+def _needs_fetch(service: EtymologyService, word: str) -> bool:
+    cached = service.cache.get(word)
+    return cached is None or cached.is_expired()
+
+#sasilda kešatmiņu; atgriež statistiku
+def warm_cache(service: EtymologyService, workers: int = DEFAULT_FETCH_WORKERS,
+               batch_size: int = QUERY_BATCH_SIZE) -> WarmStats:
+    """Iegūst visus vēl nekešotos vārdus grupās; katra grupa tiek ierakstīta kešatmiņā vienā transakcijā."""
+    #MediaWiki API vienā pieprasījumā atgriež ne vairāk kā QUERY_BATCH_SIZE lapu
+    batch_size = max(1, min(batch_size, QUERY_BATCH_SIZE))
+    words = service.get_available_words()
+    stats = WarmStats(len(words))
+
+    #novecojuši negatīvie ieraksti tiek pieprasīti no jauna tāpat kā trūkstošie
+    misses = [word for word in words if _needs_fetch(service, word)]
+    stats.hits = len(words) - len(misses)
+    batches = [misses[start:start + batch_size] for start in range(0, len(misses), batch_size)]
+    print(f"{stats.hits} of {len(words)} words already cached, fetching {len(misses)} in {len(batches)} requests")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(get_etymology_info_batch, batch): batch for batch in batches}
+        try:
+            for future in as_completed(futures):
+                responses: Dict[str, EtymologyResponse] = future.result()
+
+                #tīkla kļūdas netiek kešotas, lai nākamā palaišana tos vārdus mēģinātu vēlreiz
+                with service.cache.batch():
+                    for word in futures[future]:
+                        response = responses[word]
+                        stats.record(word, response)
+                        if response.status != Status.ERROR:
+                            service.cache_response(word, response)
+                print(stats.progress_line())
+        except KeyboardInterrupt:
+            for pending in futures:
+                pending.cancel()
+            print("\nInterrupted - progress so far is saved, run again to resume")
+            stats.print_summary()
+            raise
+
+    service.cache.flush()
+    return stats
+
+#argparse tips: grupas izmērs no 1 līdz QUERY_BATCH_SIZE
+def _batch_size(value: str) -> int:
+    size = int(value)
+    if not 1 <= size <= QUERY_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {QUERY_BATCH_SIZE} (API limit per request)")
+    return size
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Warm the etymology cache for every word in word_dict.json")
+    parser.add_argument("--workers", type=int, default=DEFAULT_FETCH_WORKERS, help="paralēlo API pieprasījumu skaits")
+    parser.add_argument("--batch-size", type=_batch_size, default=QUERY_BATCH_SIZE,
+                        help=f"vārdu skaits vienā API pieprasījumā (1..{QUERY_BATCH_SIZE})")
+    parser.add_argument("--word-dict", default="src/data/data/word_dict.json")
+    parser.add_argument("--cache-file", default="etymology_cache.json")
+    args = parser.parse_args(argv)
+
+    service = EtymologyService(word_dict_file=args.word_dict, cache_file=args.cache_file)
+    try:
+        stats = warm_cache(service, workers=args.workers, batch_size=args.batch_size)
+    except KeyboardInterrupt:
+        return 130
+    stats.print_summary()
+    return 1 if stats.statuses["ERROR"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
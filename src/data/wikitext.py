@@ -0,0 +1,251 @@
+#izvelk angļu valodas etimoloģijas sadaļu no Wiktionary lapas wikiteksta (bez HTML renderēšanas)
+#vajadzīgs, jo action=query vienā pieprasījumā atgriež daudzu lapu wikitekstu, bet ne to HTML
+
+import re
+from typing import List, Optional, Tuple
+
+from src.data.etymology_types import normalize_etymology_text
+
+#Wiktionary valodu kodi, kas visbiežāk parādās etimoloģijās
+LANGUAGE_CODES = {
+    "en": "English", "enm": "Middle English", "ang": "Old English", "sco": "Scots",
+    "la": "Latin", "la-lat": "Late Latin", "la-med": "Medieval Latin", "la-new": "New Latin",
+    "la-vul": "Vulgar Latin", "LL.": "Late Latin", "ML.": "Medieval Latin", "NL.": "New Latin",
+    "VL.": "Vulgar Latin", "itc-pro": "Proto-Italic",
+    "grc": "Ancient Greek", "grc-koi": "Koine Greek", "gkm": "Byzantine Greek", "el": "Greek",
+    "fr": "French", "fro": "Old French", "frm": "Middle French", "xno": "Anglo-Norman",
+    "nrf": "Norman", "pro": "Old Occitan", "oc": "Occitan", "frk": "Frankish",
+    "non": "Old Norse", "is": "Icelandic", "da": "Danish", "sv": "Swedish", "no": "Norwegian",
+    "nb": "Norwegian Bokmål",
+    "de": "German", "goh": "Old High German", "gmh": "Middle High German", "gml": "Middle Low German",
+    "nds": "Low German", "nl": "Dutch", "dum": "Middle Dutch", "odt": "Old Dutch", "osx": "Old Saxon",
+    "yi": "Yiddish", "got": "Gothic", "gem-pro": "Proto-Germanic", "gmw-pro": "Proto-West Germanic",
+    "ine-pro": "Proto-Indo-European",
+    "it": "Italian", "es": "Spanish", "pt": "Portuguese", "ca": "Catalan", "ro": "Romanian",
+    "ga": "Irish", "sga": "Old Irish", "gd": "Scottish Gaelic", "cy": "Welsh", "br": "Breton",
+    "cel-pro": "Proto-Celtic",
+    "ru": "Russian", "pl": "Polish", "cs": "Czech", "sla-pro": "Proto-Slavic",
+    "fi": "Finnish", "hu": "Hungarian",
+    "ar": "Arabic", "he": "Hebrew", "hbo": "Biblical Hebrew", "arc": "Aramaic", "syc": "Classical Syriac",
+    "akk": "Akkadian", "egy": "Egyptian", "cop": "Coptic", "phn": "Phoenician",
+    "sa": "Sanskrit", "pi": "Pali", "hi": "Hindi", "ur": "Urdu", "bn": "Bengali", "ta": "Tamil",
+    "ml": "Malayalam", "fa": "Persian", "tr": "Turkish", "ota": "Ottoman Turkish",
+    "zh": "Chinese", "cmn": "Mandarin", "yue": "Cantonese", "ja": "Japanese", "ko": "Korean",
+    "vi": "Vietnamese", "ms": "Malay", "tl": "Tagalog", "sw": "Swahili",
+    "nah": "Nahuatl", "tpn": "Tupinambá", "mi": "Maori", "haw": "Hawaiian",
+}
+
+#valodu saimju kodi; Wiktionary tos attēlo ar saimes nosaukumu (piem., {{der|en|cel}} - "Celtic")
+FAMILY_CODES = {
+    "cel": "Celtic", "gem": "Germanic", "gmw": "West Germanic", "gmq": "North Germanic", "itc": "Italic",
+    "roa": "Romance", "grk": "Hellenic", "sla": "Slavic", "bat": "Baltic", "iir": "Indo-Iranian",
+    "inc": "Indo-Aryan", "ira": "Iranian", "ine": "Indo-European", "sem": "Semitic", "afa": "Afroasiatic",
+    "trk": "Turkic", "urj": "Uralic", "fiu": "Finno-Ugric", "bnt": "Bantu", "map": "Austronesian",
+}
+
+#veidnes, kuru 2. parametrs ir izcelsmes valoda (1. - mērķa valoda), un teksts, ko pievieno "+" varianti
+SOURCE_TEMPLATES = {
+    "inh": "", "inherited": "", "der": "", "derived": "", "bor": "", "borrowed": "",
+    "lbor": "learned borrowing from ", "learned borrowing": "learned borrowing from ",
+    "slbor": "semi-learned borrowing from ", "obor": "orthographic borrowing from ",
+    "ubor": "unadapted borrowing from ", "cal": "calque of ", "calque": "calque of ",
+    "pcal": "partial calque of ", "sl": "semantic loan of ", "psm": "phono-semantic matching of ",
+    "uder": "", "der?": "", "inh?": "", "bor?": "",
+    "inh+": "Inherited from ", "der+": "Derived from ", "bor+": "Borrowed from ",
+}
+
+#veidnes, kuru 1. parametrs ir valoda, bet tā nav izcelsmes valoda (saistīti vārdi)
+COGNATE_TEMPLATES = {"cog", "cognate", "noncog", "ncog", "noncognate"}
+
+#veidnes, kas attēlo tikai vārdu (1. parametrs - valoda, 2. - vārds)
+MENTION_TEMPLATES = {"m", "mention", "l", "link", "ll", "m+"}
+
+#veidnes, kas apvieno vārda daļas (1. parametrs - valoda, pārējie - daļas)
+AFFIX_TEMPLATES = {"af", "affix", "suffix", "suf", "prefix", "pre", "compound", "com", "surf", "confix", "con", "blend"}
+
+HEADING_RE = re.compile(r"^(={2,6})\s*(.*?)\s*\1\s*$", re.MULTILINE)
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+REF_RE = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
+
+#atgriež valodas nosaukumu pēc koda: valodas, saimes vai pirmvalodas (kods + "-pro") nosaukumu;
+#nezināmi kodi tiek izmesti, lai tie neparādītos tekstā un izcelsmes valodās
+def language_name(code: str) -> str:
+    code = code.strip()
+    name = LANGUAGE_CODES.get(code) or FAMILY_CODES.get(code) or LANGUAGE_CODES.get(code + "-pro")
+    return name or ""
+
+#sadala veidnes saturu parametros pēc "|", ignorējot ligzdotas veidnes un saites
+def _split_args(inner: str) -> List[str]:
+    args = []
+    depth = 0
+    current = []
+    i = 0
+    while i < len(inner):
+        pair = inner[i:i + 2]
+        if pair in ("{{", "[["):
+            depth += 1
+            current.append(pair)
+            i += 2
+            continue
+        if pair in ("}}", "]]"):
+            depth -= 1
+            current.append(pair)
+            i += 2
+            continue
+        if inner[i] == "|" and depth == 0:
+            args.append("".join(current))
+            current = []
+        else:
+            current.append(inner[i])
+        i += 1
+    args.append("".join(current))
+    return args
+
+#pārveido veidnes parametrus pozicionālos un nosauktos
+def _parse_args(args: List[str]) -> Tuple[List[str], dict]:
+    positional = []
+    named = {}
+    for arg in args:
+        key, sep, value = arg.partition("=")
+        if sep and re.fullmatch(r"[A-Za-z][\w-]*", key.strip()):
+            named[key.strip()] = value.strip()
+        else:
+            positional.append(arg.strip())
+    return positional, named
+
+#attēlo vārdu ar tā alternatīvo formu un tulkojumu, kā to dara Wiktionary
+def _render_term(positional: List[str], named: dict, first: int) -> str:
+    def arg(n: int) -> str:
+        return positional[n] if len(positional) > n else ""
+
+    term = arg(first + 1) or arg(first)
+    gloss = named.get("t") or named.get("gloss") or arg(first + 2)
+    tr = named.get("tr", "")
+    extras = [part for part in (tr, f"“{gloss}”" if gloss else "") if part]
+    return term + (f" ({', '.join(extras)})" if extras else "")
+
+#atveido vienu veidni tekstā un pievieno atrastās izcelsmes valodas
+def _render_template(inner: str, languages: List[str]) -> str:
+    args = _split_args(inner)
+    name = args[0].strip()
+    positional, named = _parse_args(args[1:])
+    key = name.lower()
+
+    def arg(n: int) -> str:
+        return positional[n] if len(positional) > n else ""
+
+    if key in SOURCE_TEMPLATES:
+        source = language_name(arg(1))
+        if source and source not in languages:
+            languages.append(source)
+        term = _render_term(positional, named, 2)
+        prefix = SOURCE_TEMPLATES[key]
+        return f"{prefix}{source} {term}".strip()
+    if key == "etyl":
+        source = language_name(arg(0))
+        if source and source not in languages:
+            languages.append(source)
+        return source
+    if key in COGNATE_TEMPLATES:
+        return f"{language_name(arg(0))} {_render_term(positional, named, 1)}".strip()
+    if key in MENTION_TEMPLATES:
+        return _render_term(positional, named, 1)
+    if key in AFFIX_TEMPLATES:
+        parts = [part for part in positional[1:] if part]
+        return " + ".join(parts)
+    if key in ("doublet", "dbt"):
+        parts = [part for part in positional[1:] if part]
+        if not parts:
+            return ""
+        listed = ", ".join(parts[:-1]) + " and " + parts[-1] if len(parts) > 1 else parts[0]
+        return "Doublet of " + listed
+    if key in ("w", "lang", "q", "qualifier", "i", "gloss", "gl"):
+        value = arg(1) if key == "lang" else arg(0)
+        return f"({value})" if key in ("q", "qualifier", "i", "gloss", "gl") else value
+    #pārējās veidnes (kategorijas, rfe, root u.c.) tekstā neparādās
+    return ""
+
+#aizstāj visas veidnes, sākot no iekšējām, un pēc tam saites un formatējumu
+def render_wikitext(text: str, languages: Optional[List[str]] = None) -> str:
+    """Pārveido wikitekstu vienkāršā tekstā; izcelsmes valodas tiek pievienotas languages sarakstam."""
+    if languages is None:
+        languages = []
+    text = COMMENT_RE.sub("", text)
+    text = REF_RE.sub("", text)
+
+    #veidnes tiek apstrādātas secīgi no kreisās puses, lai valodu secība sakristu ar teksta secību
+    out = []
+    stack: List[List[str]] = []
+    i = 0
+    while i < len(text):
+        pair = text[i:i + 2]
+        if pair == "{{":
+            stack.append([])
+            i += 2
+            continue
+        if pair == "}}" and stack:
+            inner = "".join(stack.pop())
+            rendered = _render_template(inner, languages)
+            (stack[-1] if stack else out).append(rendered)
+            i += 2
+            continue
+        (stack[-1] if stack else out).append(text[i])
+        i += 1
+    #neaizvērtas veidnes tiek izmestas
+    text = "".join(out)
+
+    text = re.sub(r"\[\[(?:[^\]|]*\|)?([^\]]*)\]\]", r"\1", text)
+    text = re.sub(r"\[https?://\S+\s*([^\]]*)\]", r"\1", text)
+    text = text.replace("'''", "").replace("''", "")
+    text = TAG_RE.sub("", text)
+    return re.sub(r"[ \t]+", " ", text).strip()
+
+#atrod sadaļas saturu starp virsrakstu un nākamo tāda paša vai augstāka līmeņa virsrakstu
+def _section(wikitext: str, match: re.Match) -> str:
+    level = len(match.group(1))
+    end = len(wikitext)
+    for following in HEADING_RE.finditer(wikitext, match.end()):
+        if len(following.group(1)) <= level:
+            end = following.start()
+            break
+    return wikitext[match.end():end]
+
+#izvelk angļu valodas etimoloģijas tekstu un izcelsmes valodas no lapas wikiteksta
+def extract_english_etymology(wikitext: str) -> Optional[Tuple[str, List[str]]]:
+    """Atgriež (teksts, izcelsmes valodas) vai None, ja lapai nav angļu valodas sadaļas.
+
+    Ja sadaļa ir, bet etimoloģijas nav, atgriež tukšu tekstu.
+    """
+    english = None
+    for match in HEADING_RE.finditer(wikitext):
+        if len(match.group(1)) == 2 and match.group(2) == "English":
+            english = _section(wikitext, match)
+            break
+    if english is None:
+        return None
+
+    etymology = None
+    for match in HEADING_RE.finditer(english):
+        if len(match.group(1)) in (3, 4) and match.group(2).startswith("Etymology"):
+            #etimoloģijas teksts beidzas pie jebkura nākamā virsraksta
+            following = HEADING_RE.search(english, match.end())
+            etymology = english[match.end():following.start() if following else len(english)]
+            break
+    if etymology is None:
+        return "", []
+
+    #rindkopas atdala tukšas rindas; saraksti, tabulas un atkāpes netiek ņemti vērā (tāpat kā HTML <p>)
+    languages: List[str] = []
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", etymology):
+        lines = [
+            line for line in block.split("\n")
+            if line.strip() and not line.lstrip().startswith(("*", "#", ":", ";", "{|", "|", "[[Category:", "[[File:", "[[Image:"))
+        ]
+        if not lines:
+            continue
+        rendered = render_wikitext(" ".join(lines), languages)
+        if rendered:
+            paragraphs.append(rendered)
+    return normalize_etymology_text("\n".join(paragraphs)), languages
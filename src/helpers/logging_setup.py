@@ -0,0 +1,134 @@
+#logi tiek rakstīti fona pavedienā: logger.info() Qt GUI pavedienā tikai ieliek ierakstu rindā (QueueHandler),
+#bet faila un termināļa I/O veic QueueListener pavediens
+#logu fails tiek rotēts pēc izmēra (vai katru dienu), vecie faili tiek dzēsti pēc LOG_RETENTION_DAYS dienām,
+#un ar format="json" katrs ieraksts ir viena JSON rinda, ko var analizēt bez regulārajām izteiksmēm
+#iestatījumi no vides: ROOTROULETTE_LOG_FORMAT=text|json, ROOTROULETTE_LOG_ROTATION=size|daily
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import pathlib
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+#teksta formāts terminālim un teksta logu failam
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+
+#logu faila nosaukums (bez paplašinājuma) un rotācijas robežas
+LOG_NAME = "rootroulette"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_RETENTION_DAYS = 14
+
+LOG_FORMAT = os.environ.get("ROOTROULETTE_LOG_FORMAT", "text")
+LOG_ROTATION = os.environ.get("ROOTROULETTE_LOG_ROTATION", "size")
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+#LogRecord lauki, kas nav "extra" - tie JSON ierakstā netiek dublēti
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+#formatē ierakstu kā vienu JSON rindu; logger.info(..., extra={...}) lauki tiek pievienoti kā atslēgas
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+#QueueHandler, kas izņēmuma tekstu atstāj laukā exc_text (nevis pievieno ziņojumam),
+#lai teksta formātā tas tiktu izdrukāts kā parasti, bet JSON formātā nonāktu laukā "exception"
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+#dzēš logu un metriku failus, kas vecāki par retention_days (arī agrākos session-*.log failus); atgriež dzēsto failu skaitu
+def prune_logs(logs_dir: pathlib.Path, retention_days: int = LOG_RETENTION_DAYS) -> int:
+    cutoff = time.time() - retention_days * 24 * 60 * 60
+    removed = 0
+    for path in [*logs_dir.glob("*.log*"), *logs_dir.glob("*.jsonl*"), *logs_dir.glob("metrics-*.json")]:
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+#izveido faila apdarinātāju ar rotāciju pēc izmēra vai katru pusnakti
+def _file_handler(log_file: pathlib.Path, rotation: str, backup_count: int, max_bytes: int) -> logging.Handler:
+    if rotation == "daily":
+        return logging.handlers.TimedRotatingFileHandler(
+            log_file, when="midnight", backupCount=backup_count, encoding="utf-8", delay=True
+        )
+    return logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+    )
+
+#iestata saknes logger ar rindu un palaiž fona klausītāju; atgriež klausītāju, kas jāaptur programmas beigās
+def configure_logging(logs_dir: pathlib.Path, level: int = logging.INFO, log_format: str = LOG_FORMAT,
+                      rotation: str = LOG_ROTATION, max_bytes: int = LOG_MAX_BYTES,
+                      backup_count: int = LOG_BACKUP_COUNT, retention_days: int = LOG_RETENTION_DAYS,
+                      stream=sys.stdout) -> logging.handlers.QueueListener:
+    """Visi logger izsaukumi tikai ievieto ierakstu rindā; rakstīšana failā un terminālī notiek QueueListener pavedienā."""
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    prune_logs(logs_dir, retention_days)
+
+    suffix = ".jsonl" if log_format == "json" else ".log"
+    log_file = logs_dir / f"{LOG_NAME}{suffix}"
+    file_handler = _file_handler(log_file, rotation, backup_count, max_bytes)
+    file_handler.setFormatter(JsonLinesFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+
+    handlers: List[logging.Handler] = [file_handler]
+    if stream is not None:
+        stream_handler = logging.StreamHandler(stream)
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handlers.append(stream_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener.start()
+    #rindā palikušie ieraksti tiek ierakstīti arī tad, ja programma beidzas bez stop_logging
+    atexit.register(stop_logging, listener)
+    logging.getLogger(__name__).info("Logging initialized. Log file: %s", log_file)
+    return listener
+
+#apstādina klausītāju (ieraksta visu rindā palikušo) un aizver apdarinātājus; drīkst izsaukt vairākas reizes
+def stop_logging(listener: Optional[logging.handlers.QueueListener]) -> None:
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
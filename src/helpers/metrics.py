@@ -0,0 +1,140 @@
+#procesa mēroga skaitītāji un laika mērījumi svarīgākajiem ceļiem (kešatmiņa, tīkls, parsēšana, ekrānu ielāde)
+#snapshot() atgriež pašreizējo kopsavilkumu, dump_metrics() to ieraksta JSON failā sesijas beigās,
+#lai dažādu versiju vai datoru rezultātus varētu salīdzināt
+#
+#nosaukumi ir ar punktiem atdalīti ("cache.get", "http.status.200"); mērījumi ir milisekundēs
+
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Deque, Dict, Iterator, List, Optional
+
+#cik pēdējo vērtību katram mērījumam tiek glabāts procentiļu aprēķinam
+SAMPLE_SIZE = 1024
+
+#viena mērījuma kopsavilkums; procentiles tiek aprēķinātas no pēdējām SAMPLE_SIZE vērtībām
+class Timing:
+    __slots__ = ("count", "total", "min", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.samples.append(value)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3),
+            "min_ms": round(self.min, 3),
+            "max_ms": round(self.max, 3),
+            "p50_ms": round(_percentile(ordered, 0.50), 3),
+            "p95_ms": round(_percentile(ordered, 0.95), 3),
+        }
+
+#procentile no sakārtota saraksta (tuvākā ranga metode)
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+#pavedienu drošs skaitītāju un mērījumu reģistrs
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._timings: Dict[str, Timing] = {}
+        self.started = time.time()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    #pievieno mērījumu milisekundēs
+    def observe(self, name: str, value_ms: float) -> None:
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = Timing()
+            timing.add(value_ms)
+
+    #mēra bloka izpildes laiku: with metrics.timer("cache.save"): ...
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - started) * 1000)
+
+    def snapshot(self) -> dict:
+        """Atgriež visu skaitītāju un mērījumu kopsavilkumu (var droši izsaukt jebkurā brīdī)."""
+        with self._lock:
+            return {
+                "counters": dict(sorted(self._counters.items())),
+                "timings": {name: timing.summary() for name, timing in sorted(self._timings.items())},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+            self.started = time.time()
+
+#viens reģistrs visam procesam
+registry = MetricsRegistry()
+
+def increment(name: str, amount: int = 1) -> None:
+    registry.increment(name, amount)
+
+def observe(name: str, value_ms: float) -> None:
+    registry.observe(name, value_ms)
+
+def timer(name: str):
+    return registry.timer(name)
+
+def snapshot() -> dict:
+    return registry.snapshot()
+
+#ieraksta kopsavilkumu ar sesijas informāciju JSON failā; atgriež faila ceļu vai None, ja neizdevās
+def dump_metrics(path, extra: Optional[dict] = None) -> Optional[str]:
+    """Ieraksta snapshot() rezultātu failā kopā ar sesijas ilgumu, Python versiju un platformu."""
+    finished = time.time()
+    report = {
+        "session": {
+            "started": datetime.fromtimestamp(registry.started).isoformat(timespec="seconds"),
+            "finished": datetime.fromtimestamp(finished).isoformat(timespec="seconds"),
+            "duration_s": round(finished - registry.started, 3),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            **(extra or {}),
+        },
+        **snapshot(),
+    }
+    path = os.fspath(path)
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return path
+    except OSError as e:
+        print(f"Warning: Could not write metrics file: {e}")
+        return None
@@ -0,0 +1,82 @@
+#ielādē Qt Designer ekrānus no iepriekš ģenerētām Python klasēm, nevis katru reizi parsējot .ui XML failu
+#ģenerēšana (build solis) no projekta saknes: python -m src.helpers.ui_loader
+#ja ģenerētā faila nav vai .ui fails ir jaunāks (izstrādes laikā), tiek izmantots uic.loadUi
+
+import importlib
+import logging
+import os
+import pathlib
+import sys
+import time
+from typing import Dict, Optional, Type
+
+from PyQt6.QtWidgets import QWidget
+
+from src.helpers import metrics
+
+logger = logging.getLogger(__name__)
+
+#projekta sakne un direktorija, kurā tiek meklēti .ui faili
+BASE_DIR = pathlib.Path(__file__).resolve().parent.parent.parent
+WIDGETS_DIR = BASE_DIR / "src" / "widgets"
+
+#ģenerētās klases tiek atrastas tikai vienreiz katram .ui failam
+_ui_classes: Dict[pathlib.Path, Optional[Type]] = {}
+
+#ģenerētā moduļa ceļš blakus .ui failam: GameWidget.ui -> ui_gamewidget.py
+def generated_path(ui_path: pathlib.Path) -> pathlib.Path:
+    return ui_path.with_name(f"ui_{ui_path.stem.lower()}.py")
+
+#importē ģenerēto Ui_* klasi; None, ja tās nav vai tā ir vecāka par .ui failu
+def _generated_class(ui_path: pathlib.Path) -> Optional[Type]:
+    if ui_path in _ui_classes:
+        return _ui_classes[ui_path]
+
+    ui_class = None
+    module_path = generated_path(ui_path)
+    if module_path.exists() and (not ui_path.exists() or module_path.stat().st_mtime >= ui_path.stat().st_mtime):
+        relative = module_path.relative_to(BASE_DIR).with_suffix("")
+        module = importlib.import_module(".".join(relative.parts))
+        ui_class = next((value for name, value in vars(module).items() if name.startswith("Ui_")), None)
+    _ui_classes[ui_path] = ui_class
+    return ui_class
+
+#uzbūvē .ui faila saturu dotajā logrīkā, tāpat kā uic.loadUi(ui_path, widget)
+def load_ui(widget: QWidget, ui_path) -> None:
+    """Uzbūvē ekrānu no ģenerētās klases; bērnelementi kļūst par widget atribūtiem tāpat kā ar uic.loadUi."""
+    started = time.perf_counter()
+    ui_path = pathlib.Path(ui_path).resolve()
+    ui_class = _generated_class(ui_path)
+    if ui_class is None:
+        logger.debug("No up-to-date generated UI for %s, using uic.loadUi", ui_path.name)
+        #uic (XML parsētājs un kompilators) tiek importēts tikai tad, ja ģenerētās klases nav
+        from PyQt6 import uic
+        uic.loadUi(str(ui_path), widget)
+        metrics.increment("ui.loadui")
+    else:
+        ui = ui_class()
+        ui.setupUi(widget)
+        for name, child in vars(ui).items():
+            setattr(widget, name, child)
+        metrics.increment("ui.generated")
+    metrics.observe(f"ui.load.{ui_path.stem}", (time.perf_counter() - started) * 1000)
+
+#ģenerē Python klases visiem src/widgets/*/*.ui failiem; atgriež ģenerēto failu skaitu
+def build_ui(widgets_dir: pathlib.Path = WIDGETS_DIR) -> int:
+    from PyQt6 import uic
+
+    built = 0
+    for ui_path in sorted(widgets_dir.glob("*/*.ui")):
+        module_path = generated_path(ui_path)
+        tmp_path = module_path.with_suffix(".py.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            uic.compileUi(str(ui_path), f)
+        os.replace(tmp_path, module_path)
+        print(f"{ui_path.relative_to(BASE_DIR)} -> {module_path.relative_to(BASE_DIR)}")
+        built += 1
+    return built
+
+if __name__ == "__main__":
+    count = build_ui()
+    print(f"Generated {count} UI modules")
+    sys.exit(0)
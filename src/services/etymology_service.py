@@ -3,21 +3,67 @@
 #randomizē valodu opcijas un nodrošina ērtu piekļuvi vārdu sarakstam un kešatmiņas informācijai
 
 import json
+import logging
 import os
 import random
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from src.data.scrape2 import get_etymology_info, EtymologyResponse, Status
-from src.data.etymology_cache import EtymologyCache, CachedEtymology
+from src.data.etymology_types import QUERY_BATCH_SIZE, EtymologyResponse, Status
+from src.data.etymology_cache import open_etymology_cache, CachedEtymology, intern_languages, language_names
 
-#datu klase, kas satur pilnu vārda informāciju
-@dataclass 
+logger = logging.getLogger(__name__)
+
+#tīkla un HTML parsēšanas modulis (requests, bs4) tiek ielādēts tikai pie pirmās kešatmiņas kļūdas,
+#tāpēc spēle, kurai visi vārdi jau ir kešatmiņā, to neielādē vispār
+def _scrape():
+    from src.data import scrape2
+    return scrape2
+
+#cik API pieprasījumu vienlaikus drīkst sūtīt uz Wiktionary
+DEFAULT_FETCH_WORKERS = 8
+
+#teksts, ko saglabā vārdiem, kuriem etimoloģiju neizdevās iegūt
+NOT_AVAILABLE_TEXT = "Etymology information not available for '{word}'."
+
+#cik ilgi (sekundēs) derīgs ir ieraksts par to, ka vārdam Wiktionary nav etimoloģijas
+NEGATIVE_CACHE_TTL = 7 * 24 * 60 * 60
+
+#nemainīga klase, kas satur pilnu vārda informāciju (bez __dict__, valodas - kā koplietoti numuri)
 class WordData:
-    word: str
-    correct_language: str
-    etymology_text: str
-    origin_languages: List[str]
+    __slots__ = ("word", "correct_language", "etymology_text", "_languages")
+
+    def __init__(self, word: str, correct_language: str, etymology_text: str, origin_languages: Iterable[str]):
+        set_slot = object.__setattr__
+        set_slot(self, "word", word)
+        set_slot(self, "correct_language", correct_language)
+        set_slot(self, "etymology_text", etymology_text)
+        set_slot(self, "_languages", intern_languages(origin_languages))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"WordData is immutable, cannot set '{name}'")
+
+    #copy un pickle izmanto konstruktora argumentus ar valodu nosaukumiem, nevis procesa iekšējiem numuriem
+    def __reduce__(self):
+        return (WordData, (self.word, self.correct_language, self.etymology_text, self.origin_languages))
+
+    @property
+    def origin_languages(self) -> List[str]:
+        return language_names(self._languages)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WordData):
+            return NotImplemented
+        return (self.word, self.correct_language, self.etymology_text, self._languages) == \
+            (other.word, other.correct_language, other.etymology_text, other._languages)
+
+    def __hash__(self) -> int:
+        return hash((self.word, self.correct_language, self.etymology_text, self._languages))
+
+    def __repr__(self) -> str:
+        return (f"WordData(word={self.word!r}, correct_language={self.correct_language!r}, "
+                f"etymology_text={self.etymology_text!r}, origin_languages={self.origin_languages!r})")
 
 #grupē pareižo atbilžu burtus ar pilniem valodu nosaukumiem
 class EtymologyService:
@@ -36,12 +82,32 @@ class EtymologyService:
         'Arabic', 'Hebrew', 'Celtic', 'Slavic'
     ]
     
-    #sāk ar vārdu vārdnīcu un kešatmiņu
-    def __init__(self, word_dict_file: str = "src/data/data/word_dict.json", cache_file: str = "etymology_cache.json"):
+    #sāk ar vārdu vārdnīcu un kešatmiņu (cache_file ar .db paplašinājumu izmanto SQLite krātuvi)
+    #seed ļauj atkārtot vienu un to pašu vārdu izlasi (piemēram, testos vai simulācijās)
+    def __init__(self, word_dict_file: str = "src/data/data/word_dict.json", cache_file: str = "etymology_cache.json",
+                 seed: Optional[int] = None):
         self.word_dict_file = word_dict_file
-        self.cache = EtymologyCache(cache_file)
+        self.cache = open_etymology_cache(cache_file)
         self.word_dict = self._load_word_dict()
+
+        #vārdu masīvs tiek izveidots vienreiz; izlases laikā tas tiek daļēji sajaukts uz vietas
+        self.rng = random.Random(seed)
+        self._word_keys: List[str] = list(self.word_dict.keys())
+        self._sample_lock = threading.Lock()
+
+        #vārdi, par kuriem jau zināms, ka tiem nav etimoloģijas
+        self._unavailable: Set[str] = set()
+
+        #novecojuši negatīvie ieraksti, kurus fona pavediens pieprasīs no jauna
+        self._refresh_lock = threading.Lock()
+        self._refresh_pending: Set[str] = set()
+        self._refresh_running = False
     
+    #pārbauda, vai kešatmiņas ieraksts ir saglabāts negatīvais ieraksts
+    @staticmethod
+    def _is_unavailable_entry(word: str, cached_etymology: CachedEtymology) -> bool:
+        return not cached_etymology.origin_languages and cached_etymology.text == NOT_AVAILABLE_TEXT.format(word=word)
+
     #nolasa un ielādē sākotnējo vārdu vārdnīcu
     def _load_word_dict(self) -> Dict[str, str]:
         """Load the seed word dictionary."""
@@ -58,9 +124,35 @@ class EtymologyService:
     #randomizēta vārda iegūšana no vārdnīcas
     def get_random_word(self) -> Optional[str]:
         """Iegūst nejaušu vārdu no vārdnīcas."""
-        if not self.word_dict:
+        if not self._word_keys:
             return None
-        return random.choice(list(self.word_dict.keys()))
+        return self.rng.choice(self._word_keys)
+
+    #izvēlas n dažādus vārdus bez atkārtošanās (daļēja Fišera-Jeitsa sajaukšana)
+    def get_random_words(self, n: int, exclude: Iterable[str] = ()) -> List[str]:
+        """Izvēlas n dažādus nejaušus vārdus, izlaižot exclude un vārdus bez etimoloģijas.
+
+        Izmaksas ir atkarīgas no n un izlaisto vārdu skaita, nevis no vārdnīcas izmēra.
+        Ja pietiekami daudz vārdu nav, uzreiz izmet ValueError.
+        """
+        excluded = {word for word in exclude if word in self.word_dict}
+        with self._sample_lock:
+            skipped = excluded | self._unavailable
+            available = len(self._word_keys) - len(skipped)
+            if n > available:
+                raise ValueError(f"Only {available} words available, {n} requested")
+
+            #katrā solī nejaušs vārds no vēl neapskatītās daļas tiek pārvietots uz pozīciju i
+            keys = self._word_keys
+            chosen: List[str] = []
+            i = 0
+            while len(chosen) < n:
+                j = self.rng.randrange(i, len(keys))
+                keys[i], keys[j] = keys[j], keys[i]
+                if keys[i] not in skipped:
+                    chosen.append(keys[i])
+                i += 1
+            return chosen
     
     #iegūst pareizo valodu, pamatojoties uz burtu kodu
     def get_correct_language(self, word: str) -> Optional[str]:
@@ -87,35 +179,40 @@ class EtymologyService:
         random.shuffle(options)
         return options
     
-    #iegūst pilnu vārda informāciju, tai skaitā etimoloģiju no kešatmiņas vai API
-    async def get_word_data(self, word: str) -> Optional[WordData]:
-        """Iegūst pilnu vārda informāciju, tai skaitā etimoloģiju no kešatmiņas vai API."""
-        correct_language = self.get_correct_language(word)
-        if not correct_language:
-            return None
-        
-        #sākumā mēģina iegūt no kešatmiņas
-        cached_etymology = self.cache.get(word)
-        if cached_etymology:
-            return WordData(
-                word=word,
-                correct_language=correct_language,
-                etymology_text=cached_etymology.text,
-                origin_languages=cached_etymology.origin_languages
-            )
-        
-        #ja nav kešatmiņā, iegūst no API
-        etymology_response = get_etymology_info(word)
-        
+    #pārveido kešatmiņas ierakstu par pilnu vārda informāciju
+    def _word_data_from_cache(self, word: str, correct_language: str, cached_etymology: CachedEtymology) -> WordData:
+        if self._is_unavailable_entry(word, cached_etymology):
+            self._unavailable.add(word)
+
+            #novecojis negatīvais ieraksts (vai vecs ieraksts bez termiņa) tiek izmantots, bet fonā atjaunots
+            if cached_etymology.expires_at is None or cached_etymology.is_expired():
+                self._schedule_refresh(word)
+        return WordData(
+            word=word,
+            correct_language=correct_language,
+            etymology_text=cached_etymology.text,
+            origin_languages=cached_etymology.origin_languages
+        )
+
+    #saglabā API atbildi kešatmiņā un atgriež vārda informāciju
+    def _store_response(self, word: str, correct_language: str, etymology_response: EtymologyResponse) -> WordData:
+        """Saglabā API atbildi kešatmiņā.
+
+        NOT_FOUND tiek saglabāts kā negatīvs ieraksts ar NEGATIVE_CACHE_TTL, bet tīkla kļūdas (ERROR) netiek kešotas,
+        lai nākamais pieprasījums vārdu mēģinātu vēlreiz.
+        """
+
         #ja viss norit veiksmīgi, saglabā kešatmiņā un atgriež datus
         if etymology_response.status == Status.SUCCESS and etymology_response.data:
             self.cache.put(
                 word=word,
                 text=etymology_response.data.text,
                 origin_languages=etymology_response.data.origin_languages,
-                correct_answer=self.word_dict[word]
+                correct_answer=self.word_dict[word],
+                revision_id=etymology_response.data.revision_id
             )
-            
+            self._unavailable.discard(word)
+
             #izpildās, kad dati ir veiksmīgi iegūti
             return WordData(
                 word=word,
@@ -123,23 +220,78 @@ class EtymologyService:
                 etymology_text=etymology_response.data.text,
                 origin_languages=etymology_response.data.origin_languages
             )
-        else:
-            #saglabā tukšu rezultātu, lai izvairītos no atkārtotiem API pieprasījumiem problemātiskiem vārdiem
+
+        #saglabā tukšu rezultātu uz laiku, lai izvairītos no atkārtotiem API pieprasījumiem vārdiem bez etimoloģijas
+        if etymology_response.status != Status.ERROR:
             self.cache.put(
                 word=word,
-                text=f"Etymology information not available for '{word}'.",
+                text=NOT_AVAILABLE_TEXT.format(word=word),
                 origin_languages=[],
-                correct_answer=self.word_dict[word]
+                correct_answer=self.word_dict[word],
+                ttl=NEGATIVE_CACHE_TTL,
+                revision_id=etymology_response.data.revision_id if etymology_response.data else None
             )
-            
-            #izpildās, kad dati nav pieejami
-            return WordData(
-                word=word,
-                correct_language=correct_language,
-                etymology_text=f"Etymology information not available for '{word}'.",
-                origin_languages=[]
-            )
-    
+            self._unavailable.add(word)
+
+        #izpildās, kad dati nav pieejami
+        return WordData(
+            word=word,
+            correct_language=correct_language,
+            etymology_text=NOT_AVAILABLE_TEXT.format(word=word),
+            origin_languages=[]
+        )
+
+    #saglabā jau iegūtu API atbildi kešatmiņā (piemēram, no kešatmiņas sasildīšanas rīka)
+    def cache_response(self, word: str, etymology_response: EtymologyResponse) -> Optional[WordData]:
+        """Saglabā API atbildi kešatmiņā un atgriež vārda datus; None, ja vārda nav vārdnīcā."""
+        correct_language = self.get_correct_language(word)
+        if not correct_language:
+            return None
+        return self._store_response(word, correct_language, etymology_response)
+
+    #iegūst pilnu vārda informāciju, tai skaitā etimoloģiju no kešatmiņas vai API
+    async def get_word_data(self, word: str) -> Optional[WordData]:
+        """Iegūst pilnu vārda informāciju, tai skaitā etimoloģiju no kešatmiņas vai API."""
+        correct_language = self.get_correct_language(word)
+        if not correct_language:
+            return None
+
+        #sākumā mēģina iegūt no kešatmiņas
+        cached_etymology = self.cache.get(word)
+        if cached_etymology:
+            return self._word_data_from_cache(word, correct_language, cached_etymology)
+
+        #ja nav kešatmiņā, iegūst no API, nebloķējot notikumu cilpu; arī kešatmiņas ieraksts (fsync) notiek pavedienā
+        #(asyncio tiek importēts tikai asinhronajās metodēs, jo Qt spēle tās neizmanto)
+        import asyncio
+        etymology_response = await _scrape().get_etymology_info_async(word)
+        return await asyncio.to_thread(self._store_response, word, correct_language, etymology_response)
+
+    #asinhroni iegūst vairāku vārdu datus; trūkstošos vārdus pieprasa grupās, izpildot ne vairāk kā concurrency grupas vienlaikus
+    async def get_many_word_data(self, words: List[str], concurrency: int = DEFAULT_FETCH_WORKERS) -> List[Optional[WordData]]:
+        """Asinhroni iegūst vārdu datus tādā pašā secībā kā words, ierobežojot vienlaicīgo pieprasījumu skaitu."""
+        results, misses = self._resolve_cached(words)
+        if not misses:
+            return results
+
+        import asyncio
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        batches = self._miss_batches(misses)
+
+        async def fetch(executor: ThreadPoolExecutor, batch: List[str]) -> Dict[str, EtymologyResponse]:
+            async with semaphore:
+                return await loop.run_in_executor(executor, _scrape().get_etymology_info_batch, batch)
+
+        #noklusētais izpildītājs ir ierobežots ar CPU skaitu (+4), tāpēc pieprasījumiem tiek izveidots savs ar concurrency pavedieniem
+        responses: Dict[str, EtymologyResponse] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(batches)))) as executor:
+            for batch_responses in await asyncio.gather(*(fetch(executor, batch) for batch in batches)):
+                responses.update(batch_responses)
+
+        await asyncio.to_thread(self._store_misses, results, misses, responses)
+        return results
+
     #sinhroni atgriež vārda datus ērtākai integrācijai
     def get_word_data_sync(self, word: str) -> Optional[WordData]:
         """Sinhroni atgriež vārda datus ērtākai integrācijai."""
@@ -148,60 +300,126 @@ class EtymologyService:
         correct_language = self.get_correct_language(word)
         if not correct_language:
             return None
-        
+
         #vispirms pārbauda kešatmiņu
         cached_etymology = self.cache.get(word)
         if cached_etymology:
-            return WordData(
-                word=word,
-                correct_language=correct_language,
-                etymology_text=cached_etymology.text,
-                origin_languages=cached_etymology.origin_languages
-            )
-        
+            return self._word_data_from_cache(word, correct_language, cached_etymology)
+
         #ja nav kešatmiņā, iegūst no API
-        etymology_response = get_etymology_info(word)
-        
-        #ja viss norit veiksmīgi, saglabā kešatmiņā un atgriež datus
-        if etymology_response.status == Status.SUCCESS and etymology_response.data:
-            self.cache.put(
-                word=word,
-                text=etymology_response.data.text,
-                origin_languages=etymology_response.data.origin_languages,
-                correct_answer=self.word_dict[word]
-            )
-            
-            #izpildās, kad dati ir veiksmīgi iegūti
-            return WordData(
-                word=word,
-                correct_language=correct_language,
-                etymology_text=etymology_response.data.text,
-                origin_languages=etymology_response.data.origin_languages
-            )
-        
-        #saglabā tukšu rezultātu, lai izvairītos no atkārtotiem API pieprasījumiem problemātiskiem vārdiem
-        else:
-            self.cache.put(
-                word=word,
-                text=f"Etymology information not available for '{word}'.",
-                origin_languages=[],
-                correct_answer=self.word_dict[word]
-            )
-            
-            #izpildās, kad dati nav pieejami
-            return WordData(
-                word=word,
-                correct_language=correct_language,
-                etymology_text=f"Etymology information not available for '{word}'.",
-                origin_languages=[]
-            )
-    
+        etymology_response = _scrape().get_etymology_info(word)
+        return self._store_response(word, correct_language, etymology_response)
+
+    #sadala vārdus kešatmiņas trāpījumos (uzreiz pārveidotos par WordData) un trūkstošajos
+    def _resolve_cached(self, words: List[str]) -> Tuple[List[Optional[WordData]], List[Tuple[int, str, str]]]:
+        results: List[Optional[WordData]] = [None] * len(words)
+        misses: List[Tuple[int, str, str]] = []
+
+        for index, word in enumerate(words):
+            correct_language = self.get_correct_language(word)
+            if not correct_language:
+                continue
+
+            cached_etymology = self.cache.get(word)
+            if cached_etymology:
+                results[index] = self._word_data_from_cache(word, correct_language, cached_etymology)
+            else:
+                misses.append((index, word, correct_language))
+        return results, misses
+
+    #sadala trūkstošos vārdus API pieprasījuma izmēra grupās
+    @staticmethod
+    def _miss_batches(misses: List[Tuple[int, str, str]]) -> List[List[str]]:
+        miss_words = list(dict.fromkeys(word for _, word, _ in misses))
+        return [
+            miss_words[start:start + QUERY_BATCH_SIZE]
+            for start in range(0, len(miss_words), QUERY_BATCH_SIZE)
+        ]
+
+    #saglabā iegūtās atbildes vienā kešatmiņas transakcijā un aizpilda rezultātu sarakstu
+    def _store_misses(self, results: List[Optional[WordData]], misses: List[Tuple[int, str, str]],
+                      responses: Dict[str, EtymologyResponse]) -> None:
+        with self.cache.batch():
+            for index, word, correct_language in misses:
+                results[index] = self._store_response(word, correct_language, responses[word])
+
+    #iegūst vairāku vārdu datus: kešatmiņas trāpījumus uzreiz, trūkstošos - grupētos API pieprasījumos
+    def get_words_data_sync(self, words: List[str], max_workers: int = DEFAULT_FETCH_WORKERS,
+                            on_result: Optional[Callable[[int, WordData], None]] = None) -> List[Optional[WordData]]:
+        """Iegūst vārdu datus tādā pašā secībā kā words; trūkstošos vārdus pieprasa grupās, grupas - paralēli.
+
+        on_result(index, data) tiek izsaukts, tiklīdz katrs vārds ir gatavs (trāpījumi - uzreiz, pārējie - pēc grupas).
+        """
+        results, misses = self._resolve_cached(words)
+        if on_result:
+            for index, data in enumerate(results):
+                if data:
+                    on_result(index, data)
+        if not misses:
+            return results
+
+        #katra grupa ir viens action=query pieprasījums; vairākas grupas tiek pieprasītas paralēli
+        batches = self._miss_batches(misses)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            futures = [executor.submit(_scrape().get_etymology_info_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                responses = future.result()
+                batch_misses = [miss for miss in misses if miss[1] in responses]
+                self._store_misses(results, batch_misses, responses)
+                if on_result:
+                    for index, _, _ in batch_misses:
+                        if results[index]:
+                            on_result(index, results[index])
+        return results
+
+    #pievieno vārdu fona atjaunošanas rindai un, ja vajag, palaiž atjaunošanas pavedienu
+    def _schedule_refresh(self, word: str) -> None:
+        with self._refresh_lock:
+            self._refresh_pending.add(word)
+            if self._refresh_running:
+                return
+            self._refresh_running = True
+        threading.Thread(target=self._refresh_expired, name="EtymologyRefresh", daemon=True).start()
+
+    #fona pavediens: pieprasa novecojušos negatīvos ierakstus grupās, līdz rinda ir tukša
+    def _refresh_expired(self) -> None:
+        while True:
+            with self._refresh_lock:
+                words = list(self._refresh_pending)[:QUERY_BATCH_SIZE]
+                if not words:
+                    self._refresh_running = False
+                    return
+                self._refresh_pending.difference_update(words)
+
+            try:
+                responses = _scrape().get_etymology_info_batch(words)
+                with self.cache.batch():
+                    for word in words:
+                        correct_language = self.get_correct_language(word)
+                        if correct_language:
+                            self._store_response(word, correct_language, responses[word])
+            except Exception as e:
+                logger.warning("Could not refresh expired etymology entries: %s", e)
+
     #iegūst visu pieejamo vārdu sarakstu
     def get_available_words(self) -> List[str]:
         """Iegūst visu pieejamo vārdu sarakstu."""
-        return list(self.word_dict.keys())
+        return list(self._word_keys)
     
     #iegūst kešatmiņas statistiku
     def get_cache_info(self) -> Tuple[int, int]:
         """Iegūst kešatmiņas statistiku: (kešotie_vārdi, kopējie_vārdi)."""
-        return (self.cache.size(), len(self.word_dict))
\ No newline at end of file
+        return (self.cache.size(), len(self.word_dict))
+
+_shared_service: Optional[EtymologyService] = None
+_shared_service_lock = threading.Lock()
+
+#atgriež vienu koplietotu servisu visam procesam; vārdnīca un kešatmiņa tiek ielādētas tikai pirmajā izsaukumā
+def get_shared_service() -> EtymologyService:
+    """Atgriež procesa koplietoto EtymologyService; drīkst izsaukt gan no GUI, gan no ielādes pavediena."""
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = EtymologyService()
+    return _shared_service
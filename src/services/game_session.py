@@ -0,0 +1,103 @@
+#spēles loģika bez grafiskās saskarnes: raundi, punkti, atbilžu opcijas un pareizo/nepareizo vārdu saraksti
+#to izmanto GameWidget, scrape2 komandrindas spēle un spēļu simulators (benchmarks/simulate_games.py)
+#vārdi tiek pievienoti ar add_word, kad tie ir ielādēti; next_round paņem nākamo, guess novērtē atbildi
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Iterable, List, Optional
+
+from src.services.etymology_service import EtymologyService, WordData, get_shared_service
+
+#spēles rezultāts, ko saņem beigu ekrāns
+@dataclass
+class GameResult:
+    score: int
+    total_rounds: int
+    correct_words: List[str] = field(default_factory=list)
+    incorrect_words: List[str] = field(default_factory=list)
+
+#vienas spēles stāvoklis
+class GameSession:
+    def __init__(self, total_rounds: int, pool: Optional[Iterable[WordData]] = None,
+                 service: Optional[EtymologyService] = None):
+        self.service = service
+        self.total_rounds = total_rounds
+        self.current_round = 0
+        self.score = 0
+
+        #vārdi pienāk pa vienam no ielādes; raundi tos ņem no sākuma
+        #sākuma ekrānā sagatavots krājums nodrošina pirmos raundus bez gaidīšanas
+        self.word_queue: Deque[WordData] = deque(pool or [])
+        self.loaded_count = len(self.word_queue)
+        self.loading_done = False
+        self.waiting_for_word = False
+        self.finished = False
+
+        self.current_word: Optional[WordData] = None
+        self.options: List[str] = []
+        self.answered = False
+
+        self.correct_words: List[str] = []
+        self.incorrect_words: List[str] = []
+
+    #cik vārdu vēl jāielādē, lai pietiktu visiem raundiem
+    def words_needed(self) -> int:
+        return max(0, self.total_rounds - len(self.word_queue))
+
+    #vārdi, kas jau ir rindā (ielāde tos nedrīkst izvēlēties vēlreiz)
+    def queued_words(self) -> List[str]:
+        return [data.word for data in self.word_queue]
+
+    #pievieno ielādētu vārdu; atgriež True, ja spēle to gaidīja un var sākt nākamo raundu
+    def add_word(self, data: WordData) -> bool:
+        self.word_queue.append(data)
+        self.loaded_count += 1
+        return self.current_word is None or self.waiting_for_word
+
+    #atzīmē, ka ielāde beigusies; atgriež True, ja spēle gaidīja vārdu (tad next_round to pabeigs)
+    def finish_loading(self) -> bool:
+        self.loading_done = True
+        return self.waiting_for_word
+
+    #sāk nākamo raundu un atgriež tā vārdu; None - spēle ir beigusies (finished) vai jāgaida vārds (waiting_for_word)
+    def next_round(self) -> Optional[WordData]:
+        """Paņem nākamo vārdu no rindas un sagatavo atbilžu opcijas."""
+        if self.finished:
+            return None
+        if self.current_round >= self.total_rounds:
+            self.finished = True
+            return None
+
+        if not self.word_queue and self.loading_done:
+            #ielāde atgrieza mazāk vārdu nekā raundu; spēle beidzas ar nospēlētajiem
+            self.total_rounds = self.current_round
+            self.finished = True
+            return None
+
+        if not self.word_queue:
+            self.waiting_for_word = True
+            return None
+
+        self.waiting_for_word = False
+        self.current_word = self.word_queue.popleft()
+        self.current_round += 1
+        self.answered = False
+        service = self.service or get_shared_service()
+        self.options = service.get_language_options(self.current_word.correct_language)
+        return self.current_word
+
+    #novērtē atbildi pašreizējā raundā; atgriež True, ja tā ir pareiza
+    def guess(self, language: str) -> bool:
+        """Ieskaita atbildi; katrā raundā var atbildēt tikai vienreiz."""
+        if self.current_word is None or self.answered:
+            raise ValueError("No round is waiting for an answer")
+        self.answered = True
+        if language == self.current_word.correct_language:
+            self.score += 1
+            self.correct_words.append(self.current_word.word)
+            return True
+        self.incorrect_words.append(self.current_word.word)
+        return False
+
+    def result(self) -> GameResult:
+        return GameResult(self.score, self.total_rounds, list(self.correct_words), list(self.incorrect_words))
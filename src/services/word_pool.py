@@ -0,0 +1,140 @@
+#fonā sagatavo nākamās spēles vārdu krājumu, kamēr spēlētājs atrodas sākuma vai beigu ekrānā
+#tīrs threading modulis bez Qt, lai to varētu izmantot arī ārpus grafiskās saskarnes
+
+import logging
+import math
+import threading
+from typing import List, Optional, Set
+
+from src.data.etymology_types import QUERY_BATCH_SIZE
+from src.services.etymology_service import DEFAULT_FETCH_WORKERS, EtymologyService, WordData, get_shared_service
+
+logger = logging.getLogger(__name__)
+
+#lielākā raundu izvēle sākuma ekrānā - tik vārdu krājumā tiek sagatavots pēc noklusējuma
+DEFAULT_POOL_SIZE = 20
+
+#cik vārdu iegūt vienā solī; pēc katra soļa tiek pārbaudīta atcelšana un mērķa izmērs
+FILL_STEP = 5
+
+#cik API pieprasījumu un cik etimoloģijas teksta (rakstzīmēs) krājums drīkst izmantot
+MAX_POOL_REQUESTS = 10
+MAX_POOL_CHARS = 200_000
+
+#sagatavo gatavu WordData krājumu atsevišķā pavedienā
+class WordPoolPrefetcher:
+
+    def __init__(self, service: Optional[EtymologyService] = None, max_requests: int = MAX_POOL_REQUESTS,
+                 max_chars: int = MAX_POOL_CHARS, max_workers: int = DEFAULT_FETCH_WORKERS):
+        #ja serviss nav dots, koplietotais serviss tiek iegūts fona pavedienā, lai kešatmiņas ielāde nebloķētu UI
+        self.service = service
+        self.max_requests = max_requests
+        self.max_chars = max_chars
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._ready: List[WordData] = []
+        #vārdi, kurus kāds pavediens pašlaik iegūst; atcelts pavediens var vēl būt soļa vidū, kad start() palaiž jaunu
+        self._in_flight: Set[str] = set()
+        self._target = 0
+        self._requests = 0
+        self._cancel = threading.Event()
+        self._running = False
+
+    #cik etimoloģijas teksta krājums aizņem
+    def _pool_chars(self) -> int:
+        return sum(len(data.etymology_text) for data in self._ready)
+
+    #cik vārdu krājumam vēl trūkst (izsauc, turot slēdzeni)
+    def _missing_words(self) -> int:
+        if self._pool_chars() >= self.max_chars:
+            return 0
+        return max(0, self._target - len(self._ready))
+
+    #sāk (vai turpina) krājuma aizpildīšanu līdz size vārdiem
+    def start(self, size: int = DEFAULT_POOL_SIZE) -> None:
+        """Sāk krājuma aizpildīšanu fonā; ja pavediens jau darbojas, tikai maina mērķa izmēru."""
+        with self._lock:
+            self._target = size
+            if self._running and not self._cancel.is_set():
+                return
+            #pieprasījumu budžets attiecas uz vienu aizpildīšanas reizi
+            self._requests = 0
+            self._running = True
+            self._cancel = threading.Event()
+            threading.Thread(target=self._run, args=(self._cancel,), name="word-pool", daemon=True).start()
+
+    #maina krājuma mērķa izmēru (piemēram, kad spēlētājs izvēlas raundu skaitu)
+    def resize(self, size: int) -> None:
+        """Maina mērķa izmēru; jau sagatavotie vārdi netiek izmesti."""
+        self.start(size)
+
+    #aptur aizpildīšanu; jau sagatavotie vārdi paliek krājumā
+    def cancel(self) -> None:
+        """Aptur fona pavedienu pēc pašreizējā soļa."""
+        self._cancel.set()
+
+    #izņem līdz n gataviem vārdiem
+    def take(self, n: int) -> List[WordData]:
+        """Atgriež līdz n sagatavotiem vārdiem un izņem tos no krājuma."""
+        with self._lock:
+            taken = self._ready[:n]
+            del self._ready[:n]
+            return taken
+
+    #sagatavoto vārdu skaits
+    def ready_count(self) -> int:
+        with self._lock:
+            return len(self._ready)
+
+    #fona pavediena cikls: iegūst vārdus nelielos soļos, līdz krājums pilns, budžets iztērēts vai darbs atcelts
+    def _run(self, cancel: threading.Event) -> None:
+        try:
+            self._fill(cancel)
+        finally:
+            with self._lock:
+                if cancel is self._cancel:
+                    self._running = False
+
+    def _fill(self, cancel: threading.Event) -> None:
+        service = self.service or get_shared_service()
+        while not cancel.is_set():
+            with self._lock:
+                needed = min(self._missing_words(), FILL_STEP)
+                if not needed:
+                    #pavediens beidzas slēdzenes iekšienē, lai start() nepalaistu garām jaunu mērķi
+                    if cancel is self._cancel:
+                        self._running = False
+                    return
+                #izvēle notiek slēdzenes iekšienē, lai divi pavedieni vienlaikus neizvēlētos vienu un to pašu vārdu
+                exclude = [data.word for data in self._ready]
+                exclude.extend(self._in_flight)
+                try:
+                    words = service.get_random_words(needed, exclude=exclude)
+                except ValueError as e:
+                    logger.warning("Word pool stopped: %s", e)
+                    return
+                self._in_flight.update(words)
+
+            try:
+                #neiekešotie vārdi tiek pieprasīti grupās pa QUERY_BATCH_SIZE
+                misses = sum(1 for word in words if not service.cache.contains(word))
+                requests = math.ceil(misses / QUERY_BATCH_SIZE)
+                with self._lock:
+                    if self._requests + requests > self.max_requests:
+                        logger.warning("Word pool request budget (%d) used up", self.max_requests)
+                        return
+                    self._requests += requests
+
+                try:
+                    results = service.get_words_data_sync(words, max_workers=self.max_workers)
+                except Exception as e:
+                    logger.warning("Word pool fetch failed: %s", e)
+                    return
+
+                #jau iegūtie vārdi tiek paturēti arī tad, ja darbs pa to laiku atcelts
+                with self._lock:
+                    self._ready.extend(data for data in results if data)
+            finally:
+                with self._lock:
+                    self._in_flight.difference_update(words)
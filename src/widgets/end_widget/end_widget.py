@@ -1,11 +1,11 @@
 import logging
 import pathlib
-from PyQt6 import uic
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import (
     QGroupBox,
     QMessageBox,
 )
+from src.helpers.ui_loader import load_ui
 
 logger = logging.getLogger(__name__)
 
@@ -13,24 +13,27 @@ class EndWidget(QGroupBox):
     exit_game_signal = pyqtSignal()
     restart_game_signal = pyqtSignal()
 
-    def __init__(self, score: int, max_score: int, correct_words=None, incorrect_words=None, parent=None):
+    def __init__(self, score: int = 0, max_score: int = 0, correct_words=None, incorrect_words=None, parent=None):
         super().__init__(parent)
         self.setWindowTitle("RootRoulette")
 
         ui_path = pathlib.Path(__file__).parent / "EndWidget.ui"
-        uic.loadUi(ui_path, self)
+        load_ui(self, ui_path)
 
         logger.info("EndWidget UI loaded from %s", ui_path)
 
+        self.reset(score, max_score, correct_words, incorrect_words)
+        self.connect_signals()
+
+    def reset(self, score: int, max_score: int, correct_words=None, incorrect_words=None):
         self.score = score
         self.max_score = max_score
         self.correct_words = correct_words or []
         self.incorrect_words = incorrect_words or []
 
-        print(self.correct_words, self.incorrect_words)
+        logger.debug("Correct words: %s, incorrect words: %s", self.correct_words, self.incorrect_words)
 
         self.setup_ui()
-        self.connect_signals()
 
     def setup_ui(self):
         self.finalscore_label.setText(f"{self.score}/{self.max_score}")
@@ -1,42 +1,59 @@
 import logging
 import pathlib
 import random
-from PyQt6 import uic
+import time
 from PyQt6.QtCore import pyqtSignal, QThread, pyqtSlot, QObject
 from PyQt6.QtWidgets import (
     QGroupBox,
     QMessageBox, QPushButton,
 )
 
-from src.services.etymology_service import EtymologyService, WordData
+from src.helpers import metrics
+from src.helpers.ui_loader import load_ui
+from src.services.etymology_service import DEFAULT_FETCH_WORKERS, WordData, get_shared_service
+from src.services.game_session import GameSession
 
 logger = logging.getLogger(__name__)
 
 class WordLoaderWorker(QObject):
+    word_loaded = pyqtSignal(object)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
-    def __init__(self, total_rounds: int):
+    def __init__(self, total_rounds: int, max_workers: int = DEFAULT_FETCH_WORKERS, exclude: list[str] | None = None):
         super().__init__()
         self.total_rounds = total_rounds
-        self.service = EtymologyService()
+        self.max_workers = max_workers
+        self.exclude = exclude or []
+        self.service = get_shared_service()
+        # set from the GUI thread when the game this worker loads for is abandoned
+        self.cancelled = False
+        self.started = 0.0
+
+    def on_result(self, index: int, data: WordData):
+        # time from the start of loading until this word could be played
+        metrics.observe("loader.word", (time.perf_counter() - self.started) * 1000)
+        metrics.increment("loader.words")
+        if not self.cancelled:
+            self.word_loaded.emit(data)
 
     def run(self):
-        words = []
-        seen = set()
-
+        self.started = time.perf_counter()
         try:
-            while len(words) < self.total_rounds:
-                word = self.service.get_random_word()
-                if not word or word in seen:
-                    continue
-                data = self.service.get_word_data_sync(word)
-                if not data:
-                    continue
-                seen.add(word)
-                words.append(data)
-            self.finished.emit(words)
+            chosen = self.service.get_random_words(self.total_rounds, exclude=self.exclude)
+            if QThread.currentThread().isInterruptionRequested():
+                # the window is closing; finishing without fetching lets the thread quit right away
+                self.finished.emit([])
+                return
+            words = self.service.get_words_data_sync(
+                chosen,
+                max_workers=self.max_workers,
+                on_result=self.on_result,
+            )
+            metrics.observe("loader.run", (time.perf_counter() - self.started) * 1000)
+            self.finished.emit([data for data in words if data])
         except Exception as e:
+            metrics.increment("loader.errors")
             self.error.emit(str(e))
 
 class GameWidget(QGroupBox):
@@ -46,18 +63,13 @@ class GameWidget(QGroupBox):
         self.setWindowTitle("RootRoulette")
 
         ui_path = pathlib.Path(__file__).parent / "GameWidget.ui"
-        uic.loadUi(ui_path, self)
+        load_ui(self, ui_path)
         logger.info("GameWidget UI loaded from %s", ui_path)
 
-        self.total_rounds = total_rounds
-        self.current_round = 0
-        self.score = 0
-
-        self.word_pool: list[WordData] = []
-        self.current_word_data: WordData | None = None
-
-        self.correct_words = []
-        self.incorrect_words = []
+        self.loader_thread: QThread | None = None
+        self.worker: WordLoaderWorker | None = None
+        # threads of abandoned games are kept referenced until they have actually stopped
+        self.retired_threads: list[QThread] = []
 
         self.language_buttons: list[QPushButton] = [
             self.lg_Button_1,
@@ -66,8 +78,19 @@ class GameWidget(QGroupBox):
             self.lg_Button_4,
         ]
 
+        self.reset_state(total_rounds, None)
         self.setup_ui()
         self.connect_signals()
+
+    def reset_state(self, total_rounds: int, pool: list[WordData] | None):
+        # rounds, scoring and the word queue live in the UI-free session
+        self.session = GameSession(total_rounds, pool)
+
+    def reset(self, total_rounds: int, pool: list[WordData] | None = None):
+        """Starts a new game on this screen, reusing the widgets instead of building a new screen."""
+        self.stop_loading()
+        self.reset_state(total_rounds, pool)
+        self.setup_ui()
         self.prefetch_words()
 
     def setup_ui(self):
@@ -79,30 +102,98 @@ class GameWidget(QGroupBox):
 
         for btn in self.language_buttons:
             btn.setEnabled(False)
+            btn.setText("")
+            btn.setStyleSheet("")
 
     def update_progress_label(self):
-        self.progress_label.setText(
-        f"{self.current_round} spins out of {self.total_rounds}"
-        )
+        session = self.session
+        text = f"{session.current_round} spins out of {session.total_rounds}"
+        if not session.loading_done:
+            text += f" (loaded {session.loaded_count}/{session.total_rounds})"
+        self.progress_label.setText(text)
 
     def prefetch_words(self):
-        self.thread = QThread()
-        self.worker = WordLoaderWorker(self.total_rounds)
+        remaining = self.session.words_needed()
+        if remaining <= 0:
+            self.session.finish_loading()
+            self.update_progress_label()
+            self.start_round()
+            return
 
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
+        self.loader_thread = QThread()
+        self.worker = WordLoaderWorker(remaining, exclude=self.session.queued_words())
+
+        self.worker.moveToThread(self.loader_thread)
+        self.loader_thread.started.connect(self.worker.run)
+        self.worker.word_loaded.connect(self.on_word_loaded)
         self.worker.finished.connect(self.on_words_loaded)
         self.worker.error.connect(self.on_loading_error)
 
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-
-        self.thread.start()
+        for done in (self.worker.finished, self.worker.error):
+            done.connect(self.loader_thread.quit)
+            done.connect(self.worker.deleteLater)
+        self.loader_thread.finished.connect(self.loader_thread.deleteLater)
+        self.loader_thread.finished.connect(self.forget_thread)
+
+        self.loader_thread.start()
+
+        if self.session.word_queue:
+            self.start_round()
+
+    def stop_loading(self, wait: bool = False):
+        """Detaches the current loader from this screen; its thread quits on its own once the fetch returns.
+
+        With wait=True every loader thread is asked to stop and waited for, so Qt never destroys a running thread.
+        """
+        if self.worker is not None:
+            self.worker.cancelled = True
+            try:
+                self.worker.word_loaded.disconnect(self.on_word_loaded)
+                self.worker.finished.disconnect(self.on_words_loaded)
+                self.worker.error.disconnect(self.on_loading_error)
+            except (RuntimeError, TypeError):
+                # the worker already finished and was deleted by Qt
+                pass
+            self.worker = None
+
+        if self.loader_thread is not None:
+            self.retired_threads.append(self.loader_thread)
+            self.loader_thread = None
+
+        if wait:
+            for thread in list(self.retired_threads):
+                try:
+                    thread.requestInterruption()
+                    # the queued quit from the worker can't be delivered while this thread is blocked in wait(),
+                    # so the thread is told to quit directly; it stops as soon as the worker returns
+                    # (a fetch already in progress is bounded by the request timeouts and the circuit breaker)
+                    thread.quit()
+                    thread.wait()
+                except RuntimeError:
+                    # the thread already finished and was deleted by Qt
+                    pass
+            self.retired_threads.clear()
+
+    def forget_thread(self):
+        thread = self.sender()
+        if thread is self.loader_thread:
+            self.loader_thread = None
+            self.worker = None
+        elif thread in self.retired_threads:
+            self.retired_threads.remove(thread)
+
+    def on_word_loaded(self, data: WordData):
+        # the first word starts the game; later words release a player who caught up with the loader
+        start = self.session.add_word(data)
+        self.update_progress_label()
+        if start:
+            self.start_round()
 
     def on_words_loaded(self, words: list[WordData]):
-        self.word_pool = words
-        self.start_round()
+        waiting = self.session.finish_loading()
+        self.update_progress_label()
+        if waiting:
+            self.start_round()
 
     def on_loading_error(self, message: str):
         QMessageBox.critical(self, "Loading Error", message)
@@ -116,21 +207,22 @@ class GameWidget(QGroupBox):
         self.more_button.clicked.connect(self.show_explanation)
 
     def start_round(self):
-        if self.current_round >= self.total_rounds:
+        word_data = self.session.next_round()
+        if self.session.finished:
+            # total_rounds shrinks when the loader delivered fewer words than rounds
+            self.update_score_label()
             self.switch_to_end_widget()
             return
 
-        self.current_word_data = self.word_pool[self.current_round]
-        self.current_round += 1
-        self.update_progress_label()
-
-        self.word_label.setText(self.current_word_data.word.title())
+        if word_data is None:
+            self.word_label.setText("Loading words…")
+            self.next_button.setEnabled(False)
+            return
 
-        options = EtymologyService().get_language_options(
-            self.current_word_data.correct_language
-        )
+        self.update_progress_label()
+        self.word_label.setText(word_data.word.title())
 
-        for btn, lang in zip(self.language_buttons, options):
+        for btn, lang in zip(self.language_buttons, self.session.options):
             btn.setText(lang)
             btn.setEnabled(True)
             btn.setStyleSheet("")
@@ -140,8 +232,9 @@ class GameWidget(QGroupBox):
 
     def handle_guess(self):
         clicked = self.sender()
-        chosen = clicked.text()
-        correct = self.current_word_data.correct_language
+        if self.session.answered:
+            return
+        correct = self.session.current_word.correct_language
 
         for btn in self.language_buttons:
             btn.setEnabled(False)
@@ -150,30 +243,27 @@ class GameWidget(QGroupBox):
             elif btn is clicked:
                 btn.setStyleSheet("background-color: red; color: white;")
 
-        if chosen == correct:
-            self.score += 1
-            self.correct_words.append(self.current_word_data.word)
-        else:
-            self.incorrect_words.append(self.current_word_data.word)
-
+        self.session.guess(clicked.text())
         self.update_score_label()
         self.next_button.setEnabled(True)
         self.more_button.setEnabled(True)
 
     def show_explanation(self):
-        if self.current_word_data:
-            explanation = f"Correct Answer: {self.current_word_data.correct_language}\n\n"
-            explanation += self.current_word_data.etymology_text
+        word_data = self.session.current_word
+        if word_data:
+            explanation = f"Correct Answer: {word_data.correct_language}\n\n"
+            explanation += word_data.etymology_text
             
             QMessageBox.information(
                 self,
-                f"Etymology of '{self.current_word_data.word.title()}'",
+                f"Etymology of '{word_data.word.title()}'",
                 explanation
             )
     def update_score_label(self):
-        self.score_label.setText(f"{self.score}/{self.total_rounds}")
+        self.score_label.setText(f"{self.session.score}/{self.session.total_rounds}")
 
     def switch_to_end_widget(self):
-        logger.info("Game finished with score %s/%s", self.score, self.total_rounds)
-        self.game_finished_signal.emit(self.score, self.total_rounds, self.correct_words, self.incorrect_words)
+        result = self.session.result()
+        logger.info("Game finished with score %s/%s", result.score, result.total_rounds)
+        self.game_finished_signal.emit(result.score, result.total_rounds, result.correct_words, result.incorrect_words)
 
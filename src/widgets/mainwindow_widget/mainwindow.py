@@ -1,17 +1,15 @@
 import json
 import logging
 import pathlib
-from PyQt6 import uic
 from PyQt6.QtCore import QSettings
 from PyQt6.QtWidgets import QMainWindow, QDialog, QApplication, QStackedWidget
-from src.helpers.palette import dump_palette
+from src.helpers.ui_loader import load_ui
+from src.helpers.palette import apply_saved_theme, dump_palette
+from src.services.word_pool import DEFAULT_POOL_SIZE, WordPoolPrefetcher
 
 logger = logging.getLogger(__name__)
 
 from src.widgets.start_widget.start_widget import StartWidget
-from src.widgets.game_widget.game_widget import GameWidget
-from src.widgets.end_widget.end_widget import EndWidget
-from src.widgets.theme_widget.widget_theme_dialog import ThemeDialogWidget , apply_saved_theme
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -19,10 +17,11 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("RootRoulette")
 
         ui_path = pathlib.Path(__file__).parent / "Mainwindow.ui"
-        uic.loadUi(ui_path, self)
+        load_ui(self, ui_path)
 
         logger.info("MainWindow UI loaded from %s", ui_path)
         self.settings = QSettings("RootRoulette", "RootRouletteApp")
+        self.word_pool = WordPoolPrefetcher()
         self.setup_ui()
         self.setup_connections()
 
@@ -36,53 +35,75 @@ class MainWindow(QMainWindow):
         
         self.stacked_widget = QStackedWidget()
         self.main_layout.addWidget(self.stacked_widget)
-        
+
+        self.setup_navigation()
         self.show_start_widget()
 
     def open_theme_dialog(self):
+        # the dialog class (and its generated UI module) is only needed once the menu is used
+        from src.widgets.theme_widget.widget_theme_dialog import ThemeDialogWidget
+
         theme_dialog = ThemeDialogWidget(self)
         if theme_dialog.exec():
             apply_saved_theme()
 
 
     def setup_connections(self):
-        pass
+        self.start_widget.start_game_signal.connect(self.show_game_widget)
+        self.start_widget.rounds_selected_signal.connect(self.word_pool.resize)
+        self.start_widget.exit_game_signal.connect(self.close)
     
     def setup_navigation(self):
-        self.start_widget = None
+        # only the first screen is built at startup; the game and end screens are built on first
+        # visit and then kept in the stack and reset instead of being rebuilt from the .ui files
+        self.start_widget = StartWidget()
+        self.stacked_widget.addWidget(self.start_widget)
         self.game_widget = None
         self.end_widget = None
+
+    def get_game_widget(self):
+        if self.game_widget is None:
+            from src.widgets.game_widget.game_widget import GameWidget
+
+            self.game_widget = GameWidget()
+            self.game_widget.game_finished_signal.connect(self.show_end_widget)
+            self.stacked_widget.addWidget(self.game_widget)
+        return self.game_widget
+
+    def get_end_widget(self):
+        if self.end_widget is None:
+            from src.widgets.end_widget.end_widget import EndWidget
+
+            self.end_widget = EndWidget()
+            self.end_widget.restart_game_signal.connect(self.show_start_widget)
+            self.end_widget.exit_game_signal.connect(self.close)
+            self.stacked_widget.addWidget(self.end_widget)
+        return self.end_widget
     
     def show_start_widget(self):
         logger.info("Showing start widget")
-        last_result = self.get_last_result()
-        self.start_widget = StartWidget(last_result=last_result)
-        self.start_widget.start_game_signal.connect(self.show_game_widget)
-        self.start_widget.exit_game_signal.connect(self.close)
-        self.clear_stacked_widget()
-        self.stacked_widget.addWidget(self.start_widget)
+        self.start_widget.reset(self.get_last_result())
+        self.word_pool.start(DEFAULT_POOL_SIZE)
         self.stacked_widget.setCurrentWidget(self.start_widget)
     
     def show_game_widget(self, rounds):
         logger.info("Showing game widget with %s rounds", rounds)
-        
-        self.game_widget = GameWidget(rounds)
-        self.game_widget.game_finished_signal.connect(self.show_end_widget)
-        
-        self.clear_stacked_widget()
-        self.stacked_widget.addWidget(self.game_widget)
-        self.stacked_widget.setCurrentWidget(self.game_widget)
+
+        # the game loads whatever the pool is missing itself, so the pool stops competing for requests
+        self.word_pool.cancel()
+        pool = self.word_pool.take(rounds)
+        logger.info("Starting game with %s/%s prefetched words", len(pool), rounds)
+        game_widget = self.get_game_widget()
+        game_widget.reset(rounds, pool=pool)
+        self.stacked_widget.setCurrentWidget(game_widget)
     
     def show_end_widget(self, score, max_score, correct_words: list, incorrect_words: list):
         logger.info("Showing end widget with score %s/%s", score, max_score)
         self.settings.setValue("last_result", json.dumps({"score": score, "max_score": max_score}))
-        self.end_widget = EndWidget(score, max_score, correct_words, incorrect_words)
-        self.end_widget.restart_game_signal.connect(self.show_start_widget)
-        self.end_widget.exit_game_signal.connect(self.close)
-        
-        self.clear_stacked_widget()
-        self.stacked_widget.addWidget(self.end_widget)
-        self.stacked_widget.setCurrentWidget(self.end_widget)
+        end_widget = self.get_end_widget()
+        end_widget.reset(score, max_score, correct_words, incorrect_words)
+        self.word_pool.start(DEFAULT_POOL_SIZE)
+        self.stacked_widget.setCurrentWidget(end_widget)
     
     def get_last_result(self):
         val = self.settings.value("last_result", "")
@@ -93,11 +114,8 @@ class MainWindow(QMainWindow):
                 return None
         return None
 
-    def clear_stacked_widget(self):
-        while self.stacked_widget.count():
-            widget = self.stacked_widget.widget(0)
-            self.stacked_widget.removeWidget(widget)
-            if widget:
-                widget.deleteLater()
-
-
+    def closeEvent(self, event):
+        self.word_pool.cancel()
+        if self.game_widget is not None:
+            self.game_widget.stop_loading(wait=True)
+        super().closeEvent(event)
@@ -2,7 +2,6 @@ import logging
 import pathlib
 import json
 import random
-from PyQt6 import uic
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
@@ -10,17 +9,19 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QLabel,
 )
+from src.helpers.ui_loader import load_ui
 
 logger = logging.getLogger(__name__)
 
 class StartWidget(QGroupBox):
     start_game_signal = pyqtSignal(int)
+    rounds_selected_signal = pyqtSignal(int)
     exit_game_signal = pyqtSignal()
     def __init__(self, parent=None, last_result=None):
         super().__init__(parent)
 
         ui_path = pathlib.Path(__file__).parent / "StartWidget.ui"
-        uic.loadUi(ui_path, self)
+        load_ui(self, ui_path)
 
         self.setWindowTitle("RootRoulette")
 
@@ -37,16 +38,34 @@ class StartWidget(QGroupBox):
         self.greeting_label.setFont(font)
 
         self.layout().insertWidget(0, self.greeting_label)
+        self.greetings = self.load_greetings()
         self.setup_ui()
         self.connect_signals()
         self.set_greeting(last_result)
 
-    def set_greeting(self, last_result):
+    # greetings.json is read once; an empty dict falls back to the built-in greetings
+    def load_greetings(self):
+        base_dir = pathlib.Path(__file__).resolve().parent.parent.parent.parent
+        greetings_path = base_dir / "greetings.json"
         try:
-            base_dir = pathlib.Path(__file__).resolve().parent.parent.parent.parent
-            greetings_path = base_dir / "greetings.json"
             with open(greetings_path, 'r', encoding='utf-8') as f:
-                greetings = json.load(f)
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to load greetings: {e}")
+            return {}
+
+    def reset(self, last_result=None):
+        """Prepares the screen for another visit: fresh greeting and no rounds chosen."""
+        self.selected_rounds = None
+        self.choose_drop.blockSignals(True)
+        self.choose_drop.setCurrentIndex(0)
+        self.choose_drop.blockSignals(False)
+        self.play_button.setEnabled(False)
+        self.set_greeting(last_result)
+
+    def set_greeting(self, last_result):
+        try:
+            greetings = self.greetings
             if not last_result:
                 greeting = random.choice(greetings["first_time"])
                 self.greeting_label.setText(greeting)
@@ -71,7 +90,7 @@ class StartWidget(QGroupBox):
             greeting = greeting_template.format(score=score, max_score=max_score)
             self.greeting_label.setText(greeting)
             
-        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+        except KeyError as e:
             logger.warning(f"Failed to load greetings: {e}")
             if not last_result:
                 self.greeting_label.setText("Welcome to RootRoulette!")
@@ -121,6 +140,7 @@ class StartWidget(QGroupBox):
 
         self.selected_rounds = int(self.choose_drop.currentText())
         logger.info("Number of rounds selected: %s", self.selected_rounds)
+        self.rounds_selected_signal.emit(self.selected_rounds)
         self.play_button.setEnabled(True)
 
     def start_game(self):